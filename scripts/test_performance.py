@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Test Performance Helpers
+
+Covers the caches, request coalescing, rate limiting and packaging code
+that sit in front of the providers, MCP servers and Streamlit apps. No
+API keys or network access are needed.
+
+Usage:
+    python scripts/test_performance.py
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+_script_dir = Path(__file__).parent
+_project_dir = _script_dir.parent
+_src_dir = _project_dir / "src"
+sys.path.insert(0, str(_src_dir))
+
+
+def test_inflight_owner_cancelled():
+    """A caller sharing a generation runs its own when the owner is cancelled."""
+    print("=" * 60)
+    print("Testing Comparison In-Flight Dedup")
+    print("=" * 60)
+
+    import comparison.app as app
+
+    class Model:
+        model_id = "test-model"
+        display_name = "Test Model"
+
+    runs = []
+
+    async def fake_run(*args):
+        runs.append(args)
+        return "own result"
+
+    params = dict(
+        provider_name="kling", model=Model(), generation_type="t2v", prompt="p",
+        duration_range=(5, 5), resolution="720p", aspect_ratio="16:9", provider=object(),
+    )
+    key = app._dedup_key("kling", Model.model_id, "t2v", "p", 5, "720p", "16:9", None, "std")
+
+    saved = app._run_generation, app.get_model_duration_in_range
+    app._run_generation = fake_run
+    app.get_model_duration_in_range = lambda model, duration_range: 5
+    try:
+        async def owner_cancelled():
+            owner = concurrent.futures.Future()
+            app._INFLIGHT[key] = owner
+            waiter = asyncio.create_task(app.generate_video_async(**params))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            return await waiter
+
+        assert asyncio.run(owner_cancelled()) == "own result"
+        assert len(runs) == 1
+        print("✓ Waiter generates its own copy after owner cancellation")
+
+        async def waiter_cancelled():
+            owner = concurrent.futures.Future()
+            app._INFLIGHT[key] = owner
+            waiter = asyncio.create_task(app.generate_video_async(**params))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                return owner.cancelled()
+            raise AssertionError("waiter cancellation was swallowed")
+
+        assert asyncio.run(waiter_cancelled()) is False
+        assert len(runs) == 1
+        print("✓ Waiter's own cancellation propagates")
+    finally:
+        app._run_generation, app.get_model_duration_in_range = saved
+        app._INFLIGHT.pop(key, None)
+
+    print("\nComparison In-Flight Dedup: PASSED")
+    return True
+
+
+def test_terminal_task_cache():
+    """Finished tasks are served from memory until their TTL, then re-queried."""
+    print("=" * 60)
+    print("Testing Terminal Task Cache")
+    print("=" * 60)
+
+    from providers.base import TaskStatus, VideoTask, _TerminalTaskCache
+
+    cache = _TerminalTaskCache(maxsize=2, ttl=0.05)
+    task = VideoTask(task_id="t1", provider="hailuo", status=TaskStatus.COMPLETED,
+                     video_url="https://example.com/v.mp4")
+    cache.put(("hailuo", "t1"), task)
+
+    cached = cache.get(("hailuo", "t1"))
+    assert cached is not None and cached.video_url == task.video_url
+    assert cached is not task
+    print("✓ Cached task returned as a copy")
+
+    time.sleep(0.06)
+    assert cache.get(("hailuo", "t1")) is None
+    print("✓ Entry expires after its TTL")
+
+    cache.ttl = 60
+    for i in range(3):
+        cache.put(("hailuo", f"lru{i}"), VideoTask(task_id=f"lru{i}", provider="hailuo"))
+    assert cache.get(("hailuo", "lru0")) is None
+    assert cache.get(("hailuo", "lru2")) is not None
+    print("✓ Least recently used entry evicted when full")
+
+    print("\nTerminal Task Cache: PASSED")
+    return True
+
+
+def test_long_poll_wait():
+    """Wait loops skip their sleep only when the server actually held the query."""
+    print("=" * 60)
+    print("Testing Long-Poll Wait Loops")
+    print("=" * 60)
+
+    from providers.base import TaskStatus, VideoProvider, VideoTask
+    from providers.config import ProviderConfig
+
+    class FakeProvider(VideoProvider):
+        def __init__(self, honour_wait: bool):
+            super().__init__()
+            self._name = f"fake-long-poll-{honour_wait}"
+            self._config = ProviderConfig(long_poll_seconds=1)
+            self.honour_wait = honour_wait
+            self.waits = []
+
+        def submit_text_to_video(self, prompt, duration=None, resolution=None, **kwargs):
+            raise NotImplementedError
+
+        def submit_image_to_video(self, image_url, prompt=None, duration=None, resolution=None, **kwargs):
+            raise NotImplementedError
+
+        def get_task_status(self, task_id, long_poll_seconds=0):
+            self.waits.append(long_poll_seconds)
+            if self.honour_wait and long_poll_seconds:
+                time.sleep(long_poll_seconds)
+            done = len(self.waits) >= 3
+            return VideoTask(task_id=task_id, provider=self._name,
+                             status=TaskStatus.COMPLETED if done else TaskStatus.PROCESSING)
+
+    provider = FakeProvider(honour_wait=True)
+    started = time.monotonic()
+    task = provider.wait_for_completion("lp-held", timeout=30, poll_interval=5)
+    assert task.status == TaskStatus.COMPLETED
+    assert provider.waits == [1, 1, 1]
+    # Three held queries and no 5s client-side sleeps in between
+    assert time.monotonic() - started < 5
+    print("✓ Held queries replace the client-side sleep")
+
+    provider = FakeProvider(honour_wait=False)
+    try:
+        provider.wait_for_completion("lp-ignored", timeout=1.5, poll_interval=0.6)
+    except TimeoutError:
+        pass
+    assert len(provider.waits) <= 3
+    print("✓ A server that ignores the wait falls back to backoff, not a tight loop")
+
+    print("\nLong-Poll Wait Loops: PASSED")
+    return True
+
+
+def test_read_cache_write_race():
+    """A cached read that overlaps a write doesn't store its pre-write result."""
+    print("=" * 60)
+    print("Testing MCP Read Cache")
+    print("=" * 60)
+
+    import threading
+    from mcp_servers._read_cache import cached_read, invalidates_reads, read_cache
+
+    store = {"value": "old"}
+    read_started = threading.Event()
+    write_done = threading.Event()
+
+    @cached_read
+    def slow_read(key: str) -> str:
+        value = store["value"]
+        read_started.set()
+        write_done.wait(5)
+        return value
+
+    @invalidates_reads
+    def write(value: str):
+        store["value"] = value
+
+    read_cache.clear()
+    reader = threading.Thread(target=lambda: slow_read("k"))
+    reader.start()
+    read_started.wait(5)
+    write("new")
+    write_done.set()
+    reader.join(5)
+
+    assert slow_read("k") == "new"
+    print("✓ Read overlapping a write is not cached")
+
+    assert slow_read("k") == "new"
+    store["value"] = "changed behind the cache"
+    assert slow_read("k") == "new"
+    print("✓ Reads without a concurrent write are cached")
+
+    read_cache.clear()
+    print("\nMCP Read Cache: PASSED")
+    return True
+
+
+def test_token_bucket():
+    """Submissions beyond the burst are paced to the bucket's rate."""
+    print("=" * 60)
+    print("Testing Submission Rate Limiter")
+    print("=" * 60)
+
+    from concurrent.futures import ThreadPoolExecutor
+    from providers.ratelimit import TokenBucket, get_bucket
+
+    bucket = TokenBucket(rate=20, capacity=2)
+    started = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert time.monotonic() - started < 0.02
+    print("✓ Burst passes without waiting")
+
+    bucket.acquire()
+    bucket.acquire()
+    elapsed = time.monotonic() - started
+    assert 0.08 <= elapsed < 0.5, elapsed
+    print(f"✓ Next two acquisitions paced at the rate ({elapsed:.3f}s)")
+
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(5)))
+    elapsed = time.monotonic() - started
+    assert 0.07 <= elapsed < 0.5, elapsed
+    print(f"✓ Concurrent callers queue instead of all waiting once ({elapsed:.3f}s)")
+
+    first = get_bucket("test-bucket", 5, 2)
+    assert get_bucket("test-bucket", 5, 2) is first
+    assert get_bucket("test-bucket", 10, 2) is not first
+    print("✓ get_bucket shares a bucket per provider and replaces it on new limits")
+
+    print("\nSubmission Rate Limiter: PASSED")
+    return True
+
+
+def test_checked_db_writes():
+    """Writes with folded-in existence checks create rows only under existing parents."""
+    print("=" * 60)
+    print("Testing Checked Database Writes")
+    print("=" * 60)
+
+    from story_generator.database import Database
+    from story_generator.models import Character, Episode, Project, Shot
+
+    db = Database(":memory:")
+    project_id = db.create_project(Project(name="Checked", description="Test", genre="drama"))
+
+    character = Character(project_id=project_id, name="Lin")
+    char_id = db.create_character_checked(character)
+    assert char_id is not None and character.id == char_id
+    assert db.get_character(char_id).name == "Lin"
+    assert db.create_character_checked(Character(project_id=9999, name="Ghost")) is None
+    print("✓ create_character_checked")
+
+    episode = Episode(project_id=project_id, episode_number=1, title="Pilot", outline="", duration=30)
+    episode_id = db.create_episode_checked(episode)
+    assert episode_id is not None and db.get_episode(episode_id).title == "Pilot"
+    assert db.create_episode_checked(
+        Episode(project_id=9999, episode_number=1, title="Lost", outline="", duration=30)
+    ) is None
+    print("✓ create_episode_checked")
+
+    shot = Shot(episode_id=episode_id, scene_number=1, shot_number=1, shot_type="wide",
+                duration=5, visual_description="Skyline", camera_movement="static")
+    shot_id = db.create_shot_checked(shot)
+    assert shot_id is not None and db.get_shot(shot_id).visual_description == "Skyline"
+    assert db.create_shot_checked(
+        Shot(episode_id=9999, scene_number=1, shot_number=1, shot_type="wide",
+             duration=5, visual_description="Nowhere", camera_movement="static")
+    ) is None
+    print("✓ create_shot_checked")
+
+    other_episode_id = db.create_episode_checked(
+        Episode(project_id=project_id, episode_number=2, title="Second", outline="", duration=30)
+    )
+    other_shot_id = db.create_shot_checked(
+        Shot(episode_id=other_episode_id, scene_number=1, shot_number=1, shot_type="wide",
+             duration=5, visual_description="Harbour", camera_movement="static")
+    )
+
+    assert db.delete_shots_by_episode_checked(9999) is False
+    assert db.get_shot(shot_id) is not None
+    assert db.delete_shots_by_episode_checked(episode_id) is True
+    assert db.get_shot(shot_id) is None
+    assert db.get_shot(other_shot_id) is not None
+    print("✓ delete_shots_by_episode_checked")
+
+    db.close()
+    print("\nChecked Database Writes: PASSED")
+    return True
+
+
+def test_build_zip_sendfile():
+    """Archives mixing sendfile-copied and zipfile-written entries read back intact."""
+    print("=" * 60)
+    print("Testing Bulk Download ZIP")
+    print("=" * 60)
+
+    import os
+    import tempfile
+    import zipfile
+    from comparison import packaging
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, size in (("large.mp4", 3 << 20), ("small.mp4", 1000), ("odd.mp4", (1 << 20) + 7)):
+            path = os.path.join(tmp, name)
+            with open(path, "wb") as f:
+                f.write(os.urandom(size))
+            paths.append(path)
+
+        saved = packaging.SENDFILE_MIN_SIZE
+        packaging.SENDFILE_MIN_SIZE = 1 << 20  # route the two larger files through sendfile
+        try:
+            out = packaging.build_zip(paths, os.path.join(tmp, "videos.zip"))
+        finally:
+            packaging.SENDFILE_MIN_SIZE = saved
+
+        with zipfile.ZipFile(out) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == [os.path.basename(p) for p in paths]
+            for path in paths:
+                with open(path, "rb") as f:
+                    assert zf.read(os.path.basename(path)) == f.read()
+    print(f"✓ Round trip through sendfile entries (Python {sys.version.split()[0]}, "
+          f"sendfile {'used' if hasattr(os, 'sendfile') else 'unavailable'})")
+
+    print("\nBulk Download ZIP: PASSED")
+    return True
+
+
+TESTS = [
+    ("Comparison In-Flight Dedup", test_inflight_owner_cancelled),
+    ("Terminal Task Cache", test_terminal_task_cache),
+    ("Long-Poll Wait Loops", test_long_poll_wait),
+    ("MCP Read Cache", test_read_cache_write_race),
+    ("Submission Rate Limiter", test_token_bucket),
+    ("Checked Database Writes", test_checked_db_writes),
+    ("Bulk Download ZIP", test_build_zip_sendfile),
+]
+
+
+def main():
+    print("Performance Helpers Test Suite")
+    print("=" * 60)
+
+    results = []
+    for name, test in TESTS:
+        try:
+            results.append((name, test()))
+        except Exception as e:
+            import traceback
+            print(f"\n{name}: FAILED - {e}")
+            traceback.print_exc()
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    all_passed = True
+    for name, passed in results:
+        status = "PASSED" if passed else "FAILED"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print()
+    if all_passed:
+        print("All tests passed!")
+        return 0
+    else:
+        print("Some tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -44,13 +44,14 @@ class SkillValidator:
         # Storyboard server
         "create_shot", "get_shot", "update_shot", "delete_shot", "list_shots",
         "batch_create_shots", "delete_all_shots", "save_generated_prompt",
+        "batch_save_generated_prompts",
         "get_generated_prompt", "get_storyboard_summary",
         "get_shot_type_names", "get_camera_movement_names",
         # Video server
-        "list_providers", "get_provider_status",
+        "list_providers", "get_provider_status", "list_provider_statuses",
         "submit_text_to_video", "text_to_video_sync",
         "submit_image_to_video", "image_to_video_sync",
-        "get_task_status", "wait_for_task", "batch_submit_text_to_video",
+        "get_task_status", "wait_for_task", "batch_submit_text_to_video", "batch_wait_for_tasks",
     }
 
     # Known agent names
@@ -16,6 +16,7 @@ from .model_capabilities import (
     get_available_durations,
     get_available_resolutions,
     get_available_aspect_ratios,
+    get_available_options,
     check_model_compatibility,
     get_model_duration_in_range,
 )
@@ -32,6 +33,7 @@ __all__ = [
     "get_available_durations",
     "get_available_resolutions",
     "get_available_aspect_ratios",
+    "get_available_options",
     "check_model_compatibility",
     "get_model_duration_in_range",
 ]
@@ -4,16 +4,25 @@ Video Generation Comparison Tool - Streamlit App
 A tool for comparing video generation across multiple AI providers.
 """
 
+import asyncio
+import base64
+import concurrent.futures
+import hashlib
+import html
+import multiprocessing
 import os
 import sys
+import threading
 import time
-import requests
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+import aiohttp
+import pandas as pd
 import streamlit as st
 
 # Add src to path for imports
@@ -28,17 +37,37 @@ from comparison.model_capabilities import (
     get_models_by_provider,
     filter_models,
     check_model_compatibility,
-    get_available_durations,
-    get_available_resolutions,
-    get_available_aspect_ratios,
+    get_available_options,
     get_model_duration_in_range,
 )
+from comparison.packaging import build_zip
 
-from providers.kling import KlingProvider
-from providers.tongyi import TongyiProvider
-from providers.jimeng import JimengProvider
-from providers.hailuo import HailuoProvider
-from providers.base import TaskStatus
+from providers import KlingProvider, TongyiProvider, JimengProvider, HailuoProvider
+from providers.base import TaskStatus, VideoProvider, VideoTask, http_session
+
+
+# Status polling: exponential backoff from 1s, capped at 10s
+POLL_INITIAL_INTERVAL = 1.0
+POLL_MAX_INTERVAL = 10.0
+GENERATION_TIMEOUT = 600
+
+# Downloads: 1 MiB write buffers, large files split into parallel range requests
+OUTPUT_DIR = Path("comparison_output")
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_RANGE_PARTS = 4
+DOWNLOAD_RANGE_MIN_SIZE = 8 << 20
+DOWNLOAD_CONNECTIONS_PER_HOST = 8
+VIDEO_CACHE_MAX_ENTRIES = 16
+VIDEO_CACHE_MAX_BYTES = 256 << 20  # larger files are streamed from disk instead
+ZIP_POLL_SECONDS = 1.0  # how often a pending ZIP job is checked
+# Smaller videos are embedded in the grid as data URIs. Streamlit resends
+# every element on each rerun, so only tiny clips are worth inlining.
+VIDEO_INLINE_MAX_BYTES = 256 << 10
+
+# The provider -> models mapping is static, so walk MODEL_CAPABILITIES once
+PROVIDER_MODELS: Dict[str, Tuple[ModelCapability, ...]] = {
+    pid: get_models_by_provider(pid) for pid in PROVIDER_NAMES
+}
 
 
 @dataclass
@@ -55,6 +84,7 @@ class GenerationResult:
     error_message: Optional[str] = None
     task_id: Optional[str] = None
     duration_used: Optional[int] = None  # Actual duration used for this model
+    video_exists: bool = False  # video_path was written by this run; skips stat() on reruns
 
 
 # Provider instances cache
@@ -86,20 +116,212 @@ def get_provider_instances() -> Dict:
     return providers
 
 
-def download_video(url: str, filename: str) -> Optional[str]:
-    """Download video from URL and save to temp directory."""
-    try:
-        output_dir = Path("comparison_output")
-        output_dir.mkdir(exist_ok=True)
+# Providers resolved by name, so the generation path skips the Streamlit cache lookup
+_PROVIDER_CACHE: Dict[str, Optional[VideoProvider]] = {}
+
+
+def _get_provider(name: str) -> Optional[VideoProvider]:
+    """Get a provider instance by name, or None if it failed to initialize."""
+    if name not in _PROVIDER_CACHE:
+        _PROVIDER_CACHE[name] = get_provider_instances().get(name)
+    return _PROVIDER_CACHE[name]
+
+
+def _results_key(results: List[GenerationResult]) -> Tuple[tuple, ...]:
+    """Hashable snapshot of the result fields shown in the summary table."""
+    return tuple(
+        (
+            r.provider,
+            r.model_name,
+            r.success,
+            r.duration_used,
+            r.generation_time,
+            r.estimated_cost,
+            r.error_message,
+        )
+        for r in results
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _build_results_df(results_key: Tuple[tuple, ...]) -> pd.DataFrame:
+    """Build the detailed results table from a _results_key snapshot."""
+    return pd.DataFrame([
+        {
+            "Provider": PROVIDER_NAMES.get(provider, provider),
+            "Model": model_name,
+            "Status": "✅ Success" if success else "❌ Failed",
+            "Duration": f"{duration_used}s" if duration_used else "-",
+            "Gen Time (s)": f"{generation_time:.1f}",
+            "Est. Cost (¥)": f"{estimated_cost:.2f}" if success else "-",
+            "Error": error_message or "-",
+        }
+        for provider, model_name, success, duration_used, generation_time, estimated_cost, error_message
+        in results_key
+    ])
+
+
+@st.cache_data(show_spinner=False)
+def _summarize(results_key: Tuple[tuple, ...]) -> Tuple[List[int], List[int], float]:
+    """Split a _results_key snapshot in one pass: (successful indices, failed indices, total cost)."""
+    successful, failed = [], []
+    total_cost = 0.0
+    for i, (_, _, success, _, _, estimated_cost, _) in enumerate(results_key):
+        if success:
+            successful.append(i)
+            total_cost += estimated_cost
+        else:
+            failed.append(i)
+    return successful, failed, total_cost
+
+
+@st.cache_data(show_spinner=False, max_entries=VIDEO_CACHE_MAX_ENTRIES)
+def _read_video_bytes(path: str, mtime: float) -> bytes:
+    """Read a downloaded video once; mtime is part of the cache key so rewrites invalidate it."""
+    return Path(path).read_bytes()
+
+
+def _video_download_button(path: str, key: str):
+    """Render a download button for a local video without re-reading it on every rerun."""
+    stat = os.stat(path)
+    kwargs = dict(label="Download", file_name=os.path.basename(path), mime="video/mp4", key=key)
+    if stat.st_size <= VIDEO_CACHE_MAX_BYTES:
+        st.download_button(data=_read_video_bytes(path, stat.st_mtime), **kwargs)
+    else:
+        with open(path, "rb") as f:
+            st.download_button(data=f, **kwargs)
+
+
+@st.cache_resource
+def _zip_executor() -> ProcessPoolExecutor:
+    """Worker pool for packaging result videos off the script thread."""
+    # Forking the multithreaded Streamlit server can copy held locks into the child
+    return ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+
+
+@st.fragment(run_every=ZIP_POLL_SECONDS)
+def _zip_progress():
+    """Show a running ZIP job, rerunning the page once the worker finishes."""
+    job = st.session_state.zip_job
+    if job is None or job[0].done():
+        st.rerun()
+    st.status("Packaging videos...", state="running")
+
+
+def _discard_zip():
+    """Forget the current ZIP job and delete its archive once the worker is done with it."""
+    job = st.session_state.get("zip_job")
+    st.session_state.zip_job = None
+    if job is not None:
+        future, zip_name = job
+        future.add_done_callback(lambda _: Path(zip_name).unlink(missing_ok=True))
+
+
+@st.cache_data(show_spinner=False, max_entries=VIDEO_CACHE_MAX_ENTRIES)
+def _video_data_uri(path: str, mtime: float) -> str:
+    """Base64 data URI for a small local video, cached like _read_video_bytes."""
+    encoded = base64.b64encode(Path(path).read_bytes()).decode("ascii")
+    return f"data:video/mp4;base64,{encoded}"
+
+
+def _video_src(result: GenerationResult) -> Optional[str]:
+    """
+    Source usable in an HTML <video> tag, or None if st.video must serve it.
+
+    Small local files are inlined so the browser needs no media-file
+    round-trip; remote results use their URL directly.
+    """
+    if result.video_path and result.video_exists:
+        stat = os.stat(result.video_path)
+        if stat.st_size <= VIDEO_INLINE_MAX_BYTES:
+            return _video_data_uri(result.video_path, stat.st_mtime)
+        return None
+    return result.video_url
+
+
+def _result_cell_html(result: GenerationResult, video_src: Optional[str]) -> str:
+    """HTML for one cell of the comparison grid; the video is omitted when video_src is None."""
+    video = f'<video controls preload="metadata" src="{html.escape(video_src)}" style="width:100%"></video>' if video_src else ""
+    return (
+        f"<strong>{html.escape(PROVIDER_NAMES.get(result.provider, result.provider))}</strong><br>"
+        f"<em>{html.escape(result.model_name)}</em>"
+        f"{video}"
+        f"<ul>"
+        f"<li><strong>Duration:</strong> {result.duration_used}s</li>"
+        f"<li><strong>Gen Time:</strong> {result.generation_time:.1f}s</li>"
+        f"<li><strong>Est. Cost:</strong> ¥{result.estimated_cost:.2f}</li>"
+        f"</ul>"
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _preview_bytes(url: str) -> bytes:
+    """Fetch the input image once so reruns don't download it again."""
+    response = http_session(url).get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+@st.cache_data(show_spinner=False)
+def _cached_filter(
+    generation_type: GenerationType,
+    duration_range: Tuple[int, int],
+    resolution: str,
+    aspect_ratio: Optional[str],
+) -> List[ModelCapability]:
+    """Cached filter_models for the sidebar parameters."""
+    return filter_models(
+        generation_type=generation_type,
+        duration_range=duration_range,
+        resolution=resolution,
+        aspect_ratio=aspect_ratio,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _cached_compat(
+    provider: str,
+    model_id: str,
+    generation_type: GenerationType,
+    duration_range: Tuple[int, int],
+    resolution: str,
+    aspect_ratio: Optional[str],
+) -> Tuple[bool, str]:
+    """Cached check_model_compatibility, keyed by model ID rather than the model object."""
+    return check_model_compatibility(
+        MODEL_CAPABILITIES[provider][model_id],
+        generation_type=generation_type,
+        duration_range=duration_range,
+        resolution=resolution,
+        aspect_ratio=aspect_ratio,
+    )
+
+
+def create_download_session() -> aiohttp.ClientSession:
+    """Create an HTTP session for video downloads."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=DOWNLOAD_CONNECTIONS_PER_HOST),
+        timeout=aiohttp.ClientTimeout(total=None, connect=60, sock_read=60),
+    )
+
 
-        output_path = output_dir / filename
+def _output_path(filename: str) -> Path:
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    return OUTPUT_DIR / filename
 
-        response = requests.get(url, stream=True, timeout=60)
-        response.raise_for_status()
 
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+async def download_video_async(session: aiohttp.ClientSession, url: str, filename: str) -> Optional[str]:
+    """Download video from URL, streaming it to the output directory."""
+    try:
+        output_path = _output_path(filename)
+
+        async with session.get(url) as response:
+            response.raise_for_status()
+            # Network reads arrive in small pieces; a 1 MiB write buffer
+            # coalesces them so the file sees one syscall per MiB.
+            with open(output_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                async for chunk in response.content.iter_any():
+                    f.write(chunk)
 
         return str(output_path)
     except Exception as e:
@@ -107,7 +329,224 @@ def download_video(url: str, filename: str) -> Optional[str]:
         return None
 
 
-def generate_video(
+async def download_video_ranged(
+    session: aiohttp.ClientSession,
+    url: str,
+    filename: str,
+    parts: int = DOWNLOAD_RANGE_PARTS,
+) -> Optional[str]:
+    """
+    Download video using parallel HTTP range requests.
+
+    Each range is written at its offset in a preallocated file. Falls back
+    to a single streamed request when the server doesn't advertise range
+    support, the file is small, or any range request fails.
+    """
+    try:
+        async with session.head(url, allow_redirects=True) as head:
+            head.raise_for_status()
+            size = int(head.headers.get("Content-Length", 0))
+            ranged = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except Exception:
+        size, ranged = 0, False
+
+    if not ranged or size < DOWNLOAD_RANGE_MIN_SIZE or not hasattr(os, "pwrite"):
+        return await download_video_async(session, url, filename)
+
+    async def fetch_range(fd: int, start: int, end: int):
+        async with session.get(url, headers={"Range": f"bytes={start}-{end}"}) as response:
+            response.raise_for_status()
+            if response.status != 206:
+                raise RuntimeError(f"Range request not honoured (HTTP {response.status})")
+            offset = start
+            buf = bytearray()
+            async for chunk in response.content.iter_any():
+                buf += chunk
+                if len(buf) >= DOWNLOAD_CHUNK_SIZE:
+                    os.pwrite(fd, buf, offset)
+                    offset += len(buf)
+                    buf.clear()
+            if buf:
+                os.pwrite(fd, buf, offset)
+
+    output_path = None
+    try:
+        output_path = _output_path(filename)
+        part_size = -(-size // parts)
+
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            # A TaskGroup cancels the other parts on failure, so none write after close
+            async with asyncio.TaskGroup() as group:
+                for start in range(0, size, part_size):
+                    group.create_task(fetch_range(fd, start, min(start + part_size, size) - 1))
+        finally:
+            os.close(fd)
+
+        return str(output_path)
+    except Exception:
+        # Servers may advertise ranges yet answer with 200, or a part may fail;
+        # drop the partial file and fetch the video in one request instead
+        if output_path is not None:
+            output_path.unlink(missing_ok=True)
+        return await download_video_async(session, url, filename)
+
+
+async def poll_until_done(
+    provider: VideoProvider,
+    task_id: str,
+    timeout: float = GENERATION_TIMEOUT,
+) -> VideoTask:
+    """
+    Poll a task until it reaches a terminal state.
+
+    Status checks run in a worker thread so several tasks can be polled
+    concurrently on one event loop. The interval doubles after each check
+    (1s, 2s, 4s, 8s, 10s, ...) so a finished video is noticed quickly.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = POLL_INITIAL_INTERVAL
+
+    while True:
+        task = await asyncio.to_thread(provider.get_task_status, task_id)
+
+        if task.is_completed():
+            return task
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            task.status = TaskStatus.FAILED
+            task.error_message = f"Timeout after {timeout} seconds"
+            return task
+
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, POLL_MAX_INTERVAL)
+
+
+# Provider-specific submit calls, keyed by (generation type, provider)
+SUBMIT_DISPATCH: Dict[Tuple[GenerationType, str], Callable[..., VideoTask]] = {
+    (GenerationType.TEXT_TO_VIDEO, "kling"): lambda p, **kw: p.submit_text_to_video(
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        mode=kw["mode"],
+        aspect_ratio=kw["aspect_ratio"],
+    ),
+    (GenerationType.TEXT_TO_VIDEO, "tongyi"): lambda p, **kw: p.submit_text_to_video(
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        resolution=kw["resolution"],
+    ),
+    (GenerationType.TEXT_TO_VIDEO, "jimeng"): lambda p, **kw: p.submit_text_to_video(
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        aspect_ratio=kw["aspect_ratio"],
+    ),
+    (GenerationType.TEXT_TO_VIDEO, "hailuo"): lambda p, **kw: p.submit_text_to_video(
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        resolution=kw["resolution"],
+        model=kw["model_id"],
+    ),
+    (GenerationType.IMAGE_TO_VIDEO, "kling"): lambda p, **kw: p.submit_image_to_video(
+        image_url=kw["image_url"],
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        mode=kw["mode"],
+    ),
+    (GenerationType.IMAGE_TO_VIDEO, "tongyi"): lambda p, **kw: p.submit_image_to_video(
+        image_url=kw["image_url"],
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        resolution=kw["resolution"],
+    ),
+    (GenerationType.IMAGE_TO_VIDEO, "jimeng"): lambda p, **kw: p.submit_image_to_video(
+        image_url=kw["image_url"],
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        model=kw["model_id"],
+        aspect_ratio=kw["aspect_ratio"],
+    ),
+    (GenerationType.IMAGE_TO_VIDEO, "hailuo"): lambda p, **kw: p.submit_image_to_video(
+        image_url=kw["image_url"],
+        prompt=kw["prompt"],
+        duration=kw["duration"],
+        resolution=kw["resolution"],
+        model=kw["model_id"],
+    ),
+}
+
+
+def submit_task(
+    provider: VideoProvider,
+    provider_name: str,
+    model: ModelCapability,
+    generation_type: GenerationType,
+    prompt: str,
+    duration: int,
+    resolution: str,
+    aspect_ratio: str,
+    image_url: Optional[str] = None,
+    mode: str = "std",
+) -> VideoTask:
+    """Submit a generation task with provider-specific arguments."""
+    submit = SUBMIT_DISPATCH.get((generation_type, provider_name))
+    if submit is None:
+        raise ValueError(f"Unsupported generation type {generation_type.value} for provider: {provider_name}")
+
+    if generation_type == GenerationType.IMAGE_TO_VIDEO and not image_url:
+        raise ValueError("Image URL required for image-to-video")
+
+    return submit(
+        provider,
+        prompt=prompt,
+        duration=duration,
+        model_id=model.model_id,
+        resolution=resolution,
+        aspect_ratio=aspect_ratio,
+        image_url=image_url,
+        mode=mode,
+    )
+
+
+# Generations currently running, keyed by _dedup_key. Each Streamlit session
+# runs its own event loop in its own thread, so entries are thread-safe
+# concurrent futures that any loop can await through asyncio.wrap_future.
+_INFLIGHT: Dict[tuple, concurrent.futures.Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _digest(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def _dedup_key(
+    provider_name: str,
+    model_id: str,
+    generation_type: GenerationType,
+    prompt: str,
+    duration: int,
+    resolution: str,
+    aspect_ratio: str,
+    image_url: Optional[str],
+    mode: str,
+) -> tuple:
+    """Identity of a generation request; long strings are hashed to keep keys small."""
+    return (
+        provider_name, model_id, generation_type, _digest(prompt),
+        duration, resolution, aspect_ratio, _digest(image_url), mode,
+    )
+
+
+async def generate_video_async(
     provider_name: str,
     model: ModelCapability,
     generation_type: GenerationType,
@@ -118,11 +557,18 @@ def generate_video(
     image_url: Optional[str] = None,
     mode: str = "std",
     progress_callback=None,
+    provider: Optional[VideoProvider] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> GenerationResult:
-    """Generate video using the specified provider and model."""
+    """
+    Generate video using the specified provider and model.
 
-    providers = get_provider_instances()
-    provider = providers.get(provider_name)
+    The provider instance may be passed in directly; otherwise it is
+    resolved from provider_name. Pass a shared session to reuse pooled
+    connections for the download; otherwise a one-off session is used.
+    """
+    if provider is None:
+        provider = _get_provider(provider_name)
 
     if not provider:
         return GenerationResult(
@@ -144,93 +590,81 @@ def generate_video(
             error_message=f"No supported duration in range {duration_range}"
         )
 
-    start_time = time.time()
+    # Identical in-flight requests share one provider task
+    key = _dedup_key(
+        provider_name, model.model_id, generation_type, prompt,
+        duration, resolution, aspect_ratio, image_url, mode,
+    )
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT.get(key)
+        if inflight is None:
+            future = concurrent.futures.Future()
+            _INFLIGHT[key] = future
+    if inflight is not None:
+        try:
+            return await asyncio.shield(asyncio.wrap_future(inflight))
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            # The owning session was torn down mid-run; generate our own copy
+        return await _run_generation(
+            provider, provider_name, model, generation_type, prompt,
+            duration, resolution, aspect_ratio, image_url, mode,
+            progress_callback, session,
+        )
 
     try:
-        # Submit task based on generation type
-        if generation_type == GenerationType.TEXT_TO_VIDEO:
-            if provider_name == "kling":
-                task = provider.submit_text_to_video(
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    mode=mode,
-                    aspect_ratio=aspect_ratio,
-                )
-            elif provider_name == "tongyi":
-                task = provider.submit_text_to_video(
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    resolution=resolution,
-                )
-            elif provider_name == "jimeng":
-                task = provider.submit_text_to_video(
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    aspect_ratio=aspect_ratio,
-                )
-            elif provider_name == "hailuo":
-                task = provider.submit_text_to_video(
-                    prompt=prompt,
-                    duration=duration,
-                    resolution=resolution,
-                    model=model.model_id,
-                )
-            else:
-                raise ValueError(f"Unknown provider: {provider_name}")
+        result = await _run_generation(
+            provider, provider_name, model, generation_type, prompt,
+            duration, resolution, aspect_ratio, image_url, mode,
+            progress_callback, session,
+        )
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+        if not future.done():
+            future.cancel()
 
-        elif generation_type == GenerationType.IMAGE_TO_VIDEO:
-            if not image_url:
-                raise ValueError("Image URL required for image-to-video")
 
-            if provider_name == "kling":
-                task = provider.submit_image_to_video(
-                    image_url=image_url,
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    mode=mode,
-                )
-            elif provider_name == "tongyi":
-                task = provider.submit_image_to_video(
-                    image_url=image_url,
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    resolution=resolution,
-                )
-            elif provider_name == "jimeng":
-                task = provider.submit_image_to_video(
-                    image_url=image_url,
-                    prompt=prompt,
-                    duration=duration,
-                    model=model.model_id,
-                    aspect_ratio=aspect_ratio,
-                )
-            elif provider_name == "hailuo":
-                task = provider.submit_image_to_video(
-                    image_url=image_url,
-                    prompt=prompt,
-                    duration=duration,
-                    resolution=resolution,
-                    model=model.model_id,
-                )
-            else:
-                raise ValueError(f"Unknown provider: {provider_name}")
-        else:
-            raise ValueError(f"Unsupported generation type: {generation_type}")
+async def _run_generation(
+    provider: VideoProvider,
+    provider_name: str,
+    model: ModelCapability,
+    generation_type: GenerationType,
+    prompt: str,
+    duration: int,
+    resolution: str,
+    aspect_ratio: str,
+    image_url: Optional[str],
+    mode: str,
+    progress_callback,
+    session: Optional[aiohttp.ClientSession],
+) -> GenerationResult:
+    """Submit, poll and download a single generation; errors become a failed result."""
+    start_time = time.time()
+
+    try:
+        task = await asyncio.to_thread(
+            submit_task,
+            provider,
+            provider_name,
+            model,
+            generation_type,
+            prompt,
+            duration,
+            resolution,
+            aspect_ratio,
+            image_url,
+            mode,
+        )
 
         if progress_callback:
             progress_callback(f"Task submitted: {task.task_id}")
 
         # Wait for completion
-        result = provider.wait_for_completion(
-            task.task_id,
-            timeout=600,
-            poll_interval=10
-        )
+        result = await poll_until_done(provider, task.task_id)
 
         generation_time = time.time() - start_time
         estimated_cost = model.cost_per_second * duration
@@ -239,7 +673,11 @@ def generate_video(
             # Download video
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{provider_name}_{model.model_id}_{timestamp}.mp4"
-            video_path = download_video(result.video_url, filename)
+            if session is not None:
+                video_path = await download_video_ranged(session, result.video_url, filename)
+            else:
+                async with create_download_session() as own_session:
+                    video_path = await download_video_ranged(own_session, result.video_url, filename)
 
             return GenerationResult(
                 provider=provider_name,
@@ -248,6 +686,7 @@ def generate_video(
                 success=True,
                 video_url=result.video_url,
                 video_path=video_path,
+                video_exists=video_path is not None,
                 generation_time=generation_time,
                 estimated_cost=estimated_cost,
                 task_id=task.task_id,
@@ -277,6 +716,74 @@ def generate_video(
         )
 
 
+def generate_video(
+    provider_name: str,
+    model: ModelCapability,
+    generation_type: GenerationType,
+    prompt: str,
+    duration_range: Tuple[int, int],
+    resolution: str,
+    aspect_ratio: str,
+    image_url: Optional[str] = None,
+    mode: str = "std",
+    progress_callback=None,
+) -> GenerationResult:
+    """Generate video using the specified provider and model (blocking)."""
+    return asyncio.run(generate_video_async(
+        provider_name=provider_name,
+        model=model,
+        generation_type=generation_type,
+        prompt=prompt,
+        duration_range=duration_range,
+        resolution=resolution,
+        aspect_ratio=aspect_ratio,
+        image_url=image_url,
+        mode=mode,
+        progress_callback=progress_callback,
+    ))
+
+
+async def generate_all_async(
+    models: List[ModelCapability],
+    on_result=None,
+    **params,
+) -> List[GenerationResult]:
+    """
+    Generate videos for all models concurrently.
+
+    All downloads share one HTTP session, so videos served from the same
+    provider CDN reuse kept-alive connections.
+
+    Args:
+        models: Models to generate with
+        on_result: Optional callback(result, completed_count) invoked as each model finishes
+        **params: Arguments forwarded to generate_video_async
+
+    Returns:
+        Results in the same order as models
+    """
+    async with create_download_session() as session:
+        tasks = [
+            asyncio.create_task(generate_video_async(
+                provider_name=model.provider,
+                model=model,
+                provider=_get_provider(model.provider),
+                session=session,
+                **params,
+            ))
+            for model in models
+        ]
+
+        completed = 0
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            completed += 1
+            if on_result:
+                on_result(result, completed)
+
+    return [task.result() for task in tasks]
+
+
 def main():
     st.set_page_config(
         page_title="Video Generation Comparison Tool",
@@ -292,6 +799,8 @@ def main():
         st.session_state.results = []
     if "is_generating" not in st.session_state:
         st.session_state.is_generating = False
+    if "zip_job" not in st.session_state:
+        st.session_state.zip_job = None
 
     # Sidebar for parameters
     with st.sidebar:
@@ -311,8 +820,9 @@ def main():
 
         st.divider()
 
+        available_durations, available_resolutions, available_aspect_ratios = get_available_options(generation_type)
+
         # Duration Range
-        available_durations = get_available_durations(generation_type)
         if available_durations:
             min_dur = min(available_durations)
             max_dur = max(available_durations)
@@ -332,7 +842,6 @@ def main():
             duration_range = (5, 10)
 
         # Resolution
-        available_resolutions = get_available_resolutions(generation_type)
         resolution = st.selectbox(
             "Resolution",
             options=available_resolutions,
@@ -340,7 +849,6 @@ def main():
         )
 
         # Aspect Ratio
-        available_aspect_ratios = get_available_aspect_ratios(generation_type)
         if available_aspect_ratios:
             aspect_ratio = st.selectbox(
                 "Aspect Ratio",
@@ -385,7 +893,7 @@ def main():
             )
             if image_url:
                 try:
-                    st.image(image_url, caption="Input Image", width=300)
+                    st.image(_preview_bytes(image_url), caption="Input Image", width=300)
                 except:
                     st.warning("Could not load image preview")
 
@@ -393,43 +901,46 @@ def main():
         st.subheader("Select Models")
 
         # Filter compatible models
-        compatible_models = filter_models(
-            generation_type=generation_type,
-            duration_range=duration_range,
-            resolution=resolution,
-            aspect_ratio=aspect_ratio if available_aspect_ratios else None,
-        )
+        compat_aspect_ratio = aspect_ratio if available_aspect_ratios else None
+        compatible_models = _cached_filter(generation_type, duration_range, resolution, compat_aspect_ratio)
 
         # Group by provider
         selected_models: List[ModelCapability] = []
 
         for provider_id, provider_name in PROVIDER_NAMES.items():
             provider_models = [m for m in compatible_models if m.provider == provider_id]
-            all_provider_models = get_models_by_provider(provider_id)
+            all_provider_models = PROVIDER_MODELS[provider_id]
 
             with st.expander(f"{provider_name} ({len(provider_models)}/{len(all_provider_models)} models available)", expanded=True):
+                options: Dict[str, ModelCapability] = {}
+                unavailable = []
                 for model in all_provider_models:
-                    is_compatible, reason = check_model_compatibility(
-                        model,
-                        generation_type=generation_type,
-                        duration_range=duration_range,
-                        resolution=resolution,
-                        aspect_ratio=aspect_ratio if available_aspect_ratios else None,
+                    is_compatible, reason = _cached_compat(
+                        model.provider,
+                        model.model_id,
+                        generation_type,
+                        duration_range,
+                        resolution,
+                        compat_aspect_ratio,
                     )
-
                     if is_compatible:
-                        if st.checkbox(
-                            f"{model.display_name}",
-                            key=f"model_{provider_id}_{model.model_id}",
-                            help=model.description,
-                        ):
-                            selected_models.append(model)
+                        options[model.model_id] = model
                     else:
-                        st.checkbox(
-                            f"~~{model.display_name}~~ ({reason})",
-                            key=f"model_{provider_id}_{model.model_id}",
-                            disabled=True,
-                        )
+                        unavailable.append(f"~~{model.display_name}~~ ({reason})")
+
+                chosen = st.multiselect(
+                    "Models",
+                    options=list(options),
+                    format_func=lambda model_id: options[model_id].display_name,
+                    key=f"models_{provider_id}",
+                    label_visibility="collapsed",
+                    placeholder="Choose models",
+                    disabled=not options,
+                )
+                selected_models.extend(options[model_id] for model_id in chosen)
+
+                if unavailable:
+                    st.caption("Unavailable: " + ", ".join(unavailable))
 
         st.info(f"Selected: {len(selected_models)} models")
 
@@ -450,6 +961,7 @@ def main():
     if generate_button and selected_models:
         st.session_state.is_generating = True
         st.session_state.results = []
+        _discard_zip()
 
         # Validate inputs
         if generation_type == GenerationType.IMAGE_TO_VIDEO and not image_url:
@@ -464,25 +976,23 @@ def main():
                 overall_progress = st.progress(0)
                 status_text = st.empty()
 
-                results = []
-
-                for i, model in enumerate(selected_models):
-                    status_text.text(f"Generating with {model.display_name} ({i+1}/{len(selected_models)})...")
-
-                    result = generate_video(
-                        provider_name=model.provider,
-                        model=model,
-                        generation_type=generation_type,
-                        prompt=prompt,
-                        duration_range=duration_range,
-                        resolution=resolution,
-                        aspect_ratio=aspect_ratio,
-                        image_url=image_url,
-                        mode=mode,
-                    )
+                status_text.text(f"Generating with {len(selected_models)} models in parallel...")
+
+                def on_result(result: GenerationResult, completed: int):
+                    status_text.text(f"{result.model_name} finished ({completed}/{len(selected_models)})")
+                    overall_progress.progress(completed / len(selected_models))
 
-                    results.append(result)
-                    overall_progress.progress((i + 1) / len(selected_models))
+                results = asyncio.run(generate_all_async(
+                    selected_models,
+                    on_result=on_result,
+                    generation_type=generation_type,
+                    prompt=prompt,
+                    duration_range=duration_range,
+                    resolution=resolution,
+                    aspect_ratio=aspect_ratio,
+                    image_url=image_url,
+                    mode=mode,
+                ))
 
                 status_text.text("All generations completed!")
                 st.session_state.results = results
@@ -494,18 +1004,20 @@ def main():
         st.header("Results")
 
         # Summary metrics
-        successful = [r for r in st.session_state.results if r.success]
-        failed = [r for r in st.session_state.results if not r.success]
+        results = st.session_state.results
+        results_key = _results_key(results)
+        successful_idx, failed_idx, total_cost = _summarize(results_key)
+        successful = [results[i] for i in successful_idx]
+        failed = [results[i] for i in failed_idx]
 
         col_m1, col_m2, col_m3, col_m4 = st.columns(4)
         with col_m1:
-            st.metric("Total", len(st.session_state.results))
+            st.metric("Total", len(results))
         with col_m2:
             st.metric("Successful", len(successful))
         with col_m3:
             st.metric("Failed", len(failed))
         with col_m4:
-            total_cost = sum(r.estimated_cost for r in successful)
             st.metric("Est. Cost", f"¥{total_cost:.2f}")
 
         st.divider()
@@ -520,29 +1032,19 @@ def main():
 
             for i, result in enumerate(successful):
                 with cols[i % num_cols]:
-                    st.markdown(f"**{PROVIDER_NAMES.get(result.provider, result.provider)}**")
-                    st.markdown(f"*{result.model_name}*")
-
-                    if result.video_path and os.path.exists(result.video_path):
+                    # One markdown block per cell; st.video only for large local files
+                    video_src = _video_src(result)
+                    if video_src or not result.video_exists:
+                        st.markdown(_result_cell_html(result, video_src), unsafe_allow_html=True)
+                    else:
                         st.video(result.video_path)
-                    elif result.video_url:
-                        st.video(result.video_url)
-
-                    st.markdown(f"""
-                    - **Duration:** {result.duration_used}s
-                    - **Gen Time:** {result.generation_time:.1f}s
-                    - **Est. Cost:** ¥{result.estimated_cost:.2f}
-                    """)
-
-                    if result.video_path:
-                        with open(result.video_path, "rb") as f:
-                            st.download_button(
-                                label="Download",
-                                data=f,
-                                file_name=os.path.basename(result.video_path),
-                                mime="video/mp4",
-                                key=f"download_{result.provider}_{result.model_id}",
-                            )
+                        st.markdown(_result_cell_html(result, None), unsafe_allow_html=True)
+
+                    if result.video_path and result.video_exists:
+                        _video_download_button(
+                            result.video_path,
+                            key=f"download_{result.provider}_{result.model_id}",
+                        )
 
         # Failed results
         if failed:
@@ -555,45 +1057,37 @@ def main():
             st.divider()
             st.subheader("Bulk Download")
 
-            # Create a zip file with all videos
-            import zipfile
-            import io
-
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-                for result in successful:
-                    if result.video_path and os.path.exists(result.video_path):
-                        zf.write(result.video_path, os.path.basename(result.video_path))
-
-            zip_buffer.seek(0)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            st.download_button(
-                label="📦 Download All Videos (ZIP)",
-                data=zip_buffer,
-                file_name=f"video_comparison_{timestamp}.zip",
-                mime="application/zip",
-            )
+            # Package on request in a worker process; a fragment polls for completion
+            # so the script thread stays responsive
+            if st.button("📦 Prepare ZIP of All Videos"):
+                _discard_zip()
+                fd, zip_name = tempfile.mkstemp(suffix=".zip")
+                os.close(fd)
+                paths = [r.video_path for r in successful if r.video_path and r.video_exists]
+                future = _zip_executor().submit(build_zip, paths, zip_name)
+                st.session_state.zip_job = (future, zip_name)
+
+            if st.session_state.zip_job is not None:
+                future, zip_name = st.session_state.zip_job
+                if not future.done():
+                    _zip_progress()
+                elif future.exception() is not None:
+                    st.error(f"Packaging failed: {future.exception()}")
+                else:
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    with open(zip_name, "rb") as f:
+                        st.download_button(
+                            label="📦 Download All Videos (ZIP)",
+                            data=f,
+                            file_name=f"video_comparison_{timestamp}.zip",
+                            mime="application/zip",
+                        )
 
         # Results table
         st.divider()
         st.subheader("Detailed Results")
 
-        import pandas as pd
-
-        df_data = []
-        for result in st.session_state.results:
-            df_data.append({
-                "Provider": PROVIDER_NAMES.get(result.provider, result.provider),
-                "Model": result.model_name,
-                "Status": "✅ Success" if result.success else "❌ Failed",
-                "Duration": f"{result.duration_used}s" if result.duration_used else "-",
-                "Gen Time (s)": f"{result.generation_time:.1f}",
-                "Est. Cost (¥)": f"{result.estimated_cost:.2f}" if result.success else "-",
-                "Error": result.error_message or "-",
-            })
-
-        df = pd.DataFrame(df_data)
+        df = _build_results_df(results_key)
         st.dataframe(df, use_container_width=True, hide_index=True)
 
 
@@ -5,35 +5,89 @@ This module defines the capabilities of each model across all providers,
 including supported durations, resolutions, aspect ratios, and features.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 
 class GenerationType(Enum):
-    TEXT_TO_VIDEO = "text_to_video"
-    IMAGE_TO_VIDEO = "image_to_video"
-    FIRST_LAST_FRAME = "first_last_frame"
-    SUBJECT_REFERENCE = "subject_reference"
-    VIDEO_REFERENCE = "video_reference"
-
-
-@dataclass
+    TEXT_TO_VIDEO = ("text_to_video", 1)
+    IMAGE_TO_VIDEO = ("image_to_video", 2)
+    FIRST_LAST_FRAME = ("first_last_frame", 4)
+    SUBJECT_REFERENCE = ("subject_reference", 8)
+    VIDEO_REFERENCE = ("video_reference", 16)
+
+    def __new__(cls, value: str, mask: int):
+        # .value stays the string used in messages and serialization;
+        # .mask is a distinct bit for ModelCapability._gen_type_mask
+        member = object.__new__(cls)
+        member._value_ = value
+        member.mask = mask
+        return member
+
+
+@dataclass(frozen=True, slots=True)
 class ModelCapability:
     """Represents a model's capabilities."""
     provider: str
     model_id: str
     display_name: str
-    generation_types: List[GenerationType]
-    durations: List[int]  # in seconds
-    resolutions: List[str]
-    aspect_ratios: List[str]
-    modes: List[str] = field(default_factory=list)  # e.g., ["std", "pro"]
+    generation_types: Tuple[GenerationType, ...]
+    durations: Tuple[int, ...]  # in seconds
+    resolutions: Tuple[str, ...]
+    aspect_ratios: Tuple[str, ...]
+    modes: Tuple[str, ...] = ()  # e.g., ("std", "pro")
     supports_audio: bool = False
     supports_camera_control: bool = False
     cost_per_second: float = 0.0  # Estimated cost in CNY
     description: str = ""
 
+    # Membership sets for the filter/compatibility checks, derived from the tuples above
+    _gen_type_mask: int = field(init=False, repr=False, compare=False)  # OR of GenerationType.mask
+    _duration_set: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _resolution_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _aspect_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _duration_mask: int = field(init=False, repr=False, compare=False)  # bit d set <=> d seconds supported
+    _duration_mismatch: str = field(init=False, repr=False, compare=False)  # reason text for range misses
+
+    def __post_init__(self):
+        # Frozen: derived fields have to be set through object.__setattr__
+        set_field = object.__setattr__
+        set_field(self, "generation_types", tuple(self.generation_types))
+        set_field(self, "durations", tuple(self.durations))
+        set_field(self, "resolutions", tuple(self.resolutions))
+        set_field(self, "aspect_ratios", tuple(self.aspect_ratios))
+        set_field(self, "modes", tuple(self.modes))
+        gen_type_mask = 0
+        for gt in self.generation_types:
+            gen_type_mask |= gt.mask
+        set_field(self, "_gen_type_mask", gen_type_mask)
+        set_field(self, "_duration_set", frozenset(self.durations))
+        set_field(self, "_resolution_set", frozenset(self.resolutions))
+        set_field(self, "_aspect_set", frozenset(self.aspect_ratios))
+        duration_mask = 0
+        for d in self.durations:
+            duration_mask |= 1 << d
+        set_field(self, "_duration_mask", duration_mask)
+        supported = ", ".join(f"{d}s" for d in self.durations)
+        set_field(self, "_duration_mismatch", f"时长范围不匹配 (支持: {supported})")
+
+
+# Option tuples shared by every model that offers the same set
+_T2V = (GenerationType.TEXT_TO_VIDEO,)
+_I2V = (GenerationType.IMAGE_TO_VIDEO,)
+_DUR_5 = (5,)
+_DUR_6 = (6,)
+_DUR_5_10 = (5, 10)
+_DUR_6_10 = (6, 10)
+_RES_720 = ("720P",)
+_RES_1080 = ("1080P",)
+_RES_STD = ("720P", "1080P")
+_RES_768_1080 = ("768P", "1080P")
+_AR_STD = ("16:9", "9:16", "1:1")
+_AR_JIMENG = ("16:9", "9:16", "4:3", "3:4", "1:1")
+
 
 # All model capabilities
 MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
@@ -42,16 +96,16 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="kling",
             model_id="kling-video-o1",
             display_name="Kling Omni-Video O1",
-            generation_types=[
+            generation_types=(
                 GenerationType.TEXT_TO_VIDEO,
                 GenerationType.IMAGE_TO_VIDEO,
                 GenerationType.FIRST_LAST_FRAME,
                 GenerationType.VIDEO_REFERENCE,
-            ],
-            durations=[5, 10],  # 3-10 for reference mode, but 5/10 for t2v/i2v
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=["std", "pro"],
+            ),
+            durations=_DUR_5_10,  # 3-10 for reference mode, but 5/10 for t2v/i2v
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=("std", "pro"),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.5,
@@ -63,11 +117,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wan2.6-t2v",
             display_name="万相2.6 文生视频",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=True,
             supports_camera_control=False,
             cost_per_second=0.4,
@@ -77,11 +131,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wan2.5-t2v-preview",
             display_name="万相2.5 Preview",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=True,
             supports_camera_control=False,
             cost_per_second=0.35,
@@ -91,11 +145,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wan2.2-t2v-plus",
             display_name="万相2.2 专业版",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.3,
@@ -105,11 +159,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wanx2.1-t2v-turbo",
             display_name="万相2.1 极速版",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5,
+            resolutions=_RES_720,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.2,
@@ -119,11 +173,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wanx2.1-t2v-plus",
             display_name="万相2.1 专业版",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.25,
@@ -133,11 +187,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="tongyi",
             model_id="wan2.6-i2v",
             display_name="万相2.6 图生视频",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[5],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "1:1"],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_5,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_STD,
+            modes=(),
             supports_audio=True,
             supports_camera_control=False,
             cost_per_second=0.45,
@@ -149,11 +203,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="jimeng",
             model_id="jimeng_t2v_v30",
             display_name="即梦3.0 720P",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5, 10],
-            resolutions=["720P"],
-            aspect_ratios=["16:9", "9:16", "4:3", "3:4", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5_10,
+            resolutions=_RES_720,
+            aspect_ratios=_AR_JIMENG,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.6,
@@ -163,11 +217,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="jimeng",
             model_id="jimeng_t2v_v30_1080p",
             display_name="即梦3.0 1080P",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5, 10],
-            resolutions=["1080P"],
-            aspect_ratios=["16:9", "9:16", "4:3", "3:4", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5_10,
+            resolutions=_RES_1080,
+            aspect_ratios=_AR_JIMENG,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.8,
@@ -177,11 +231,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="jimeng",
             model_id="jimeng_t2v_v30_pro",
             display_name="即梦3.0 Pro",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[5, 10],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "4:3", "3:4", "1:1"],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_5_10,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_JIMENG,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=1.0,
@@ -191,11 +245,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="jimeng",
             model_id="jimeng_ti2v_v30_pro",
             display_name="即梦3.0 Pro 图生视频",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[5, 10],
-            resolutions=["720P", "1080P"],
-            aspect_ratios=["16:9", "9:16", "4:3", "3:4", "1:1"],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_5_10,
+            resolutions=_RES_STD,
+            aspect_ratios=_AR_JIMENG,
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=1.0,
@@ -207,11 +261,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="MiniMax-Hailuo-2.3",
             display_name="海螺2.3",
-            generation_types=[GenerationType.TEXT_TO_VIDEO, GenerationType.IMAGE_TO_VIDEO],
-            durations=[6, 10],
-            resolutions=["768P", "1080P"],
-            aspect_ratios=[],  # Determined by input image for I2V
-            modes=[],
+            generation_types=(GenerationType.TEXT_TO_VIDEO, GenerationType.IMAGE_TO_VIDEO),
+            durations=_DUR_6_10,
+            resolutions=_RES_768_1080,
+            aspect_ratios=(),  # Determined by input image for I2V
+            modes=(),
             supports_audio=False,
             supports_camera_control=True,
             cost_per_second=0.5,
@@ -221,15 +275,15 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="MiniMax-Hailuo-02",
             display_name="海螺02",
-            generation_types=[
+            generation_types=(
                 GenerationType.TEXT_TO_VIDEO,
                 GenerationType.IMAGE_TO_VIDEO,
                 GenerationType.FIRST_LAST_FRAME,
-            ],
-            durations=[6, 10],
-            resolutions=["768P", "1080P"],
-            aspect_ratios=[],
-            modes=[],
+            ),
+            durations=_DUR_6_10,
+            resolutions=_RES_768_1080,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=True,
             cost_per_second=0.45,
@@ -239,11 +293,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="MiniMax-Hailuo-2.3-Fast",
             display_name="海螺2.3 Fast",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[6, 10],
-            resolutions=["768P", "1080P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_6_10,
+            resolutions=_RES_768_1080,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=True,
             cost_per_second=0.4,
@@ -253,11 +307,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="T2V-01-Director",
             display_name="T2V Director",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=True,
             cost_per_second=0.35,
@@ -267,11 +321,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="T2V-01",
             display_name="T2V Basic",
-            generation_types=[GenerationType.TEXT_TO_VIDEO],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_T2V,
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.3,
@@ -281,11 +335,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="I2V-01-Director",
             display_name="I2V Director",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=True,
             cost_per_second=0.35,
@@ -295,11 +349,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="I2V-01-live",
             display_name="I2V Live",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.3,
@@ -309,11 +363,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="I2V-01",
             display_name="I2V Basic",
-            generation_types=[GenerationType.IMAGE_TO_VIDEO],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=_I2V,
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.25,
@@ -323,11 +377,11 @@ MODEL_CAPABILITIES: Dict[str, Dict[str, ModelCapability]] = {
             provider="hailuo",
             model_id="S2V-01",
             display_name="S2V Subject Reference",
-            generation_types=[GenerationType.SUBJECT_REFERENCE],
-            durations=[6],
-            resolutions=["720P"],
-            aspect_ratios=[],
-            modes=[],
+            generation_types=(GenerationType.SUBJECT_REFERENCE,),
+            durations=_DUR_6,
+            resolutions=_RES_720,
+            aspect_ratios=(),
+            modes=(),
             supports_audio=False,
             supports_camera_control=False,
             cost_per_second=0.4,
@@ -345,18 +399,88 @@ PROVIDER_NAMES = {
     "hailuo": "海螺 (Hailuo)",
 }
 
+# Display order for sidebar options
+RESOLUTION_ORDER = ("720P", "768P", "1080P")
+ASPECT_RATIO_ORDER = ("16:9", "9:16", "4:3", "3:4", "1:1")
+
+
+def _union(sets: Iterable[FrozenSet]) -> FrozenSet:
+    """Union of the given sets, consumed lazily without building an argument tuple."""
+    merged = set()
+    for values in sets:
+        merged |= values
+    return frozenset(merged)
+
+
+def _in_display_order(value_groups: Iterable[Tuple[str, ...]], order: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Values seen in any group, in the given display order, from a single pass.
+
+    Marks a slot per known value rather than building a set and filtering
+    the order against it; values missing from order are dropped.
+    """
+    index = {value: i for i, value in enumerate(order)}
+    seen = [False] * len(order)
+    for values in value_groups:
+        for value in values:
+            i = index.get(value)
+            if i is not None:
+                seen[i] = True
+    return tuple(value for value, present in zip(order, seen) if present)
+
+
+# Lookup tables built once at import; MODEL_CAPABILITIES is static.
+# The None key covers all generation types.
+_ALL_MODELS: Tuple[ModelCapability, ...] = tuple(
+    model for provider_models in MODEL_CAPABILITIES.values() for model in provider_models.values()
+)
+_MODELS_BY_PROVIDER: Dict[str, Tuple[ModelCapability, ...]] = {
+    provider: tuple(provider_models.values()) for provider, provider_models in MODEL_CAPABILITIES.items()
+}
+_MODELS_BY_GENTYPE: Dict[Optional[GenerationType], Tuple[ModelCapability, ...]] = {
+    gt: tuple(m for m in _ALL_MODELS if m._gen_type_mask & gt.mask) for gt in GenerationType
+}
+_MODELS_BY_GENTYPE[None] = _ALL_MODELS
+
+# Final answers, in display order
+_DURATIONS_BY_GENTYPE = {
+    gt: tuple(sorted(_union(m._duration_set for m in models))) for gt, models in _MODELS_BY_GENTYPE.items()
+}
+_RESOLUTIONS_BY_GENTYPE = {
+    gt: _in_display_order((m.resolutions for m in models), RESOLUTION_ORDER)
+    for gt, models in _MODELS_BY_GENTYPE.items()
+}
+_ASPECTS_BY_GENTYPE = {
+    gt: _in_display_order((m.aspect_ratios for m in models), ASPECT_RATIO_ORDER)
+    for gt, models in _MODELS_BY_GENTYPE.items()
+}
+_OPTIONS_BY_GENTYPE = {
+    gt: (_DURATIONS_BY_GENTYPE[gt], _RESOLUTIONS_BY_GENTYPE[gt], _ASPECTS_BY_GENTYPE[gt])
+    for gt in _MODELS_BY_GENTYPE
+}
+
+
+# Precomputed reasons for check_model_compatibility
+_GENTYPE_UNSUPPORTED = {gt: f"不支持 {gt.value}" for gt in GenerationType}
+
+
+@lru_cache(maxsize=None)
+def _range_mask(min_dur: int, max_dur: int) -> int:
+    """Bitmask with bits min_dur..max_dur set, matching ModelCapability._duration_mask."""
+    min_dur = max(min_dur, 0)
+    if max_dur < min_dur:
+        return 0
+    return ((1 << (max_dur + 1)) - 1) & ~((1 << min_dur) - 1)
 
-def get_all_models() -> List[ModelCapability]:
-    """Get all models across all providers."""
-    models = []
-    for provider_models in MODEL_CAPABILITIES.values():
-        models.extend(provider_models.values())
-    return models
 
+def get_all_models() -> Tuple[ModelCapability, ...]:
+    """Get all models across all providers (shared, immutable)."""
+    return _ALL_MODELS
 
-def get_models_by_provider(provider: str) -> List[ModelCapability]:
-    """Get all models for a specific provider."""
-    return list(MODEL_CAPABILITIES.get(provider, {}).values())
+
+def get_models_by_provider(provider: str) -> Tuple[ModelCapability, ...]:
+    """Get all models for a specific provider (shared, immutable)."""
+    return _MODELS_BY_PROVIDER.get(provider, ())
 
 
 def get_model(provider: str, model_id: str) -> Optional[ModelCapability]:
@@ -383,66 +507,71 @@ def filter_models(
         resolution: Filter by resolution
         aspect_ratio: Filter by aspect ratio
     """
-    models = get_all_models()
+    if duration_range:
+        duration_range = tuple(duration_range)
+    return list(_filter_models_cached(generation_type, duration, duration_range, resolution, aspect_ratio))
+
+
+@lru_cache(maxsize=128)
+def _filter_models_cached(
+    generation_type: Optional[GenerationType],
+    duration: Optional[int],
+    duration_range: Optional[Tuple[int, int]],
+    resolution: Optional[str],
+    aspect_ratio: Optional[str],
+) -> Tuple[ModelCapability, ...]:
+    """filter_models implementation; MODEL_CAPABILITIES is static, so results never go stale."""
+    # Generation type is handled by the precomputed index
+    models = _MODELS_BY_GENTYPE[generation_type or None]
+    range_mask = _range_mask(*duration_range) if duration_range else 0
     filtered = []
 
     for model in models:
-        # Check generation type
-        if generation_type and generation_type not in model.generation_types:
-            continue
-
         # Check duration range (model must support at least one duration in the range)
         if duration_range:
-            min_dur, max_dur = duration_range
-            has_duration_in_range = any(min_dur <= d <= max_dur for d in model.durations)
-            if not has_duration_in_range:
+            if not model._duration_mask & range_mask:
                 continue
-        elif duration and duration not in model.durations:
+        elif duration and duration not in model._duration_set:
             continue
 
-        # Check resolution
-        if resolution and model.resolutions and resolution not in model.resolutions:
+        # Check aspect ratio (empty means any aspect ratio is supported)
+        if aspect_ratio and model.aspect_ratios and aspect_ratio not in model._aspect_set:
             continue
 
-        # Check aspect ratio (empty means any aspect ratio is supported)
-        if aspect_ratio and model.aspect_ratios and aspect_ratio not in model.aspect_ratios:
+        # Check resolution last; nearly every model passes it
+        if resolution and model.resolutions and resolution not in model._resolution_set:
             continue
 
         filtered.append(model)
 
-    return filtered
+    return tuple(filtered)
 
 
-def get_available_durations(generation_type: Optional[GenerationType] = None) -> List[int]:
-    """Get all available durations across models."""
-    models = filter_models(generation_type=generation_type) if generation_type else get_all_models()
-    durations = set()
-    for model in models:
-        durations.update(model.durations)
-    return sorted(durations)
+def get_available_durations(generation_type: Optional[GenerationType] = None) -> Tuple[int, ...]:
+    """Get all available durations across models (shared, immutable)."""
+    return _DURATIONS_BY_GENTYPE[generation_type or None]
 
 
-def get_available_resolutions(generation_type: Optional[GenerationType] = None) -> List[str]:
-    """Get all available resolutions across models."""
-    models = filter_models(generation_type=generation_type) if generation_type else get_all_models()
-    resolutions = set()
-    for model in models:
-        resolutions.update(model.resolutions)
-    # Sort by resolution value
-    resolution_order = ["720P", "768P", "1080P"]
-    return [r for r in resolution_order if r in resolutions]
+def get_available_resolutions(generation_type: Optional[GenerationType] = None) -> Tuple[str, ...]:
+    """Get all available resolutions across models, sorted by resolution value (shared, immutable)."""
+    return _RESOLUTIONS_BY_GENTYPE[generation_type or None]
 
 
-def get_available_aspect_ratios(generation_type: Optional[GenerationType] = None) -> List[str]:
-    """Get all available aspect ratios across models."""
-    models = filter_models(generation_type=generation_type) if generation_type else get_all_models()
-    ratios = set()
-    for model in models:
-        if model.aspect_ratios:
-            ratios.update(model.aspect_ratios)
-    # Common order
-    ratio_order = ["16:9", "9:16", "4:3", "3:4", "1:1"]
-    return [r for r in ratio_order if r in ratios]
+def get_available_aspect_ratios(generation_type: Optional[GenerationType] = None) -> Tuple[str, ...]:
+    """Get all available aspect ratios across models, in common order (shared, immutable)."""
+    return _ASPECTS_BY_GENTYPE[generation_type or None]
+
+
+def get_available_options(
+    generation_type: Optional[GenerationType] = None,
+) -> Tuple[Tuple[int, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get available durations, resolutions and aspect ratios in one lookup.
+
+    Equivalent to calling get_available_durations, get_available_resolutions
+    and get_available_aspect_ratios.
+    """
+    return _OPTIONS_BY_GENTYPE[generation_type or None]
 
 
 def check_model_compatibility(
@@ -456,27 +585,28 @@ def check_model_compatibility(
     """
     Check if a model is compatible with the given parameters.
 
+    Checks run from most to least selective, so the reason reported is
+    the first mismatch in that order.
+
     Returns:
         (is_compatible, reason_if_not)
     """
-    if generation_type and generation_type not in model.generation_types:
-        return False, f"不支持 {generation_type.value}"
+    if generation_type and not model._gen_type_mask & generation_type.mask:
+        return False, _GENTYPE_UNSUPPORTED[generation_type]
 
     if duration_range:
-        min_dur, max_dur = duration_range
-        has_duration_in_range = any(min_dur <= d <= max_dur for d in model.durations)
-        if not has_duration_in_range:
-            supported = ", ".join(f"{d}s" for d in model.durations)
-            return False, f"时长范围不匹配 (支持: {supported})"
-    elif duration and duration not in model.durations:
+        if not model._duration_mask & _range_mask(*duration_range):
+            return False, model._duration_mismatch
+    elif duration and duration not in model._duration_set:
         return False, f"不支持 {duration}秒 时长"
 
-    if resolution and model.resolutions and resolution not in model.resolutions:
-        return False, f"不支持 {resolution} 分辨率"
-
-    if aspect_ratio and model.aspect_ratios and aspect_ratio not in model.aspect_ratios:
+    # Aspect ratio rejects more models than resolution, so test it first
+    if aspect_ratio and model.aspect_ratios and aspect_ratio not in model._aspect_set:
         return False, f"不支持 {aspect_ratio} 画面比例"
 
+    if resolution and model.resolutions and resolution not in model._resolution_set:
+        return False, f"不支持 {resolution} 分辨率"
+
     return True, ""
 
 
@@ -486,8 +616,7 @@ def get_model_duration_in_range(model: ModelCapability, duration_range: Tuple[in
 
     Prefers the maximum duration in range for better comparison.
     """
-    min_dur, max_dur = duration_range
-    valid_durations = [d for d in model.durations if min_dur <= d <= max_dur]
-    if valid_durations:
-        return max(valid_durations)  # Prefer longer duration
+    in_range = model._duration_mask & _range_mask(*duration_range)
+    if in_range:
+        return in_range.bit_length() - 1  # Highest set bit: prefer longer duration
     return None
@@ -0,0 +1,82 @@
+"""
+Packaging helpers for comparison results.
+
+Kept separate from the Streamlit app so worker processes can import
+them without executing the UI script.
+"""
+
+import mmap
+import os
+import zipfile
+import zlib
+from typing import Iterable
+
+# Files at least this large are copied into the archive with os.sendfile
+SENDFILE_MIN_SIZE = 64 << 20
+
+
+def _write_stored_sendfile(zf: zipfile.ZipFile, path: str, arcname: str):
+    """
+    Append a file as a stored entry, copying the payload in-kernel.
+
+    zipfile has no hook for this, so the local header is written from a
+    ZipInfo and the entry registered on the archive, which then emits the
+    central directory itself on close.
+
+    This relies on private ZipFile attributes (fp, start_dir, filelist,
+    NameToInfo) and skips _writecheck, so the archive must be opened with
+    mode "w" and no ZIP64 entries. Verified on CPython 3.9-3.13; see
+    scripts/test_performance.py for the round-trip check.
+    """
+    size = os.path.getsize(path)
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.file_size = zinfo.compress_size = size
+
+    with open(path, "rb") as src:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            zinfo.CRC = zlib.crc32(data)
+
+        # start_dir is where zipfile will write the next entry
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.start_dir
+        zf.fp.write(zinfo.FileHeader())
+        zf.fp.flush()
+
+        out_fd, in_fd = zf.fp.fileno(), src.fileno()
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                raise OSError(f"sendfile stopped early at {offset}/{size} bytes: {path}")
+            offset += sent
+
+    zf.fp.seek(0, os.SEEK_END)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[arcname] = zinfo
+
+
+def build_zip(paths: Iterable[str], out_path: str) -> str:
+    """
+    Write the given video files into a ZIP archive.
+
+    MP4s are already compressed, so entries are stored as-is. Large files
+    are copied with os.sendfile where available; the rest go through
+    zipfile.
+
+    Args:
+        paths: Local video file paths to include
+        out_path: Destination path of the archive
+
+    Returns:
+        out_path, once the archive is complete
+    """
+    with zipfile.ZipFile(out_path, "w", zipfile.ZIP_STORED) as zf:
+        for path in paths:
+            arcname = os.path.basename(path)
+            if hasattr(os, "sendfile") and os.path.getsize(path) >= SENDFILE_MIN_SIZE:
+                _write_stored_sendfile(zf, path, arcname)
+            else:
+                zf.write(path, arcname)
+    return out_path
@@ -11,88 +11,288 @@ Streamlit app for testing image generation features:
 5. Scene composition (composite 1-3 characters into scenes)
 """
 
+import importlib
+import io
 import os
+import shutil
 import sys
+import zipfile
+import pandas as pd
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.providers.image import (
-    TongyiImageProvider,
-    TONGYI_IMAGE_MODELS,
-    JiMengImageProvider,
-    JIMENG_IMAGE_MODELS,
+from src.providers.image.base import (
     CharacterViewMode,
     CharacterRef,
-    ImageTaskStatus,
 )
 
 
-def get_provider_name() -> str:
-    """Get the currently selected provider name."""
-    return st.session_state.get("provider_name", "tongyi")
+# Selectbox labels, keyed by option value (dict order is the option order)
+_PROVIDER_LABELS = {
+    "tongyi": "通义 (Tongyi)",
+    "jimeng": "即梦 Seedream (JiMeng)",
+}
+_OPTIMIZE_LABELS = {"standard": "标准优化", "fast": "快速优化", "无": "不优化"}
+_FRAME_SIZE_LABELS = {
+    "1664*928": "1664x928 (16:9 通义)",
+    "1280*720": "1280x720 (16:9 标准)",
+    "1920*1080": "1920x1080 (16:9 全高清)",
+    "928*1664": "928x1664 (9:16 竖屏)",
+}
+_SCENE_SIZE_LABELS = {
+    "1664*928": "1664x928 (16:9)",
+    "1280*720": "1280x720 (16:9)",
+    "1024*1024": "1024x1024 (1:1)",
+    "928*1664": "928x1664 (9:16)",
+}
+_STYLE_LABELS = {
+    "cinematic": "电影风格",
+    "realistic": "写实风格",
+    "anime": "动漫风格",
+    "artistic": "艺术风格",
+    "dramatic": "戏剧风格",
+}
+_CHARACTER_STYLE_LABELS = {
+    "realistic": "写实风格",
+    "anime": "动漫风格",
+    "cartoon": "卡通风格",
+    "3d": "3D渲染",
+    "watercolor": "水彩风格",
+}
+_CHARACTER_SIZE_LABELS = {
+    "1328*1328": "1328x1328 (1:1 方形)",
+    "1024*1024": "1024x1024 (1:1 方形)",
+    "1104*1472": "1104x1472 (3:4 竖版)",
+}
+_VIEW_MODE_LABELS = {
+    CharacterViewMode.SINGLE_IMAGE_THREE_VIEWS: "🖼️ 单张三视图 - 一张图包含正面/侧面/背面",
+    CharacterViewMode.THREE_SEPARATE_IMAGES: "📸 三张独立图 - 分别生成正面、侧面、背面",
+    CharacterViewMode.TURNAROUND_SHEET: "📐 角色转面图 - 专业游戏/动画设定图",
+}
+
+OUTPUT_DIRS = (
+    "./output",
+    "./output/images",
+    "./output/frames",
+    "./output/characters",
+    "./output/scenes",
+)
 
 
-def init_provider():
-    """Initialize the selected image provider."""
-    provider_name = get_provider_name()
-    cache_key = f"provider_{provider_name}"
+@st.cache_resource
+def _ensure_output_dirs():
+    """Create the output directories once per process instead of on every rerun."""
+    for path in OUTPUT_DIRS:
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+
+# Provider class per provider module; modules are imported only once selected
+_PROVIDER_CLASSES = {
+    "tongyi": "TongyiImageProvider",
+    "jimeng": "JiMengImageProvider",
+}
+
+
+def _load_provider_module(provider_name: str):
+    """Import a provider module on first use so cold start only pays for the selected one."""
+    return importlib.import_module(f"src.providers.image.{provider_name}")
+
+
+@st.cache_resource
+def _get_provider(provider_name: str):
+    """Create and initialize a provider once per process; providers hold no per-user state."""
+    provider_cls = getattr(_load_provider_module(provider_name), _PROVIDER_CLASSES[provider_name])
+    provider = provider_cls()
+    provider.initialize()
+    return provider
+
+
+@st.cache_resource
+def _warmup_executor() -> ThreadPoolExecutor:
+    """Background thread that initializes providers before the first action click."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="provider-warmup")
+
+
+def warm_provider(provider_name: str):
+    """
+    Start initializing the selected provider in the background.
+
+    Runs while the user fills in the form; _get_provider then either hits the
+    cache or waits on the in-progress initialization instead of starting its own.
+    Failures are not cached, so they resurface on the action click.
+    """
+    if st.session_state.get("warmed_provider") != provider_name:
+        st.session_state.warmed_provider = provider_name
+        _warmup_executor().submit(_get_provider, provider_name)
+
+
+def _models_for(provider_name: str) -> dict:
+    return getattr(_load_provider_module(provider_name), f"{provider_name.upper()}_IMAGE_MODELS")
+
+
+@st.cache_data(show_spinner=False)
+def _t2i_models(provider_name: str) -> dict:
+    """Text-to-image models; every JiMeng model is t2i, Tongyi is filtered by type."""
+    all_models = _models_for(provider_name)
+    if provider_name == "jimeng":
+        return dict(all_models)
+    return {k: v for k, v in all_models.items() if v.model_type == "t2i"}
 
-    if cache_key not in st.session_state:
-        if provider_name == "jimeng":
-            provider = JiMengImageProvider()
-        else:
-            provider = TongyiImageProvider()
-        provider.initialize()
-        st.session_state[cache_key] = provider
 
-    return st.session_state[cache_key]
+@st.cache_data(show_spinner=False)
+def _edit_models(provider_name: str) -> dict:
+    """Editing models; every JiMeng model supports editing, Tongyi is filtered by type."""
+    all_models = _models_for(provider_name)
+    if provider_name == "jimeng":
+        return dict(all_models)
+    return {k: v for k, v in all_models.items() if v.model_type == "edit"}
 
 
-def get_current_models() -> dict:
-    """Get models dict for the current provider."""
-    if get_provider_name() == "jimeng":
-        return JIMENG_IMAGE_MODELS
-    return TONGYI_IMAGE_MODELS
+# Parallel "download all" cap; keeps providers from throttling us
+MAX_DOWNLOAD_WORKERS = 8
 
 
-def is_jimeng() -> bool:
-    """Check if JiMeng provider is currently selected."""
-    return get_provider_name() == "jimeng"
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Process-wide HTTP session so image downloads reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _fetch_bytes(url: str) -> bytes:
+    """Fetch a generated image once; rendering, saving and bundling share the bytes."""
+    with _http_session().get(url, timeout=30) as response:
+        response.raise_for_status()
+        return response.content
 
 
-def download_image(url: str, save_dir: str = "./output/images") -> str:
-    """Download image from URL."""
-    os.makedirs(save_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"image_{timestamp}.png"
-    filepath = os.path.join(save_dir, filename)
+def download_image(url: str, save_dir: str = "./output/images", filename: Optional[str] = None) -> str:
+    """Save image from URL. save_dir must exist; see _ensure_output_dirs."""
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"image_{timestamp}.png"
+    filepath = Path(save_dir) / filename
 
-    response = requests.get(url)
-    response.raise_for_status()
+    # Already fetched for display, so this is a memory copy rather than a second request
+    filepath.write_bytes(_fetch_bytes(url))
 
-    with open(filepath, "wb") as f:
-        f.write(response.content)
+    return str(filepath)
 
-    return filepath
 
+@st.cache_data(ttl=1800, max_entries=64, show_spinner=False)
+def _thumb(url_or_path: str, max_w: int, version: Optional[tuple] = None) -> bytes:
+    """
+    Downscaled JPEG of a reference image, so previews are not re-fetched and re-decoded per rerun.
 
-def text_to_image_page():
+    version is the (mtime, size) of a local file, so a file rewritten under
+    the same name gets a fresh preview.
+    """
+    if url_or_path.startswith(("http://", "https://")):
+        im = Image.open(io.BytesIO(_fetch_bytes(url_or_path)))
+    else:
+        im = Image.open(url_or_path)
+    im.thumbnail((max_w, max_w * 4))
+    if im.mode not in ("RGB", "L"):
+        im = im.convert("RGB")
+    buf = io.BytesIO()
+    im.save(buf, "JPEG", quality=75)
+    return buf.getvalue()
+
+
+def _show_preview(url_or_path: str, width: int, caption: Optional[str] = None):
+    """Show a reference image preview; an unreachable or invalid image gets a note instead."""
+    try:
+        version = None
+        if not url_or_path.startswith(("http://", "https://")):
+            stat = os.stat(url_or_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+        st.image(_thumb(url_or_path, width, version), width=width, caption=caption)
+    except (requests.RequestException, OSError):
+        st.caption(f"无法加载预览: {url_or_path}")
+
+
+@st.cache_data(show_spinner=False)
+def _model_table(provider_name: str) -> pd.DataFrame:
+    """Sidebar model overview, one row per model, rendered as a single table element."""
+    rows = []
+    for name, info in _models_for(provider_name).items():
+        row = {"模型": name, "说明": info.description, "类型": info.model_type}
+        if hasattr(info, "sync_supported"):
+            row["同步"] = "✅" if info.sync_supported else "❌"
+        if hasattr(info, "max_input_images"):
+            row["最大输入图片"] = info.max_input_images
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("模型")
+
+
+def _bundle_download(urls: List[str], prefix: str) -> bytes:
+    """
+    Fetch images concurrently and pack them into one ZIP archive in memory.
+
+    Images are already compressed, so entries are stored without deflate.
+    """
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(urls))) as executor:
+        images = list(executor.map(_fetch_bytes, urls))
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for i, data in enumerate(images):
+            zf.writestr(f"{prefix}_{i + 1}.png", data)
+    return buf.getvalue()
+
+
+def _save_upload(uploaded, path: str):
+    """Stream an uploaded file to disk in 1 MiB chunks rather than materializing it."""
+    uploaded.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(uploaded, f, length=1 << 20)
+
+
+@st.cache_data(show_spinner=False)
+def _character_refs(characters_data: tuple) -> Tuple[List[CharacterRef], bool]:
+    """
+    Build the CharacterRef list for scene composition.
+
+    characters_data holds one (name, image_url, action, position) tuple per
+    slot; identical slot values on a rerun reuse the cached result.
+
+    Returns:
+        The character references and whether every slot has a reference image
+    """
+    characters = [
+        CharacterRef(name=name, image_url=image_url, action=action, position=position)
+        for name, image_url, action, position in characters_data
+    ]
+    return characters, all(c.image_url for c in characters)
+
+
+def text_to_image_page(provider_name: str, is_jimeng: bool):
     """Text-to-Image generation page."""
     st.header("🎨 文生图 Text-to-Image")
 
-    all_models = get_current_models()
+    all_models = _models_for(provider_name)
 
     # Model selection - for Tongyi filter t2i only, for JiMeng all models are t2i
-    if is_jimeng():
-        t2i_models = all_models
-    else:
-        t2i_models = {k: v for k, v in all_models.items() if v.model_type == "t2i"}
+    t2i_models = _t2i_models(provider_name)
 
     model = st.selectbox(
         "选择模型",
@@ -104,49 +304,56 @@ def text_to_image_page():
     model_info = all_models[model]
     sizes = model_info.sizes
 
-    col1, col2 = st.columns(2)
-    with col1:
-        size = st.selectbox("图像尺寸", options=sizes, index=0)
-    with col2:
-        n = st.slider("生成数量", min_value=1, max_value=4, value=1)
-
-    # Prompt input
-    prompt = st.text_area(
-        "提示词 (Prompt)",
-        placeholder="描述你想生成的图像...",
-        height=100,
-    )
-
-    # Provider-specific options
-    negative_prompt = None
-    extra_kwargs = {}
-
-    if is_jimeng():
+    # Batch the generation settings so editing them does not rerun the page
+    with st.form("t2i_form"):
         col1, col2 = st.columns(2)
         with col1:
-            optimize = st.selectbox(
-                "提示词优化",
-                options=["standard", "fast", "无"],
-                format_func=lambda x: {"standard": "标准优化", "fast": "快速优化", "无": "不优化"}.get(x, x),
-            )
-            if optimize != "无":
-                extra_kwargs["optimize_prompt"] = optimize
+            size = st.selectbox("图像尺寸", options=sizes, index=0)
         with col2:
-            watermark = st.checkbox("添加水印", value=False)
-    else:
-        negative_prompt = st.text_input(
-            "反向提示词 (Negative Prompt)",
-            placeholder="描述不想出现的内容...",
+            n = st.slider("生成数量", min_value=1, max_value=4, value=1)
+
+        # Prompt input
+        prompt = st.text_area(
+            "提示词 (Prompt)",
+            placeholder="描述你想生成的图像...",
+            height=100,
         )
-        col1, col2 = st.columns(2)
-        with col1:
-            prompt_extend = st.checkbox("智能提示词增强", value=True)
-            extra_kwargs["prompt_extend"] = prompt_extend
-        with col2:
-            watermark = st.checkbox("添加水印", value=False)
 
-    if st.button("🚀 生成图像", type="primary", disabled=not prompt):
-        provider = init_provider()
+        # Provider-specific options
+        negative_prompt = None
+        extra_kwargs = {}
+
+        if is_jimeng:
+            col1, col2 = st.columns(2)
+            with col1:
+                optimize = st.selectbox(
+                    "提示词优化",
+                    options=list(_OPTIMIZE_LABELS),
+                    format_func=_OPTIMIZE_LABELS.get,
+                )
+                if optimize != "无":
+                    extra_kwargs["optimize_prompt"] = optimize
+            with col2:
+                watermark = st.checkbox("添加水印", value=False)
+        else:
+            negative_prompt = st.text_input(
+                "反向提示词 (Negative Prompt)",
+                placeholder="描述不想出现的内容...",
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                prompt_extend = st.checkbox("智能提示词增强", value=True)
+                extra_kwargs["prompt_extend"] = prompt_extend
+            with col2:
+                watermark = st.checkbox("添加水印", value=False)
+
+        submitted = st.form_submit_button("🚀 生成图像", type="primary")
+
+    if submitted and not prompt:
+        st.warning("请输入提示词")
+
+    if submitted and prompt:
+        provider = _get_provider(provider_name)
 
         with st.spinner("正在生成图像..."):
             try:
@@ -166,7 +373,7 @@ def text_to_image_page():
                     cols = st.columns(min(len(task.image_urls), 4))
                     for i, url in enumerate(task.image_urls):
                         with cols[i % 4]:
-                            st.image(url, caption=f"图像 {i+1}")
+                            st.image(_fetch_bytes(url), caption=f"图像 {i+1}")
                             if st.button(f"下载图像 {i+1}", key=f"dl_{i}"):
                                 filepath = download_image(url)
                                 st.success(f"已保存到: {filepath}")
@@ -179,7 +386,7 @@ def text_to_image_page():
                 st.error(f"❌ 错误: {str(e)}")
 
 
-def frame_generation_page():
+def frame_generation_page(provider_name: str, is_jimeng: bool):
     """Frame generation page for video first/last frames."""
     st.header("🎬 视频帧生成 Frame Generation")
 
@@ -196,40 +403,6 @@ def frame_generation_page():
         horizontal=True,
     )
 
-    # Size selection
-    sizes = ["1664*928", "1280*720", "1920*1080", "928*1664"]
-    size_labels = {
-        "1664*928": "1664x928 (16:9 通义)",
-        "1280*720": "1280x720 (16:9 标准)",
-        "1920*1080": "1920x1080 (16:9 全高清)",
-        "928*1664": "928x1664 (9:16 竖屏)",
-    }
-    size = st.selectbox(
-        "帧尺寸",
-        options=sizes,
-        format_func=lambda x: size_labels.get(x, x),
-    )
-
-    # Scene prompt
-    prompt = st.text_area(
-        "场景描述",
-        placeholder="描述这一帧的场景内容...\n例如: 一个年轻女子站在樱花树下，微风吹过，花瓣飘落",
-        height=100,
-    )
-
-    # Style
-    style = st.selectbox(
-        "视觉风格",
-        options=["cinematic", "realistic", "anime", "artistic", "dramatic"],
-        format_func=lambda x: {
-            "cinematic": "电影风格",
-            "realistic": "写实风格",
-            "anime": "动漫风格",
-            "artistic": "艺术风格",
-            "dramatic": "戏剧风格",
-        }.get(x, x),
-    )
-
     # Character reference (if mode is character reference)
     character_ref = None
     if mode == "角色参考":
@@ -245,16 +418,14 @@ def frame_generation_page():
             if uploaded:
                 # Save temporarily
                 temp_path = f"./output/temp_{uploaded.name}"
-                os.makedirs("./output", exist_ok=True)
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded.getvalue())
+                _save_upload(uploaded, temp_path)
                 character_ref = temp_path
                 st.image(uploaded, width=200)
 
         elif ref_source == "输入URL":
             character_ref = st.text_input("角色图片URL")
             if character_ref:
-                st.image(character_ref, width=200)
+                _show_preview(character_ref, 200)
 
         elif ref_source == "使用上次生成":
             if "last_generated" in st.session_state and st.session_state.last_generated:
@@ -263,12 +434,39 @@ def frame_generation_page():
                     options=st.session_state.last_generated,
                 )
                 if character_ref:
-                    st.image(character_ref, width=200)
+                    _show_preview(character_ref, 200)
             else:
                 st.warning("没有上次生成的图片")
 
-    if st.button("🎬 生成帧", type="primary", disabled=not prompt):
-        provider = init_provider()
+    with st.form("frame_form"):
+        # Size selection
+        size = st.selectbox(
+            "帧尺寸",
+            options=list(_FRAME_SIZE_LABELS),
+            format_func=_FRAME_SIZE_LABELS.get,
+        )
+
+        # Scene prompt
+        prompt = st.text_area(
+            "场景描述",
+            placeholder="描述这一帧的场景内容...\n例如: 一个年轻女子站在樱花树下，微风吹过，花瓣飘落",
+            height=100,
+        )
+
+        # Style
+        style = st.selectbox(
+            "视觉风格",
+            options=list(_STYLE_LABELS),
+            format_func=_STYLE_LABELS.get,
+        )
+
+        submitted = st.form_submit_button("🎬 生成帧", type="primary")
+
+    if submitted and not prompt:
+        st.warning("请输入场景描述")
+
+    if submitted and prompt:
+        provider = _get_provider(provider_name)
 
         with st.spinner("正在生成帧图像..."):
             try:
@@ -288,7 +486,7 @@ def frame_generation_page():
 
                 if task.is_successful():
                     st.success("✅ 帧生成成功！")
-                    st.image(task.image_url, caption="生成的帧")
+                    st.image(_fetch_bytes(task.image_url), caption="生成的帧")
 
                     if st.button("💾 下载帧"):
                         filepath = download_image(task.image_url, "./output/frames")
@@ -302,7 +500,7 @@ def frame_generation_page():
                 st.error(f"❌ 错误: {str(e)}")
 
 
-def character_design_page():
+def character_design_page(provider_name: str, is_jimeng: bool):
     """Character design page."""
     st.header("👤 角色设计 Character Design")
 
@@ -322,28 +520,18 @@ def character_design_page():
         with col1:
             style = st.selectbox(
                 "艺术风格",
-                options=["realistic", "anime", "cartoon", "3d", "watercolor"],
-                format_func=lambda x: {
-                    "realistic": "写实风格",
-                    "anime": "动漫风格",
-                    "cartoon": "卡通风格",
-                    "3d": "3D渲染",
-                    "watercolor": "水彩风格",
-                }.get(x, x),
+                options=list(_CHARACTER_STYLE_LABELS),
+                format_func=_CHARACTER_STYLE_LABELS.get,
             )
         with col2:
             size = st.selectbox(
                 "图像尺寸",
-                options=["1328*1328", "1024*1024", "1104*1472"],
-                format_func=lambda x: {
-                    "1328*1328": "1328x1328 (1:1 方形)",
-                    "1024*1024": "1024x1024 (1:1 方形)",
-                    "1104*1472": "1104x1472 (3:4 竖版)",
-                }.get(x, x),
+                options=list(_CHARACTER_SIZE_LABELS),
+                format_func=_CHARACTER_SIZE_LABELS.get,
             )
 
         if st.button("🎨 生成正面图", type="primary", disabled=not char_desc):
-            provider = init_provider()
+            provider = _get_provider(provider_name)
 
             with st.spinner("正在生成角色正面图..."):
                 try:
@@ -355,7 +543,7 @@ def character_design_page():
 
                     if task.is_successful():
                         st.success("✅ 角色正面图生成成功！")
-                        st.image(task.image_url, caption="角色正面图")
+                        st.image(_fetch_bytes(task.image_url), caption="角色正面图")
 
                         # Store for three-view generation
                         st.session_state.character_front = task.image_url
@@ -393,16 +581,14 @@ def character_design_page():
                 uploaded = st.file_uploader("上传角色正面图", type=["png", "jpg", "jpeg"])
                 if uploaded:
                     temp_path = f"./output/temp_front_{uploaded.name}"
-                    os.makedirs("./output", exist_ok=True)
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded.getvalue())
+                    _save_upload(uploaded, temp_path)
                     st.session_state.character_front = temp_path
                     st.image(uploaded, width=300)
             else:
                 url = st.text_input("正面图URL")
                 if url:
                     st.session_state.character_front = url
-                    st.image(url, width=300)
+                    _show_preview(url, 300)
 
             char_desc = st.text_area(
                 "角色描述 (用于保持一致性)",
@@ -412,22 +598,14 @@ def character_design_page():
             if char_desc:
                 st.session_state.character_desc = char_desc
         else:
-            st.image(st.session_state.character_front, width=300, caption="当前角色正面图")
+            _show_preview(st.session_state.character_front, 300, caption="当前角色正面图")
 
         # View mode selection
         st.markdown("### 三视图模式")
         view_mode = st.radio(
             "选择生成模式",
-            options=[
-                CharacterViewMode.SINGLE_IMAGE_THREE_VIEWS,
-                CharacterViewMode.THREE_SEPARATE_IMAGES,
-                CharacterViewMode.TURNAROUND_SHEET,
-            ],
-            format_func=lambda x: {
-                CharacterViewMode.SINGLE_IMAGE_THREE_VIEWS: "🖼️ 单张三视图 - 一张图包含正面/侧面/背面",
-                CharacterViewMode.THREE_SEPARATE_IMAGES: "📸 三张独立图 - 分别生成正面、侧面、背面",
-                CharacterViewMode.TURNAROUND_SHEET: "📐 角色转面图 - 专业游戏/动画设定图",
-            }.get(x, str(x)),
+            options=list(_VIEW_MODE_LABELS),
+            format_func=_VIEW_MODE_LABELS.get,
             horizontal=False,
         )
 
@@ -446,7 +624,7 @@ def character_design_page():
             type="primary",
             disabled="character_front" not in st.session_state,
         ):
-            provider = init_provider()
+            provider = _get_provider(provider_name)
 
             with st.spinner("正在生成角色三视图..."):
                 try:
@@ -466,16 +644,19 @@ def character_design_page():
                             labels = ["侧面", "正面", "背面"]
                             for i, url in enumerate(task.image_urls):
                                 with cols[i % 3]:
-                                    st.image(url, caption=labels[i] if i < 3 else f"图{i+1}")
+                                    st.image(_fetch_bytes(url), caption=labels[i] if i < 3 else f"图{i+1}")
                         else:
-                            st.image(task.image_url, caption="角色设定图")
+                            st.image(_fetch_bytes(task.image_url), caption="角色设定图")
 
                         st.session_state.character_views = task.image_urls
 
-                        if st.button("💾 下载全部"):
-                            for i, url in enumerate(task.image_urls):
-                                filepath = download_image(url, "./output/characters")
-                                st.success(f"已保存: {filepath}")
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        st.download_button(
+                            "💾 下载全部 (zip)",
+                            data=_bundle_download(task.image_urls, "character"),
+                            file_name=f"character_views_{timestamp}.zip",
+                            mime="application/zip",
+                        )
 
                     else:
                         st.error(f"❌ 生成失败: {task.error_message}")
@@ -484,7 +665,7 @@ def character_design_page():
                     st.error(f"❌ 错误: {str(e)}")
 
 
-def image_editing_page():
+def image_editing_page(provider_name: str, is_jimeng: bool):
     """Image editing page."""
     st.header("✏️ 图像编辑 Image Editing")
 
@@ -496,7 +677,7 @@ def image_editing_page():
     """)
 
     # Image input - JiMeng supports up to 14, Tongyi up to 3
-    max_images = 14 if is_jimeng() else 3
+    max_images = 14 if is_jimeng else 3
     st.subheader(f"输入图像 (最多{max_images}张)")
 
     images = []
@@ -517,9 +698,7 @@ def image_editing_page():
                 uploaded = st.file_uploader(f"上传图{i+1}", type=["png", "jpg", "jpeg"], key=f"upload_{i}")
                 if uploaded:
                     temp_path = f"./output/temp_edit_{i}_{uploaded.name}"
-                    os.makedirs("./output", exist_ok=True)
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded.getvalue())
+                    _save_upload(uploaded, temp_path)
                     images.append(temp_path)
                     st.image(uploaded, width=150)
 
@@ -527,35 +706,37 @@ def image_editing_page():
                 url = st.text_input(f"URL", key=f"url_{i}")
                 if url:
                     images.append(url)
-                    st.image(url, width=150)
+                    _show_preview(url, 150)
 
-    # Edit model - for JiMeng all models support editing, for Tongyi filter edit type
-    all_models = get_current_models()
-    if is_jimeng():
-        edit_models = all_models
-    else:
-        edit_models = {k: v for k, v in all_models.items() if v.model_type == "edit"}
-    model = st.selectbox(
-        "编辑模型",
-        options=list(edit_models.keys()),
-        format_func=lambda x: f"{x} - {edit_models[x].description}",
-    )
+    with st.form("edit_form"):
+        # Edit model - for JiMeng all models support editing, for Tongyi filter edit type
+        edit_models = _edit_models(provider_name)
+        model = st.selectbox(
+            "编辑模型",
+            options=list(edit_models.keys()),
+            format_func=lambda x: f"{x} - {edit_models[x].description}",
+        )
 
-    # Edit prompt
-    prompt = st.text_area(
-        "编辑指令",
-        placeholder="描述如何编辑图像...\n例如: 把图1中的女生的衣服换成图2中的款式",
-        height=100,
-    )
+        # Edit prompt
+        prompt = st.text_area(
+            "编辑指令",
+            placeholder="描述如何编辑图像...\n例如: 把图1中的女生的衣服换成图2中的款式",
+            height=100,
+        )
 
-    col1, col2 = st.columns(2)
-    with col1:
-        n = st.slider("输出数量", min_value=1, max_value=4, value=1)
-    with col2:
-        size = st.text_input("输出尺寸 (可选)", placeholder="如: 1024*1024")
+        col1, col2 = st.columns(2)
+        with col1:
+            n = st.slider("输出数量", min_value=1, max_value=4, value=1)
+        with col2:
+            size = st.text_input("输出尺寸 (可选)", placeholder="如: 1024*1024")
+
+        submitted = st.form_submit_button("✨ 编辑图像", type="primary", disabled=not images)
+
+    if submitted and not prompt:
+        st.warning("请输入编辑指令")
 
-    if st.button("✨ 编辑图像", type="primary", disabled=not images or not prompt):
-        provider = init_provider()
+    if submitted and prompt:
+        provider = _get_provider(provider_name)
 
         with st.spinner("正在编辑图像..."):
             try:
@@ -573,7 +754,7 @@ def image_editing_page():
                     cols = st.columns(min(len(task.image_urls), 4))
                     for i, url in enumerate(task.image_urls):
                         with cols[i % 4]:
-                            st.image(url, caption=f"结果 {i+1}")
+                            st.image(_fetch_bytes(url), caption=f"结果 {i+1}")
 
                     st.session_state.last_generated = task.image_urls
                 else:
@@ -583,11 +764,95 @@ def image_editing_page():
                 st.error(f"❌ 错误: {str(e)}")
 
 
-def scene_composition_page():
+@st.fragment
+def _character_slot(i: int):
+    """
+    Render one scene-composition character slot.
+
+    Runs as a fragment so editing a slot only reruns that slot. Fragment
+    return values are dropped on fragment reruns, so the slot's
+    (name, image_url, action, position) is published to session_state.
+    """
+    with st.expander(f"角色 {i+1}", expanded=True):
+        col_name, col_pos = st.columns(2)
+        with col_name:
+            name = st.text_input(
+                "角色名称",
+                value=f"角色{i+1}",
+                key=f"sc_name_{i}",
+            )
+        with col_pos:
+            position = st.selectbox(
+                "位置",
+                options=["", "左侧", "中间", "右侧", "画面中央"],
+                key=f"sc_pos_{i}",
+            )
+
+        action = st.text_input(
+            "动作描述",
+            placeholder="例如：微笑着看向镜头、正在递给对方一本书...",
+            key=f"sc_action_{i}",
+        )
+
+        # Image source
+        ref_source = st.radio(
+            "参考图来源",
+            options=["上传图片", "输入URL", "使用之前的角色设计"],
+            horizontal=True,
+            key=f"sc_source_{i}",
+        )
+
+        image_url = None
+        if ref_source == "上传图片":
+            uploaded = st.file_uploader(
+                "上传正面参考图",
+                type=["png", "jpg", "jpeg"],
+                key=f"sc_upload_{i}",
+            )
+            if uploaded:
+                temp_path = f"./output/temp_scene_char_{i}_{uploaded.name}"
+                _save_upload(uploaded, temp_path)
+                image_url = temp_path
+                st.image(uploaded, width=150)
+
+        elif ref_source == "输入URL":
+            image_url = st.text_input(
+                "角色正面图URL",
+                key=f"sc_url_{i}",
+            )
+            if image_url:
+                _show_preview(image_url, 150)
+
+        elif ref_source == "使用之前的角色设计":
+            prev_images = []
+            if "character_front" in st.session_state:
+                prev_images.append(st.session_state.character_front)
+            if "last_generated" in st.session_state:
+                prev_images.extend(st.session_state.last_generated)
+            if prev_images:
+                image_url = st.selectbox(
+                    "选择图片",
+                    options=prev_images,
+                    key=f"sc_prev_{i}",
+                )
+                if image_url:
+                    _show_preview(image_url, 150)
+            else:
+                st.warning("没有可用的之前生成的图片")
+
+    key = f"sc_char_{i}"
+    previous = st.session_state.get(key)
+    st.session_state[key] = (name, image_url, action, position)
+    # Readiness gates the generate button outside the fragment; refresh the page when it flips
+    if previous is not None and bool(previous[1]) != bool(image_url):
+        st.rerun()
+
+
+def scene_composition_page(provider_name: str, is_jimeng: bool):
     """Scene composition page - composite characters into scenes."""
     st.header("🎭 场景合成 Scene Composition")
 
-    max_chars = 14 if is_jimeng() else 3
+    max_chars = 14 if is_jimeng else 3
     st.markdown(f"""
     将角色合成到指定场景中，保持角色外貌一致性。
     - 每个角色需要一张**正面参考图**
@@ -605,84 +870,9 @@ def scene_composition_page():
 
     # Character slots
     st.subheader("角色设定")
-    characters_data = []
-
     for i in range(num_chars):
-        with st.expander(f"角色 {i+1}", expanded=True):
-            col_name, col_pos = st.columns(2)
-            with col_name:
-                name = st.text_input(
-                    "角色名称",
-                    value=f"角色{i+1}",
-                    key=f"sc_name_{i}",
-                )
-            with col_pos:
-                position = st.selectbox(
-                    "位置",
-                    options=["", "左侧", "中间", "右侧", "画面中央"],
-                    key=f"sc_pos_{i}",
-                )
-
-            action = st.text_input(
-                "动作描述",
-                placeholder="例如：微笑着看向镜头、正在递给对方一本书...",
-                key=f"sc_action_{i}",
-            )
-
-            # Image source
-            ref_source = st.radio(
-                "参考图来源",
-                options=["上传图片", "输入URL", "使用之前的角色设计"],
-                horizontal=True,
-                key=f"sc_source_{i}",
-            )
-
-            image_url = None
-            if ref_source == "上传图片":
-                uploaded = st.file_uploader(
-                    "上传正面参考图",
-                    type=["png", "jpg", "jpeg"],
-                    key=f"sc_upload_{i}",
-                )
-                if uploaded:
-                    temp_path = f"./output/temp_scene_char_{i}_{uploaded.name}"
-                    os.makedirs("./output", exist_ok=True)
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded.getvalue())
-                    image_url = temp_path
-                    st.image(uploaded, width=150)
-
-            elif ref_source == "输入URL":
-                image_url = st.text_input(
-                    "角色正面图URL",
-                    key=f"sc_url_{i}",
-                )
-                if image_url:
-                    st.image(image_url, width=150)
-
-            elif ref_source == "使用之前的角色设计":
-                prev_images = []
-                if "character_front" in st.session_state:
-                    prev_images.append(st.session_state.character_front)
-                if "last_generated" in st.session_state:
-                    prev_images.extend(st.session_state.last_generated)
-                if prev_images:
-                    image_url = st.selectbox(
-                        "选择图片",
-                        options=prev_images,
-                        key=f"sc_prev_{i}",
-                    )
-                    if image_url:
-                        st.image(image_url, width=150)
-                else:
-                    st.warning("没有可用的之前生成的图片")
-
-            characters_data.append({
-                "name": name,
-                "image_url": image_url,
-                "action": action,
-                "position": position,
-            })
+        _character_slot(i)
+    characters_data = [st.session_state[f"sc_char_{i}"] for i in range(num_chars)]
 
     # Scene description
     st.subheader("场景设定")
@@ -711,88 +901,65 @@ def scene_composition_page():
                 )
                 if bg_uploaded:
                     bg_path = f"./output/temp_scene_bg_{bg_uploaded.name}"
-                    os.makedirs("./output", exist_ok=True)
-                    with open(bg_path, "wb") as f:
-                        f.write(bg_uploaded.getvalue())
+                    _save_upload(bg_uploaded, bg_path)
                     background_image = bg_path
                     st.image(bg_uploaded, width=200)
             else:
                 background_image = st.text_input("背景图URL", key="sc_bg_url")
                 if background_image:
-                    st.image(background_image, width=200)
+                    _show_preview(background_image, 200)
 
     # Generation settings
     st.subheader("生成设置")
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        all_models = get_current_models()
-        if is_jimeng():
-            sc_models = all_models
-        else:
-            sc_models = {k: v for k, v in all_models.items() if v.model_type == "edit"}
-        sc_model_keys = list(sc_models.keys())
-        default_idx = 0
-        if "qwen-image-edit-max" in sc_models:
-            default_idx = sc_model_keys.index("qwen-image-edit-max")
-        model = st.selectbox(
-            "模型",
-            options=sc_model_keys,
-            index=default_idx,
-            format_func=lambda x: f"{x}",
-            key="sc_model",
-        )
-    with col2:
-        if is_jimeng():
-            sc_sizes = all_models[model].sizes
-        else:
-            sc_sizes = ["1664*928", "1280*720", "1024*1024", "928*1664"]
-        size = st.selectbox(
-            "输出尺寸",
-            options=sc_sizes,
-            format_func=lambda x: {
-                "1664*928": "1664x928 (16:9)",
-                "1280*720": "1280x720 (16:9)",
-                "1024*1024": "1024x1024 (1:1)",
-                "928*1664": "928x1664 (9:16)",
-            }.get(x, x),
-            key="sc_size",
-        )
-    with col3:
-        n = st.slider("生成数量", min_value=1, max_value=4, value=2, key="sc_n")
-
-    style = st.selectbox(
-        "视觉风格",
-        options=["cinematic", "realistic", "anime", "artistic", "dramatic"],
-        format_func=lambda x: {
-            "cinematic": "电影风格",
-            "realistic": "写实风格",
-            "anime": "动漫风格",
-            "artistic": "艺术风格",
-            "dramatic": "戏剧风格",
-        }.get(x, x),
-        key="sc_style",
+    all_models = _models_for(provider_name)
+    sc_models = _edit_models(provider_name)
+    sc_model_keys = list(sc_models.keys())
+    default_idx = 0
+    if "qwen-image-edit-max" in sc_models:
+        default_idx = sc_model_keys.index("qwen-image-edit-max")
+    # Kept outside the form: JiMeng size options depend on the chosen model
+    model = st.selectbox(
+        "模型",
+        options=sc_model_keys,
+        index=default_idx,
+        format_func=lambda x: f"{x}",
+        key="sc_model",
     )
 
     # Validate and generate
-    all_chars_ready = all(d["image_url"] for d in characters_data)
+    characters, all_chars_ready = _character_refs(tuple(characters_data))
     can_generate = all_chars_ready and scene_description
 
     if not all_chars_ready:
         st.warning("请为每个角色提供参考图片")
 
-    if st.button("🎭 合成场景", type="primary", disabled=not can_generate):
-        provider = init_provider()
+    with st.form("sc_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            if is_jimeng:
+                sc_sizes = all_models[model].sizes
+            else:
+                sc_sizes = list(_SCENE_SIZE_LABELS)
+            size = st.selectbox(
+                "输出尺寸",
+                options=sc_sizes,
+                format_func=lambda x: _SCENE_SIZE_LABELS.get(x, x),
+                key="sc_size",
+            )
+        with col2:
+            n = st.slider("生成数量", min_value=1, max_value=4, value=2, key="sc_n")
+
+        style = st.selectbox(
+            "视觉风格",
+            options=list(_STYLE_LABELS),
+            format_func=_STYLE_LABELS.get,
+            key="sc_style",
+        )
+
+        submitted = st.form_submit_button("🎭 合成场景", type="primary", disabled=not can_generate)
 
-        # Build CharacterRef list
-        characters = []
-        for d in characters_data:
-            characters.append(CharacterRef(
-                name=d["name"],
-                image_url=d["image_url"],
-                action=d["action"],
-                position=d["position"],
-            ))
+    if submitted:
+        provider = _get_provider(provider_name)
 
         with st.spinner("正在合成场景...（可能需要较长时间）"):
             try:
@@ -812,15 +979,19 @@ def scene_composition_page():
                     cols = st.columns(min(len(task.image_urls), 4))
                     for i, url in enumerate(task.image_urls):
                         with cols[i % 4]:
-                            st.image(url, caption=f"场景 {i+1}")
+                            st.image(_fetch_bytes(url), caption=f"场景 {i+1}")
 
                     st.session_state.last_generated = task.image_urls
 
                     # Download all
-                    if st.button("💾 下载全部场景图", key="sc_download"):
-                        for i, url in enumerate(task.image_urls):
-                            filepath = download_image(url, "./output/scenes")
-                            st.success(f"已保存: {filepath}")
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    st.download_button(
+                        "💾 下载全部场景图 (zip)",
+                        data=_bundle_download(task.image_urls, "scene"),
+                        file_name=f"scenes_{timestamp}.zip",
+                        mime="application/zip",
+                        key="sc_download",
+                    )
                 else:
                     st.error(f"❌ 合成失败: {task.error_message}")
 
@@ -837,6 +1008,8 @@ def main():
         layout="wide",
     )
 
+    _ensure_output_dirs()
+
     st.title("🎨 AI 图像生成测试")
     st.markdown("测试图像生成 Provider 的各项功能")
 
@@ -847,16 +1020,15 @@ def main():
         # Provider selector
         provider_name = st.selectbox(
             "图像 Provider",
-            options=["tongyi", "jimeng"],
-            format_func=lambda x: {
-                "tongyi": "通义 (Tongyi)",
-                "jimeng": "即梦 Seedream (JiMeng)",
-            }.get(x, x),
+            options=list(_PROVIDER_LABELS),
+            format_func=_PROVIDER_LABELS.get,
             key="provider_name",
         )
+        warm_provider(provider_name)
+        is_jimeng = provider_name == "jimeng"
 
         if st.button("🔌 测试连接"):
-            provider = init_provider()
+            provider = _get_provider(provider_name)
             result = provider.test_connection()
             if result["success"]:
                 st.success("✅ 连接成功")
@@ -865,15 +1037,7 @@ def main():
 
         st.divider()
         st.markdown("### 可用模型")
-        current_models = get_current_models()
-        for name, info in current_models.items():
-            with st.expander(name):
-                st.markdown(f"**{info.description}**")
-                st.markdown(f"- 类型: {info.model_type}")
-                if hasattr(info, "sync_supported"):
-                    st.markdown(f"- 同步: {'✅' if info.sync_supported else '❌'}")
-                if hasattr(info, "max_input_images"):
-                    st.markdown(f"- 最大输入图片: {info.max_input_images}")
+        st.table(_model_table(provider_name))
 
     # Main content - tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -885,19 +1049,19 @@ def main():
     ])
 
     with tab1:
-        text_to_image_page()
+        text_to_image_page(provider_name, is_jimeng)
 
     with tab2:
-        frame_generation_page()
+        frame_generation_page(provider_name, is_jimeng)
 
     with tab3:
-        character_design_page()
+        character_design_page(provider_name, is_jimeng)
 
     with tab4:
-        image_editing_page()
+        image_editing_page(provider_name, is_jimeng)
 
     with tab5:
-        scene_composition_page()
+        scene_composition_page(provider_name, is_jimeng)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+"""
+Shared Database Instances
+
+MCP servers running in the same process share one Database per database
+file instead of each constructing its own (and re-running schema
+initialization).
+
+It also provides the thread pool MCP tool handlers use for blocking
+database work, so one server can serve concurrent tool calls. shutdown()
+drains that pool and closes the shared databases; it runs at interpreter
+exit.
+
+Usage:
+    from mcp_servers._db_pool import get_db, in_db_thread
+    db = get_db()
+
+    @mcp.tool()
+    @in_db_thread
+    def get_project(project_id: int) -> dict: ...
+"""
+
+import asyncio
+import atexit
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from story_generator.database import Database
+
+DEFAULT_DB_PATH = "data/story_generator.db"
+
+# Upper bound on concurrent blocking DB calls across all servers in the process
+DB_MAX_WORKERS = 8
+
+_instances: Dict[str, Database] = {}
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=DB_MAX_WORKERS, thread_name_prefix="mcp-db")
+
+
+def _pool_key(db_path: str) -> str:
+    """Normalize a database path so equivalent spellings share an instance."""
+    if db_path == ":memory:":
+        return db_path
+    return os.path.realpath(db_path)
+
+
+def get_db(db_path: str = DEFAULT_DB_PATH) -> Database:
+    """
+    Get the process-wide Database for a database file.
+
+    Args:
+        db_path: SQLite database path, or ":memory:" for a shared in-memory database
+
+    Returns:
+        The Database instance for that path, created on first use
+    """
+    key = _pool_key(db_path)
+    db = _instances.get(key)
+    if db is None:
+        with _lock:
+            db = _instances.get(key)
+            if db is None:
+                db = Database(db_path)
+                _instances[key] = db
+    return db
+
+
+def in_db_thread(fn: Callable) -> Callable:
+    """
+    Turn a blocking handler into a coroutine that runs it on the DB thread pool.
+
+    FastMCP awaits async handlers on its event loop, so independent tool calls
+    overlap instead of queueing behind each other's database work.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+    return wrapper
+
+
+def shutdown():
+    """Wait for running DB calls to finish, then close and forget every shared Database."""
+    _executor.shutdown(wait=True)
+    with _lock:
+        for db in _instances.values():
+            db.close()
+        _instances.clear()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,78 @@
+"""
+Tool Registration from Cached Schemas
+
+fast_tool registers a handler like @mcp.tool(), but when the server's schema
+cache (see _schema_cache) already holds the tool's description, parameters
+and output schema, the FunctionTool is built from them directly instead of
+re-deriving them from the signature.
+
+Only public FastMCP API is used: FunctionTool.from_function on a cache miss,
+and the FunctionTool model itself on a hit. Calls run through the stock
+FunctionTool.run, which keeps a cached TypeAdapter per handler.
+
+Usage:
+    from mcp_servers._fast_tool import fast_tool
+
+    @fast_tool(mcp)
+    @in_db_thread
+    def get_project(project_id: int) -> dict: ...
+"""
+
+from typing import Callable
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
+
+from mcp_servers._schema_cache import schema_cache_for
+from mcp_servers._serializer import tool_serializer
+
+
+def fast_tool(mcp: FastMCP, **kwargs) -> Callable[[Callable], FunctionTool]:
+    """
+    Decorator to register a function as a tool, reusing cached schemas.
+
+    Args:
+        mcp: Server to register the tool on
+        **kwargs: Passed to FunctionTool.from_function (name, description, ...);
+            serializer defaults to the servers' shared tool_serializer
+
+    Returns:
+        Decorator returning the registered tool, like @mcp.tool()
+    """
+    def decorator(fn: Callable) -> FunctionTool:
+        kwargs.setdefault("serializer", tool_serializer)
+        tool_name = kwargs.get("name") or fn.__name__
+
+        # Explicit schema options bypass the cache, which only holds derived schemas
+        cache = schema_cache_for(mcp)
+        if "exclude_args" in kwargs or "output_schema" in kwargs:
+            cache = None
+
+        cached = cache.get(tool_name) if cache else None
+        if cached:
+            tool = FunctionTool(
+                fn=fn,
+                name=tool_name,
+                title=kwargs.get("title"),
+                description=kwargs.get("description") or cached["description"],
+                parameters=cached["parameters"],
+                output_schema=cached["output_schema"],
+                annotations=kwargs.get("annotations"),
+                tags=kwargs.get("tags") or set(),
+                serializer=kwargs["serializer"],
+                meta=kwargs.get("meta"),
+                enabled=kwargs.get("enabled", True),
+            )
+        else:
+            tool = FunctionTool.from_function(fn, **kwargs)
+            if cache:
+                cache.put(tool_name, {
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                    "output_schema": tool.output_schema,
+                })
+
+        mcp.add_tool(tool)
+        return tool
+
+    return decorator
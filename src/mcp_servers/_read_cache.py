@@ -0,0 +1,140 @@
+"""
+Read Cache for MCP Servers
+
+MCP clients often read the same project, episode or shot several times within
+one agent turn. Read tools cache their results here for a few seconds; any
+write tool clears the cache, and the short TTL bounds staleness from writers
+in other processes.
+
+Cached values are shared between callers and must not be mutated.
+
+Usage:
+    @mcp.tool()
+    @cached_read
+    def get_project(project_id: int) -> dict: ...
+
+    @mcp.tool()
+    @invalidates_reads
+    def update_project(project_id: int, ...) -> dict: ...
+
+    @mcp.resource("project://{project_id}")
+    @cached_read
+    @in_db_thread
+    def get_project_resource(project_id: int) -> dict: ...
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every clear(); read it before computing a value to set."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, dropping it if expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        If generation is given and the cache has been cleared since, the
+        value may predate that write and is dropped instead.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+
+# Shared by all servers in the process: a project read includes its
+# characters, episodes and shots, so any write may affect any cached read.
+read_cache = TTLCache(maxsize=1024, ttl=5.0)
+
+
+def cached_read(fn: Callable) -> Callable:
+    """
+    Cache a read function's result, keyed by its name and bound arguments.
+
+    Coroutine functions (such as in_db_thread handlers) are checked on the
+    event loop, so a hit never waits for a database thread. A result is
+    not stored if a write cleared the cache while it was being read.
+    """
+    signature = inspect.signature(fn)
+
+    def cache_key(args, kwargs) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (fn.__module__, fn.__qualname__, tuple(bound.arguments.items()))
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            key = cache_key(args, kwargs)
+            hit, value = read_cache.get(key)
+            if hit:
+                return value
+            generation = read_cache.generation
+            value = await fn(*args, **kwargs)
+            read_cache.set(key, value, generation)
+            return value
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = cache_key(args, kwargs)
+        hit, value = read_cache.get(key)
+        if hit:
+            return value
+        generation = read_cache.generation
+        value = fn(*args, **kwargs)
+        read_cache.set(key, value, generation)
+        return value
+
+    return wrapper
+
+
+def invalidates_reads(fn: Callable) -> Callable:
+    """Clear the read cache once a write function has run."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            read_cache.clear()
+
+    return wrapper
@@ -0,0 +1,113 @@
+"""
+On-disk Cache for MCP Tool Schemas
+
+Deriving a tool's input and output schema from its signature means building
+a pydantic TypeAdapter per tool, on every server start. The derived schemas
+are stored under ~/.cache/movie_generator/mcp_schemas, keyed by a hash of the
+server's source file, the helper modules its tools are built with, and the
+fastmcp/pydantic versions, so later starts register tools straight from the
+cached schemas.
+
+Usage:
+    mcp = FastMCP("Project Server")
+    schema_cache = use_schema_cache(mcp, __file__)
+
+    @fast_tool(mcp)
+    def get_project(project_id: int) -> dict: ...
+
+    schema_cache.save()
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import fastmcp
+import pydantic
+from fastmcp import FastMCP
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "movie_generator" / "mcp_schemas"
+
+# Modules that shape tool schemas besides the server file itself: the
+# registration and wrapper helpers here, and the database signatures tools wrap
+_PACKAGE_DIR = Path(__file__).parent
+HELPER_SOURCES = sorted(_PACKAGE_DIR.glob("_*.py")) + [
+    _PACKAGE_DIR.parent / "story_generator" / "database.py",
+]
+
+_caches: Dict[str, "SchemaCache"] = {}
+
+
+class SchemaCache:
+    """Derived tool schemas for one server source file."""
+
+    def __init__(self, source_path: str, cache_dir: Path = CACHE_DIR):
+        source = Path(source_path)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(source.read_bytes())
+        for helper in HELPER_SOURCES:
+            digest.update(helper.read_bytes())
+        digest.update(f"fastmcp={fastmcp.__version__};pydantic={pydantic.VERSION}".encode())
+
+        self.server_name = source.stem
+        self.path = cache_dir / f"{self.server_name}_{digest.hexdigest()}.json"
+        self._schemas = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, tool_name: str) -> Optional[dict]:
+        """Cached description, parameters and output_schema for a tool, if any."""
+        return self._schemas.get(tool_name)
+
+    def put(self, tool_name: str, schema: dict):
+        self._schemas[tool_name] = schema
+        self._dirty = True
+
+    def save(self):
+        """Write the cache if tools were added, replacing files for older source versions."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._schemas, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+            for stale in self.path.parent.glob(f"{self.server_name}_*.json"):
+                if stale != self.path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            # A read-only home directory only costs the speedup
+            return
+        self._dirty = False
+
+
+def use_schema_cache(mcp: FastMCP, source_path: str) -> SchemaCache:
+    """
+    Enable the schema cache for tools registered on a server with fast_tool.
+
+    Args:
+        mcp: Server whose tools should use the cache
+        source_path: The server module's source file, usually __file__
+
+    Returns:
+        The server's SchemaCache; call save() once all tools are registered
+    """
+    cache = SchemaCache(source_path)
+    _caches[mcp.name] = cache
+    return cache
+
+
+def schema_cache_for(mcp: FastMCP) -> Optional[SchemaCache]:
+    """The schema cache enabled for a server, if any."""
+    return _caches.get(mcp.name)
@@ -0,0 +1,32 @@
+"""
+Tool Result Serialization
+
+FastMCP renders a tool's return value to JSON text for the client with
+pydantic_core. When orjson is installed, servers use it instead: it encodes
+large results such as batch submissions and shot lists about twice as fast,
+with the same output for the plain dicts and lists tools return.
+
+Usage:
+    from mcp_servers._serializer import tool_serializer
+    mcp = FastMCP("Video Server", tool_serializer=tool_serializer)
+"""
+
+from typing import Any
+
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def tool_serializer(data: Any) -> str:
+    """Serialize a tool result to JSON text, falling back to FastMCP's encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson doesn't know (sets, pydantic models, ...) take the slow path
+            pass
+    return pydantic_core.to_json(data, fallback=str).decode()
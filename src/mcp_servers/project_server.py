@@ -22,17 +22,24 @@ if str(_src_dir) not in sys.path:
 
 from fastmcp import FastMCP
 
-from story_generator.database import Database
-from story_generator.models import Project, Character, Episode
+from mcp_servers._db_pool import get_db, in_db_thread
+from mcp_servers._fast_tool import fast_tool
+from mcp_servers._read_cache import cached_read, invalidates_reads
+from mcp_servers._schema_cache import use_schema_cache
+from mcp_servers._serializer import tool_serializer
+from story_generator.models import Project, Character, Episode, MajorEvent
 
 # Initialize MCP server and database
-mcp = FastMCP("Project Server")
-db = Database()
+mcp = FastMCP("Project Server", tool_serializer=tool_serializer)
+schema_cache = use_schema_cache(mcp, __file__)
+db = get_db()
 
 
 # ==================== Project Tools ====================
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def create_project(
     name: str,
     description: str,
@@ -73,7 +80,8 @@ def create_project(
     return {"project_id": project_id, "name": name}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def get_project(project_id: int) -> dict:
     """
     Get project details including characters and episodes.
@@ -84,13 +92,21 @@ def get_project(project_id: int) -> dict:
     Returns:
         Project data as dict, or error dict if not found
     """
+    return _get_project(project_id)
+
+
+@cached_read
+def _get_project(project_id: int) -> dict:
+    """Cached lookup behind get_project and its resource."""
     project = db.get_project(project_id)
     if not project:
         return {"error": "Project not found", "project_id": project_id}
     return project.to_dict()
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def update_project(
     project_id: int,
     name: Optional[str] = None,
@@ -119,33 +135,25 @@ def update_project(
     Returns:
         Success status dict
     """
-    project = db.get_project(project_id)
-    if not project:
+    # Update only provided fields; the row count doubles as the existence check
+    fields = {
+        "name": name,
+        "description": description,
+        "genre": genre,
+        "style": style,
+        "target_audience": target_audience,
+        "num_episodes": num_episodes,
+        "episode_duration": episode_duration,
+        "max_video_duration": max_video_duration,
+    }
+    if not db.update_project_fields(project_id, {k: v for k, v in fields.items() if v is not None}):
         return {"error": "Project not found", "project_id": project_id}
-
-    # Update only provided fields
-    if name is not None:
-        project.name = name
-    if description is not None:
-        project.description = description
-    if genre is not None:
-        project.genre = genre
-    if style is not None:
-        project.style = style
-    if target_audience is not None:
-        project.target_audience = target_audience
-    if num_episodes is not None:
-        project.num_episodes = num_episodes
-    if episode_duration is not None:
-        project.episode_duration = episode_duration
-    if max_video_duration is not None:
-        project.max_video_duration = max_video_duration
-
-    db.update_project(project)
     return {"success": True, "project_id": project_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def delete_project(project_id: int) -> dict:
     """
     Delete a project and all its associated data (characters, episodes, shots).
@@ -156,15 +164,14 @@ def delete_project(project_id: int) -> dict:
     Returns:
         Success status dict
     """
-    project = db.get_project(project_id)
-    if not project:
+    if not db.delete_project(project_id):
         return {"error": "Project not found", "project_id": project_id}
-
-    db.delete_project(project_id)
     return {"success": True, "project_id": project_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@cached_read
 def list_projects() -> list:
     """
     List all projects (basic info only, without characters and episodes).
@@ -172,23 +179,14 @@ def list_projects() -> list:
     Returns:
         List of project dicts with basic info
     """
-    projects = db.list_projects()
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "genre": p.genre,
-            "num_episodes": p.num_episodes,
-            "created_at": p.created_at.isoformat(),
-            "updated_at": p.updated_at.isoformat(),
-        }
-        for p in projects
-    ]
+    return db.list_projects_summary()
 
 
 # ==================== Character Tools ====================
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def create_character(
     project_id: int,
     name: str,
@@ -215,11 +213,6 @@ def create_character(
     Returns:
         dict with character_id and name
     """
-    # Verify project exists
-    project = db.get_project(project_id)
-    if not project:
-        return {"error": "Project not found", "project_id": project_id}
-
     character = Character(
         project_id=project_id,
         name=name,
@@ -230,11 +223,14 @@ def create_character(
         relationships=relationships,
         visual_description=visual_description
     )
-    char_id = db.create_character(character)
+    char_id = db.create_character_checked(character)
+    if char_id is None:
+        return {"error": "Project not found", "project_id": project_id}
     return {"character_id": char_id, "name": name}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def get_character(character_id: int) -> dict:
     """
     Get character details.
@@ -245,13 +241,21 @@ def get_character(character_id: int) -> dict:
     Returns:
         Character data as dict, or error dict if not found
     """
+    return _get_character(character_id)
+
+
+@cached_read
+def _get_character(character_id: int) -> dict:
+    """Cached lookup behind get_character and its resource."""
     character = db.get_character(character_id)
     if not character:
         return {"error": "Character not found", "character_id": character_id}
     return character.to_dict()
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def update_character(
     character_id: int,
     name: Optional[str] = None,
@@ -278,30 +282,24 @@ def update_character(
     Returns:
         Success status dict
     """
-    character = db.get_character(character_id)
-    if not character:
+    # Update only provided fields; the row count doubles as the existence check
+    fields = {
+        "name": name,
+        "age": age,
+        "appearance": appearance,
+        "personality": personality,
+        "background": background,
+        "relationships": relationships,
+        "visual_description": visual_description,
+    }
+    if not db.update_character_fields(character_id, {k: v for k, v in fields.items() if v is not None}):
         return {"error": "Character not found", "character_id": character_id}
-
-    if name is not None:
-        character.name = name
-    if age is not None:
-        character.age = age
-    if appearance is not None:
-        character.appearance = appearance
-    if personality is not None:
-        character.personality = personality
-    if background is not None:
-        character.background = background
-    if relationships is not None:
-        character.relationships = relationships
-    if visual_description is not None:
-        character.visual_description = visual_description
-
-    db.update_character(character)
     return {"success": True, "character_id": character_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def delete_character(character_id: int) -> dict:
     """
     Delete a character.
@@ -312,15 +310,14 @@ def delete_character(character_id: int) -> dict:
     Returns:
         Success status dict
     """
-    character = db.get_character(character_id)
-    if not character:
+    if not db.delete_character(character_id):
         return {"error": "Character not found", "character_id": character_id}
-
-    db.delete_character(character_id)
     return {"success": True, "character_id": character_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def add_character_event(
     character_id: int,
     episode_number: int,
@@ -339,16 +336,15 @@ def add_character_event(
     Returns:
         Success status dict
     """
-    character = db.get_character(character_id)
-    if not character:
+    event = MajorEvent(episode_number=episode_number, description=description, impact=impact)
+    if not db.append_character_event(character_id, event):
         return {"error": "Character not found", "character_id": character_id}
-
-    character.add_major_event(episode_number, description, impact)
-    db.update_character(character)
     return {"success": True, "character_id": character_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@cached_read
 def get_character_context(
     project_id: int,
     up_to_episode: Optional[int] = None
@@ -369,7 +365,8 @@ def get_character_context(
     return project.get_all_characters_context(up_to_episode)
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def list_characters(project_id: int) -> list:
     """
     List all characters for a project.
@@ -380,13 +377,21 @@ def list_characters(project_id: int) -> list:
     Returns:
         List of character dicts
     """
+    return _list_characters(project_id)
+
+
+@cached_read
+def _list_characters(project_id: int) -> list:
+    """Cached lookup behind list_characters and its resource."""
     characters = db.get_characters_by_project(project_id)
     return [c.to_dict() for c in characters]
 
 
 # ==================== Episode Tools ====================
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def create_episode(
     project_id: int,
     episode_number: int,
@@ -407,11 +412,6 @@ def create_episode(
     Returns:
         dict with episode_id and title
     """
-    # Verify project exists
-    project = db.get_project(project_id)
-    if not project:
-        return {"error": "Project not found", "project_id": project_id}
-
     episode = Episode(
         project_id=project_id,
         episode_number=episode_number,
@@ -419,11 +419,14 @@ def create_episode(
         outline=outline,
         duration=duration
     )
-    ep_id = db.create_episode(episode)
+    ep_id = db.create_episode_checked(episode)
+    if ep_id is None:
+        return {"error": "Project not found", "project_id": project_id}
     return {"episode_id": ep_id, "title": title}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def get_episode(episode_id: int) -> dict:
     """
     Get episode details including shots.
@@ -434,13 +437,21 @@ def get_episode(episode_id: int) -> dict:
     Returns:
         Episode data as dict, or error dict if not found
     """
+    return _get_episode(episode_id)
+
+
+@cached_read
+def _get_episode(episode_id: int) -> dict:
+    """Cached lookup behind get_episode and its resource."""
     episode = db.get_episode(episode_id)
     if not episode:
         return {"error": "Episode not found", "episode_id": episode_id}
     return episode.to_dict()
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def update_episode(
     episode_id: int,
     episode_number: Optional[int] = None,
@@ -463,26 +474,22 @@ def update_episode(
     Returns:
         Success status dict
     """
-    episode = db.get_episode(episode_id)
-    if not episode:
+    # Update only provided fields; the row count doubles as the existence check
+    fields = {
+        "episode_number": episode_number,
+        "title": title,
+        "outline": outline,
+        "duration": duration,
+        "status": status,
+    }
+    if not db.update_episode_fields(episode_id, {k: v for k, v in fields.items() if v is not None}):
         return {"error": "Episode not found", "episode_id": episode_id}
-
-    if episode_number is not None:
-        episode.episode_number = episode_number
-    if title is not None:
-        episode.title = title
-    if outline is not None:
-        episode.outline = outline
-    if duration is not None:
-        episode.duration = duration
-    if status is not None:
-        episode.status = status
-
-    db.update_episode(episode)
     return {"success": True, "episode_id": episode_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def delete_episode(episode_id: int) -> dict:
     """
     Delete an episode and all its shots.
@@ -493,15 +500,13 @@ def delete_episode(episode_id: int) -> dict:
     Returns:
         Success status dict
     """
-    episode = db.get_episode(episode_id)
-    if not episode:
+    if not db.delete_episode(episode_id):
         return {"error": "Episode not found", "episode_id": episode_id}
-
-    db.delete_episode(episode_id)
     return {"success": True, "episode_id": episode_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def list_episodes(project_id: int) -> list:
     """
     List all episodes for a project.
@@ -512,52 +517,59 @@ def list_episodes(project_id: int) -> list:
     Returns:
         List of episode dicts (without shots for brevity)
     """
-    episodes = db.get_episodes_by_project(project_id)
-    return [
-        {
-            "id": e.id,
-            "episode_number": e.episode_number,
-            "title": e.title,
-            "outline": e.outline,
-            "duration": e.duration,
-            "status": e.status,
-            "shot_count": len(e.shots),
-            "total_duration": e.get_total_duration(),
-        }
-        for e in episodes
-    ]
+    return _list_episodes(project_id)
+
+
+@cached_read
+def _list_episodes(project_id: int) -> list:
+    """Cached lookup behind list_episodes and its resource."""
+    return db.list_episodes_summary(project_id)
 
 
 # ==================== Resources ====================
 
 @mcp.resource("project://{project_id}")
+@cached_read
+@in_db_thread
 def get_project_resource(project_id: int) -> dict:
     """Get full project data as a resource."""
-    return get_project(project_id)
+    return _get_project(project_id)
 
 
 @mcp.resource("project://{project_id}/characters")
+@cached_read
+@in_db_thread
 def get_project_characters_resource(project_id: int) -> list:
     """Get all characters for a project as a resource."""
-    return list_characters(project_id)
+    return _list_characters(project_id)
 
 
 @mcp.resource("project://{project_id}/episodes")
+@cached_read
+@in_db_thread
 def get_project_episodes_resource(project_id: int) -> list:
     """Get all episodes for a project as a resource."""
-    return list_episodes(project_id)
+    return _list_episodes(project_id)
 
 
 @mcp.resource("character://{character_id}")
+@cached_read
+@in_db_thread
 def get_character_resource(character_id: int) -> dict:
     """Get character data as a resource."""
-    return get_character(character_id)
+    return _get_character(character_id)
 
 
 @mcp.resource("episode://{episode_id}")
+@cached_read
+@in_db_thread
 def get_episode_resource(episode_id: int) -> dict:
     """Get episode data as a resource."""
-    return get_episode(episode_id)
+    return _get_episode(episode_id)
+
+
+# All tools are registered; persist any schemas derived on this start
+schema_cache.save()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ Usage:
     python src/mcp_servers/storyboard_server.py
 """
 
+import json
 import sys
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -22,17 +23,31 @@ if str(_src_dir) not in sys.path:
 
 from fastmcp import FastMCP
 
-from story_generator.database import Database
+from mcp_servers._db_pool import get_db, in_db_thread
+from mcp_servers._fast_tool import fast_tool
+from mcp_servers._read_cache import cached_read, invalidates_reads
+from mcp_servers._schema_cache import use_schema_cache
+from mcp_servers._serializer import tool_serializer
 from story_generator.models import Shot, SHOT_TYPE_NAMES, CAMERA_MOVEMENT_NAMES
 
 # Initialize MCP server and database
-mcp = FastMCP("Storyboard Server")
-db = Database()
+mcp = FastMCP("Storyboard Server", tool_serializer=tool_serializer)
+schema_cache = use_schema_cache(mcp, __file__)
+db = get_db()
+
+# The name maps never change at runtime, so their resource bodies are encoded once
+_SHOT_TYPE_NAMES_JSON = json.dumps(SHOT_TYPE_NAMES, ensure_ascii=False, separators=(",", ":"))
+_CAMERA_MOVEMENT_NAMES_JSON = json.dumps(CAMERA_MOVEMENT_NAMES, ensure_ascii=False, separators=(",", ":"))
+
+# Fields every batch_save_generated_prompts item must carry
+_PROMPT_ITEM_KEYS = {"shot_id", "platform", "prompt_type", "prompt"}
 
 
 # ==================== Shot Tools ====================
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def create_shot(
     episode_id: int,
     scene_number: int,
@@ -63,11 +78,6 @@ def create_shot(
     Returns:
         dict with shot_id
     """
-    # Verify episode exists
-    episode = db.get_episode(episode_id)
-    if not episode:
-        return {"error": "Episode not found", "episode_id": episode_id}
-
     shot = Shot(
         episode_id=episode_id,
         scene_number=scene_number,
@@ -80,11 +90,14 @@ def create_shot(
         camera_movement=camera_movement,
         notes=notes
     )
-    shot_id = db.create_shot(shot)
+    shot_id = db.create_shot_checked(shot)
+    if shot_id is None:
+        return {"error": "Episode not found", "episode_id": episode_id}
     return {"shot_id": shot_id, "scene_number": scene_number, "shot_number": shot_number}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
 def get_shot(shot_id: int) -> dict:
     """
     Get shot details.
@@ -95,13 +108,21 @@ def get_shot(shot_id: int) -> dict:
     Returns:
         Shot data as dict, or error dict if not found
     """
+    return _get_shot(shot_id)
+
+
+@cached_read
+def _get_shot(shot_id: int) -> dict:
+    """Cached lookup behind get_shot and its resource."""
     shot = db.get_shot(shot_id)
     if not shot:
         return {"error": "Shot not found", "shot_id": shot_id}
     return shot.to_dict()
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def update_shot(
     shot_id: int,
     scene_number: Optional[int] = None,
@@ -132,34 +153,26 @@ def update_shot(
     Returns:
         Success status dict
     """
-    shot = db.get_shot(shot_id)
-    if not shot:
+    # Update only provided fields; the row count doubles as the existence check
+    fields = {
+        "scene_number": scene_number,
+        "shot_number": shot_number,
+        "shot_type": shot_type,
+        "duration": duration,
+        "visual_description": visual_description,
+        "dialogue": dialogue,
+        "sound_music": sound_music,
+        "camera_movement": camera_movement,
+        "notes": notes,
+    }
+    if not db.update_shot_fields(shot_id, {k: v for k, v in fields.items() if v is not None}):
         return {"error": "Shot not found", "shot_id": shot_id}
-
-    if scene_number is not None:
-        shot.scene_number = scene_number
-    if shot_number is not None:
-        shot.shot_number = shot_number
-    if shot_type is not None:
-        shot.shot_type = shot_type
-    if duration is not None:
-        shot.duration = duration
-    if visual_description is not None:
-        shot.visual_description = visual_description
-    if dialogue is not None:
-        shot.dialogue = dialogue
-    if sound_music is not None:
-        shot.sound_music = sound_music
-    if camera_movement is not None:
-        shot.camera_movement = camera_movement
-    if notes is not None:
-        shot.notes = notes
-
-    db.update_shot(shot)
     return {"success": True, "shot_id": shot_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def delete_shot(shot_id: int) -> dict:
     """
     Delete a shot.
@@ -170,15 +183,14 @@ def delete_shot(shot_id: int) -> dict:
     Returns:
         Success status dict
     """
-    shot = db.get_shot(shot_id)
-    if not shot:
+    if not db.delete_shot(shot_id):
         return {"error": "Shot not found", "shot_id": shot_id}
-
-    db.delete_shot(shot_id)
     return {"success": True, "shot_id": shot_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@cached_read
 def list_shots(episode_id: int) -> list:
     """
     List all shots for an episode, ordered by scene and shot number.
@@ -189,11 +201,12 @@ def list_shots(episode_id: int) -> list:
     Returns:
         List of shot dicts
     """
-    shots = db.get_shots_by_episode(episode_id)
-    return [s.to_dict() for s in shots]
+    return list(db.iter_shots_by_episode(episode_id))
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def batch_create_shots(episode_id: int, shots_data: List[dict]) -> dict:
     """
     Create multiple shots at once.
@@ -214,32 +227,15 @@ def batch_create_shots(episode_id: int, shots_data: List[dict]) -> dict:
     Returns:
         dict with list of created shot_ids
     """
-    # Verify episode exists
-    episode = db.get_episode(episode_id)
-    if not episode:
+    shot_ids = db.batch_create_shots_raw(episode_id, shots_data)
+    if shot_ids is None:
         return {"error": "Episode not found", "episode_id": episode_id}
-
-    shots = []
-    for data in shots_data:
-        shot = Shot(
-            episode_id=episode_id,
-            scene_number=data.get("scene_number", 1),
-            shot_number=data.get("shot_number", 1),
-            shot_type=data.get("shot_type", "medium"),
-            duration=data.get("duration", 5),
-            visual_description=data.get("visual_description", ""),
-            dialogue=data.get("dialogue", ""),
-            sound_music=data.get("sound_music", ""),
-            camera_movement=data.get("camera_movement", "static"),
-            notes=data.get("notes", "")
-        )
-        shots.append(shot)
-
-    shot_ids = db.batch_create_shots(shots)
     return {"success": True, "shot_ids": shot_ids, "count": len(shot_ids)}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def delete_all_shots(episode_id: int) -> dict:
     """
     Delete all shots for an episode (useful before regenerating storyboard).
@@ -250,15 +246,14 @@ def delete_all_shots(episode_id: int) -> dict:
     Returns:
         Success status dict
     """
-    episode = db.get_episode(episode_id)
-    if not episode:
+    if not db.delete_shots_by_episode_checked(episode_id):
         return {"error": "Episode not found", "episode_id": episode_id}
-
-    db.delete_shots_by_episode(episode_id)
     return {"success": True, "episode_id": episode_id}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
 def save_generated_prompt(
     shot_id: int,
     platform: str,
@@ -277,17 +272,53 @@ def save_generated_prompt(
     Returns:
         Success status dict
     """
-    shot = db.get_shot(shot_id)
-    if not shot:
+    result = _save_generated_prompts([
+        {"shot_id": shot_id, "platform": platform, "prompt_type": prompt_type, "prompt": prompt}
+    ])
+    if result["not_found"]:
         return {"error": "Shot not found", "shot_id": shot_id}
+    return {"success": True, "shot_id": shot_id, "prompt_key": result["saved"][0]["prompt_key"]}
 
-    key = f"{platform}_{prompt_type}"
-    shot.generated_prompts[key] = prompt
-    db.update_shot(shot)
-    return {"success": True, "shot_id": shot_id, "prompt_key": key}
+
+@fast_tool(mcp)
+@in_db_thread
+@invalidates_reads
+def batch_save_generated_prompts(items: List[dict]) -> dict:
+    """
+    Save several generated video prompts at once.
+
+    Args:
+        items: List of dicts, each containing:
+            - shot_id: int
+            - platform: str (kling, hailuo, jimeng, tongyi)
+            - prompt_type: str (t2v, i2v, i2v_fl)
+            - prompt: str
+
+    Returns:
+        dict with the saved prompt keys and the IDs of shots that were not found
+    """
+    invalid = [i for i, item in enumerate(items) if not _PROMPT_ITEM_KEYS.issubset(item)]
+    if invalid:
+        return {"error": "Each item needs shot_id, platform, prompt_type and prompt", "invalid_items": invalid}
+    return {"success": True, **_save_generated_prompts(items)}
+
+
+def _save_generated_prompts(items: List[dict]) -> dict:
+    """Write prompts in one batched UPDATE, splitting results by whether the shot exists."""
+    rows = [
+        (item["shot_id"], f"{item['platform']}_{item['prompt_type']}", item["prompt"])
+        for item in items
+    ]
+    found = db.patch_generated_prompts(rows)
+    return {
+        "saved": [{"shot_id": shot_id, "prompt_key": key} for shot_id, key, _ in rows if shot_id in found],
+        "not_found": sorted({shot_id for shot_id, _, _ in rows if shot_id not in found}),
+    }
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@cached_read
 def get_generated_prompt(
     shot_id: int,
     platform: str,
@@ -313,7 +344,9 @@ def get_generated_prompt(
     return {"shot_id": shot_id, "prompt_key": key, "prompt": prompt}
 
 
-@mcp.tool()
+@fast_tool(mcp)
+@in_db_thread
+@cached_read
 def get_storyboard_summary(episode_id: int) -> dict:
     """
     Get a summary of the storyboard for an episode.
@@ -324,43 +357,42 @@ def get_storyboard_summary(episode_id: int) -> dict:
     Returns:
         Summary dict with shot count, total duration, scenes breakdown
     """
-    episode = db.get_episode(episode_id)
+    episode = db.get_episode_brief(episode_id)
     if not episode:
         return {"error": "Episode not found", "episode_id": episode_id}
 
-    shots = episode.shots
-    total_duration = sum(s.duration for s in shots)
-
-    # Group by scene
-    scenes = {}
-    for shot in shots:
-        scene_num = shot.scene_number
-        if scene_num not in scenes:
-            scenes[scene_num] = {"shot_count": 0, "duration": 0, "shots": []}
-        scenes[scene_num]["shot_count"] += 1
-        scenes[scene_num]["duration"] += shot.duration
-        scenes[scene_num]["shots"].append({
-            "shot_number": shot.shot_number,
-            "shot_type": shot.shot_type,
-            "duration": shot.duration,
+    # Aggregate in SQL; only the columns shown in the summary leave the database
+    scenes = {
+        row["scene_number"]: {"shot_count": row["shot_count"], "duration": row["duration"], "shots": []}
+        for row in db.scene_aggregates(episode_id)
+    }
+    for row in db.scene_shot_brief(episode_id):
+        scenes[row["scene_number"]]["shots"].append({
+            "shot_number": row["shot_number"],
+            "shot_type": row["shot_type"],
+            "duration": row["duration"],
         })
 
+    total_shot_count = sum(scene["shot_count"] for scene in scenes.values())
+    total_duration = sum(scene["duration"] for scene in scenes.values())
+
     return {
         "episode_id": episode_id,
-        "episode_title": episode.title,
-        "target_duration": episode.duration,
-        "total_shot_count": len(shots),
+        "episode_title": episode["title"],
+        "target_duration": episode["duration"],
+        "total_shot_count": total_shot_count,
         "total_duration": total_duration,
-        "duration_diff": total_duration - episode.duration,
+        "duration_diff": total_duration - episode["duration"],
         "scene_count": len(scenes),
         "scenes": scenes
     }
 
 
-@mcp.tool()
+@fast_tool(mcp)
 def get_shot_type_names() -> dict:
     """
     Get the mapping of shot type codes to Chinese names.
+    Also available as the enums://shot_types resource.
 
     Returns:
         dict mapping shot_type codes to Chinese names
@@ -368,10 +400,11 @@ def get_shot_type_names() -> dict:
     return SHOT_TYPE_NAMES
 
 
-@mcp.tool()
+@fast_tool(mcp)
 def get_camera_movement_names() -> dict:
     """
     Get the mapping of camera movement codes to Chinese names.
+    Also available as the enums://camera_movements resource.
 
     Returns:
         dict mapping camera_movement codes to Chinese names
@@ -382,11 +415,15 @@ def get_camera_movement_names() -> dict:
 # ==================== Resources ====================
 
 @mcp.resource("storyboard://{episode_id}")
+@cached_read
+@in_db_thread
 def get_storyboard_resource(episode_id: int) -> dict:
     """Get full storyboard data for an episode as a resource."""
-    episode = db.get_episode(episode_id)
+    episode = db.get_episode(episode_id, include_shots=False)
     if not episode:
         return {"error": "Episode not found"}
+
+    shots = list(db.iter_shots_by_episode(episode_id))
     return {
         "episode": {
             "id": episode.id,
@@ -396,15 +433,33 @@ def get_storyboard_resource(episode_id: int) -> dict:
             "duration": episode.duration,
             "status": episode.status,
         },
-        "shots": [s.to_dict() for s in episode.shots],
-        "total_duration": episode.get_total_duration()
+        "shots": shots,
+        "total_duration": sum(shot["duration"] for shot in shots)
     }
 
 
+@mcp.resource("enums://shot_types", mime_type="application/json")
+def shot_types_resource() -> str:
+    """Mapping of shot type codes to Chinese names."""
+    return _SHOT_TYPE_NAMES_JSON
+
+
+@mcp.resource("enums://camera_movements", mime_type="application/json")
+def camera_movements_resource() -> str:
+    """Mapping of camera movement codes to Chinese names."""
+    return _CAMERA_MOVEMENT_NAMES_JSON
+
+
 @mcp.resource("shot://{shot_id}")
+@cached_read
+@in_db_thread
 def get_shot_resource(shot_id: int) -> dict:
     """Get shot data as a resource."""
-    return get_shot(shot_id)
+    return _get_shot(shot_id)
+
+
+# All tools are registered; persist any schemas derived on this start
+schema_cache.save()
 
 
 if __name__ == "__main__":
@@ -10,7 +10,11 @@ Usage:
     python src/mcp_servers/video_server.py
 """
 
+import asyncio
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -21,33 +25,52 @@ if str(_src_dir) not in sys.path:
     sys.path.insert(0, str(_src_dir))
 
 from fastmcp import FastMCP
+from mcp_servers._serializer import tool_serializer
 
-from providers import (
-    KlingProvider,
-    HailuoProvider,
-    JimengProvider,
-    TongyiProvider,
-    TaskStatus,
-    get_provider,
-)
+from providers import TaskStatus, VideoTask, get_provider
 
 # Initialize MCP server
-mcp = FastMCP("Video Server")
+mcp = FastMCP("Video Server", tool_serializer=tool_serializer)
+
+# Default cap on concurrent submissions in batch_submit_text_to_video
+BATCH_MAX_CONCURRENT = 8
+
+# Provider names in listing order, and as a set for per-call name checks
+_PROVIDER_ORDER = ("kling", "hailuo", "jimeng", "tongyi")
+_PROVIDER_NAMES = frozenset(_PROVIDER_ORDER)
 
 # Initialize providers (lazy loading - actual API calls happen when tools are used)
 _providers: Dict[str, Any] = {}
+_providers_lock = threading.Lock()
 
 
 def _get_provider(name: str):
-    """Get or initialize a provider by name."""
-    if name not in _providers:
-        _providers[name] = get_provider(name)
-    return _providers[name]
+    """Get or initialize a provider by name; concurrent callers share one instance."""
+    provider = _providers.get(name)
+    if provider is None:
+        with _providers_lock:
+            provider = _providers.get(name)
+            if provider is None:
+                provider = get_provider(name)
+                _providers[name] = provider
+    return provider
 
 
 def _get_all_provider_names() -> List[str]:
     """Get list of all available provider names."""
-    return ["kling", "hailuo", "jimeng", "tongyi"]
+    return list(_PROVIDER_ORDER)
+
+
+def _provider_status(provider_name: str) -> dict:
+    """Configuration and connection test result for a provider (blocking)."""
+    provider = _get_provider(provider_name)
+    test_result = provider.test_connection()
+
+    return {
+        "name": provider_name,
+        "configured": provider.is_configured(),
+        "connection_test": test_result,
+    }
 
 
 # ==================== Query Tools ====================
@@ -61,7 +84,7 @@ def list_providers() -> list:
         List of provider info dicts with name, configured status
     """
     result = []
-    for name in _get_all_provider_names():
+    for name in _PROVIDER_ORDER:
         provider = _get_provider(name)
         result.append({
             "name": name,
@@ -81,17 +104,28 @@ def get_provider_status(provider_name: str) -> dict:
     Returns:
         Provider status dict with configuration and connection test result
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
-    provider = _get_provider(provider_name)
-    test_result = provider.test_connection()
+    return _provider_status(provider_name)
 
-    return {
-        "name": provider_name,
-        "configured": provider.is_configured(),
-        "connection_test": test_result,
-    }
+
+@mcp.tool()
+async def list_provider_statuses() -> list:
+    """
+    Get detailed status of all providers, testing their connections concurrently.
+
+    Returns:
+        List of provider status dicts, as from get_provider_status
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_provider_status, name) for name in _PROVIDER_ORDER),
+        return_exceptions=True,
+    )
+    return [
+        {"name": name, "error": str(result)} if isinstance(result, Exception) else result
+        for name, result in zip(_PROVIDER_ORDER, results)
+    ]
 
 
 # ==================== Text-to-Video Tools ====================
@@ -121,7 +155,7 @@ def submit_text_to_video(
     Returns:
         dict with task_id and initial status, or error
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -151,7 +185,7 @@ def submit_text_to_video(
 
 
 @mcp.tool()
-def text_to_video_sync(
+async def text_to_video_sync(
     provider_name: str,
     prompt: str,
     duration: int = 5,
@@ -173,7 +207,7 @@ def text_to_video_sync(
     Returns:
         dict with final task status and video_url if successful, or error
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -186,11 +220,12 @@ def text_to_video_sync(
         kwargs["model"] = model
 
     try:
-        task = provider.text_to_video(
+        task = await provider.async_text_to_video(
             prompt=prompt,
             duration=duration,
             resolution=resolution,
             wait=True,
+            timeout=timeout,
             **kwargs
         )
         return task.to_dict()
@@ -227,7 +262,7 @@ def submit_image_to_video(
     Returns:
         dict with task_id and initial status, or error
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -255,7 +290,7 @@ def submit_image_to_video(
 
 
 @mcp.tool()
-def image_to_video_sync(
+async def image_to_video_sync(
     provider_name: str,
     image_url: str,
     prompt: str,
@@ -281,7 +316,7 @@ def image_to_video_sync(
     Returns:
         dict with final task status and video_url if successful, or error
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -296,12 +331,13 @@ def image_to_video_sync(
         kwargs["model"] = model
 
     try:
-        task = provider.image_to_video(
+        task = await provider.async_image_to_video(
             image_url=image_url,
             prompt=prompt,
             duration=duration,
             resolution=resolution,
             wait=True,
+            timeout=timeout,
             **kwargs
         )
         return task.to_dict()
@@ -325,7 +361,7 @@ def get_task_status(provider_name: str, task_id: str) -> dict:
     Returns:
         dict with current task status
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -338,11 +374,12 @@ def get_task_status(provider_name: str, task_id: str) -> dict:
 
 
 @mcp.tool()
-def wait_for_task(
+async def wait_for_task(
     provider_name: str,
     task_id: str,
     timeout: int = 300,
-    poll_interval: int = 5
+    poll_interval: int = 5,
+    max_poll_interval: int = 30
 ) -> dict:
     """
     Wait for a video generation task to complete.
@@ -351,18 +388,19 @@ def wait_for_task(
         provider_name: Provider name (kling, hailuo, jimeng, tongyi)
         task_id: The task ID to wait for
         timeout: Maximum time to wait in seconds
-        poll_interval: Time between status checks in seconds
+        poll_interval: Initial time between status checks in seconds
+        max_poll_interval: Longest time between status checks in seconds (checks back off up to this)
 
     Returns:
         dict with final task status
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
 
     try:
-        task = provider.wait_for_completion(task_id, timeout, poll_interval)
+        task = await provider.async_wait_for_completion(task_id, timeout, poll_interval, max_poll_interval)
         return task.to_dict()
     except TimeoutError as e:
         return {"error": f"Timeout: {e}", "provider": provider_name, "task_id": task_id}
@@ -375,7 +413,9 @@ def wait_for_task(
 @mcp.tool()
 def batch_submit_text_to_video(
     provider_name: str,
-    tasks: List[dict]
+    tasks: List[dict],
+    max_concurrent: int = BATCH_MAX_CONCURRENT,
+    submit_delay: float = 0.0
 ) -> dict:
     """
     Submit multiple text-to-video tasks at once.
@@ -387,11 +427,14 @@ def batch_submit_text_to_video(
             - duration: int (optional, default 5)
             - resolution: str (optional)
             - model: str (optional)
+        max_concurrent: Maximum number of submissions in flight at once
+        submit_delay: Seconds to wait between starting consecutive submissions
+            (the provider's configured rate_limit also applies)
 
     Returns:
-        dict with list of submitted task results
+        dict with list of submitted task results, in the order of tasks
     """
-    if provider_name not in _get_all_provider_names():
+    if provider_name not in _PROVIDER_NAMES:
         return {"error": f"Unknown provider: {provider_name}"}
 
     provider = _get_provider(provider_name)
@@ -399,31 +442,98 @@ def batch_submit_text_to_video(
     if not provider.is_configured():
         return {"error": f"Provider {provider_name} not configured. Please set API keys."}
 
-    results = []
-    for i, task_data in enumerate(tasks):
-        prompt = task_data.get("prompt")
-        if not prompt:
-            results.append({"error": "Missing prompt", "index": i})
-            continue
-
+    def submit(i: int, task_data: dict) -> dict:
         kwargs = {}
         if task_data.get("model"):
             kwargs["model"] = task_data["model"]
 
         try:
             task = provider.submit_text_to_video(
-                prompt=prompt,
+                prompt=task_data["prompt"],
                 duration=task_data.get("duration", 5),
                 resolution=task_data.get("resolution"),
                 **kwargs
             )
-            results.append({"index": i, **task.to_dict()})
+            return {"index": i, **task.to_dict()}
         except Exception as e:
-            results.append({"error": str(e), "index": i})
+            return {"error": str(e), "index": i}
+
+    results: List[Optional[dict]] = [None] * len(tasks)
+    futures = {}
+    # Submissions are I/O-bound, so a few threads overlap their round trips
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(tasks) or 1))) as executor:
+        for i, task_data in enumerate(tasks):
+            if not task_data.get("prompt"):
+                results[i] = {"error": "Missing prompt", "index": i}
+                continue
+            if futures and submit_delay > 0:
+                time.sleep(submit_delay)
+            futures[executor.submit(submit, i, task_data)] = i
+
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
     return {"provider": provider_name, "results": results, "submitted": len([r for r in results if "task_id" in r])}
 
 
+@mcp.tool()
+async def batch_wait_for_tasks(
+    provider_name: str,
+    task_ids: List[str],
+    depends_on: Optional[Dict[str, List[str]]] = None,
+    timeout: int = 600,
+    poll_interval: int = 5,
+    max_poll_interval: int = 30
+) -> dict:
+    """
+    Wait for several video generation tasks, polling only those that can progress.
+
+    Args:
+        provider_name: Provider name (kling, hailuo, jimeng, tongyi)
+        task_ids: Task IDs to wait for
+        depends_on: Optional map of task ID to the task IDs it waits on; a task
+            is not polled until all of its dependencies have finished
+        timeout: Maximum time to wait in seconds
+        poll_interval: Initial time between polling rounds in seconds
+        max_poll_interval: Longest time between polling rounds in seconds
+
+    Returns:
+        dict with each task's latest status, in the order of task_ids
+    """
+    if provider_name not in _PROVIDER_NAMES:
+        return {"error": f"Unknown provider: {provider_name}"}
+
+    provider = _get_provider(provider_name)
+    depends_on = depends_on or {}
+    tasks = [
+        VideoTask(task_id=task_id, provider=provider_name, depends_on=depends_on.get(task_id, []))
+        for task_id in task_ids
+    ]
+
+    start_time = time.monotonic()
+    deadline = start_time + timeout
+    attempt = 0
+    try:
+        while True:
+            tasks = await asyncio.to_thread(provider.poll_many, tasks)
+            pending = [task for task in tasks if not task.is_completed()]
+            now = time.monotonic()
+            if not pending or now >= deadline:
+                break
+            delay = provider.next_poll_delay(pending[0], attempt, now - start_time, poll_interval, max_poll_interval)
+            await asyncio.sleep(min(delay, deadline - now))
+            attempt += 1
+    except Exception as e:
+        return {"error": str(e), "provider": provider_name}
+
+    return {
+        "provider": provider_name,
+        "results": [task.to_dict() for task in tasks],
+        "completed": len(tasks) - len(pending),
+        "pending": [task.task_id for task in pending],
+    }
+
+
 # ==================== Utility Tools ====================
 
 @mcp.tool()
@@ -452,4 +562,7 @@ def get_providers_list_resource() -> list:
 
 
 if __name__ == "__main__":
+    # Construct providers up front so the first tool call doesn't pay for it
+    for _name in _PROVIDER_ORDER:
+        _get_provider(_name)
     mcp.run(transport="stdio")
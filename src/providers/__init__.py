@@ -13,20 +13,43 @@ Image Providers:
 - Tongyi Image (通义图像)
 """
 
+import importlib
+
 # Base classes
 from .base import VideoProvider, VideoTask, TaskStatus
 from .config import Config, get_config
 
-# Video providers
-from .video.kling import KlingProvider
-from .video.tongyi import TongyiProvider
-from .video.jimeng import JimengProvider
-from .video.hailuo import HailuoProvider
-
-# Image providers
-from .image.base import ImageProvider, ImageTask, ImageTaskStatus, CharacterViewMode, ImageSize
-from .image.tongyi import TongyiImageProvider
-from .image.jimeng import JiMengImageProvider
+# Provider modules pull in HTTP clients, auth libraries and model tables, so
+# they are imported on first attribute access (PEP 562) rather than with the
+# package; a server that only uses one provider never loads the others.
+# Each name resolves through its subpackage, which maps it to its module.
+_LAZY_ATTRS = {
+    # Video providers
+    "KlingProvider": ".video",
+    "TongyiProvider": ".video",
+    "JimengProvider": ".video",
+    "HailuoProvider": ".video",
+    # Image providers
+    "ImageProvider": ".image",
+    "ImageTask": ".image",
+    "ImageTaskStatus": ".image",
+    "CharacterViewMode": ".image",
+    "ImageSize": ".image",
+    "TongyiImageProvider": ".image",
+    "JiMengImageProvider": ".image",
+}
+
+# Provider registry names -> class names
+_VIDEO_PROVIDERS = {
+    "kling": "KlingProvider",
+    "tongyi": "TongyiProvider",
+    "jimeng": "JimengProvider",
+    "hailuo": "HailuoProvider",
+}
+_IMAGE_PROVIDERS = {
+    "tongyi": "TongyiImageProvider",
+    "jimeng": "JiMengImageProvider",
+}
 
 __all__ = [
     # Base - Video
@@ -54,30 +77,24 @@ __all__ = [
 
 def get_provider(name: str) -> VideoProvider:
     """Get a video provider instance by name."""
-    providers = {
-        "kling": KlingProvider,
-        "tongyi": TongyiProvider,
-        "jimeng": JimengProvider,
-        "hailuo": HailuoProvider,
-    }
-
-    if name not in providers:
-        raise ValueError(f"Unknown provider: {name}. Available: {list(providers.keys())}")
+    if name not in _VIDEO_PROVIDERS:
+        raise ValueError(f"Unknown provider: {name}. Available: {list(_VIDEO_PROVIDERS.keys())}")
 
-    return providers[name]()
+    return __getattr__(_VIDEO_PROVIDERS[name])()
 
 
 def get_image_provider(name: str):
     """Get an image provider instance by name."""
-    from .image.tongyi import TongyiImageProvider
-    from .image.jimeng import JiMengImageProvider
+    if name not in _IMAGE_PROVIDERS:
+        raise ValueError(f"Unknown image provider: {name}. Available: {list(_IMAGE_PROVIDERS.keys())}")
 
-    providers = {
-        "tongyi": TongyiImageProvider,
-        "jimeng": JiMengImageProvider,
-    }
+    return __getattr__(_IMAGE_PROVIDERS[name])()
 
-    if name not in providers:
-        raise ValueError(f"Unknown image provider: {name}. Available: {list(providers.keys())}")
 
-    return providers[name]()
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
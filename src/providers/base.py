@@ -5,17 +5,113 @@ All provider implementations should inherit from VideoProvider
 and implement the required abstract methods.
 """
 
+import asyncio
+import atexit
+import copy
+import functools
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Any, Optional
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from .config import get_config, ProviderConfig
+from .ratelimit import get_bucket
 
+if TYPE_CHECKING:
+    import requests
 
-class TaskStatus(Enum):
+# Poll intervals grow by this factor per status check, up to max_poll_interval,
+# with +/- POLL_JITTER spread so batches of tasks don't poll in lockstep
+POLL_BACKOFF = 1.5
+POLL_JITTER = 0.2
+DEFAULT_MAX_POLL_INTERVAL = 30
+
+# Status queries for the same task within this many seconds share one response
+STATUS_COALESCE_TTL = 0.5
+
+# Finished tasks remembered per process, so re-reading them skips the provider.
+# Entries expire well before the shortest-lived video URL (Hailuo's, 1 hour),
+# so a re-read after that fetches a fresh link.
+TERMINAL_TASK_CACHE_SIZE = 10000
+TERMINAL_TASK_CACHE_TTL = 30 * 60
+
+# Connection pool size per API host, and the statuses retried as transient.
+# Retries only cover idempotent methods, so a task submission (POST) is never
+# sent twice.
+HTTP_POOL_SIZE = 20
+HTTP_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+_http_sessions: Dict[str, "requests.Session"] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def _pool_key(url: str) -> str:
+    """scheme://host:port of a URL, so all providers on one host share a pool."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+def http_session(url: str) -> "requests.Session":
+    """
+    Get the shared HTTP session for a URL's host.
+
+    Reusing one session keeps connections alive between submit and status
+    calls instead of paying a TCP and TLS handshake per request.
+
+    Args:
+        url: Any URL on the API host
+
+    Returns:
+        The requests.Session for that host, created on first use
+    """
+    key = _pool_key(url)
+    session = _http_sessions.get(key)
+    if session is None:
+        with _http_sessions_lock:
+            session = _http_sessions.get(key)
+            if session is None:
+                # requests and urllib3 are imported on first use; they are
+                # most of the cost of importing this package
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                retry = Retry(
+                    total=get_config().global_config.retry_attempts,
+                    backoff_factor=0.5,
+                    status_forcelist=HTTP_RETRY_STATUSES,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=retry,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_sessions[key] = session
+    return session
+
+
+@atexit.register
+def close_http_sessions():
+    """Close all shared HTTP sessions and their pooled connections."""
+    with _http_sessions_lock:
+        for session in _http_sessions.values():
+            session.close()
+        _http_sessions.clear()
+
+
+class TaskStatus(StrEnum):
     """Video generation task status."""
     PENDING = "pending"
     PROCESSING = "processing"
@@ -24,7 +120,10 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
+@dataclass(slots=True)
 class VideoTask:
     """Represents a video generation task."""
     task_id: str
@@ -36,10 +135,17 @@ class VideoTask:
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
     metadata: dict = field(default_factory=dict)
+    # Client-side: IDs of tasks that must finish before this one can progress
+    depends_on: List[str] = field(default_factory=list)
+
+    # (datetime, isoformat) pairs from the last to_dict(), reused while the
+    # timestamp is unchanged so repeated serialization skips the formatting
+    _created_iso: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    _completed_iso: tuple = field(default=(None, None), init=False, repr=False, compare=False)
 
     def is_completed(self) -> bool:
         """Check if task is in a terminal state."""
-        return self.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+        return self.status in TERMINAL_STATUSES
 
     def is_successful(self) -> bool:
         """Check if task completed successfully."""
@@ -47,6 +153,20 @@ class VideoTask:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        # Inlined rather than a helper per timestamp: this runs for every
+        # status poll and MCP task result
+        created_at, created_iso = self._created_iso
+        if created_at is not self.created_at:
+            created_at = self.created_at
+            created_iso = created_at.isoformat() if created_at else None
+            self._created_iso = (created_at, created_iso)
+
+        completed_at, completed_iso = self._completed_iso
+        if completed_at is not self.completed_at:
+            completed_at = self.completed_at
+            completed_iso = completed_at.isoformat() if completed_at else None
+            self._completed_iso = (completed_at, completed_iso)
+
         return {
             "task_id": self.task_id,
             "provider": self.provider,
@@ -54,12 +174,121 @@ class VideoTask:
             "progress": self.progress,
             "video_url": self.video_url,
             "error_message": self.error_message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": created_iso,
+            "completed_at": completed_iso,
             "metadata": self.metadata,
         }
 
 
+class _StatusCoalescer:
+    """
+    Shares status queries for the same task between concurrent callers.
+
+    While a query is in flight, other callers wait for its result instead of
+    sending their own, and a result is reused for STATUS_COALESCE_TTL seconds.
+    Each caller gets its own copy, since wait loops mutate the task they get.
+    """
+
+    def __init__(self, ttl: float = STATUS_COALESCE_TTL):
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, Future] = {}
+        self._recent: Dict[Hashable, Tuple[float, VideoTask]] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, query: Callable[[], VideoTask], reuse_recent: bool = True) -> VideoTask:
+        with self._lock:
+            recent = self._recent.get(key) if reuse_recent else None
+            if recent is not None and recent[0] > time.monotonic():
+                return copy.copy(recent[1])
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return copy.copy(future.result())
+
+        try:
+            task = query()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            now = time.monotonic()
+            if len(self._recent) > 256:
+                self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+            self._recent[key] = (now + self.ttl, task)
+            del self._inflight[key]
+        future.set_result(task)
+        return copy.copy(task)
+
+
+class _TerminalTaskCache:
+    """
+    Thread-safe LRU of tasks that reached a terminal status.
+
+    The status never changes, but the video URL a provider hands out can
+    expire, so entries are dropped after `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int = TERMINAL_TASK_CACHE_SIZE, ttl: float = TERMINAL_TASK_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._tasks: "OrderedDict[Hashable, Tuple[float, VideoTask]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[VideoTask]:
+        with self._lock:
+            entry = self._tasks.get(key)
+            if entry is None:
+                return None
+            expires_at, task = entry
+            if expires_at <= time.monotonic():
+                del self._tasks[key]
+                return None
+            self._tasks.move_to_end(key)
+            return copy.copy(task)
+
+    def put(self, key: Hashable, task: VideoTask):
+        with self._lock:
+            self._tasks[key] = (time.monotonic() + self.ttl, copy.copy(task))
+            self._tasks.move_to_end(key)
+            while len(self._tasks) > self.maxsize:
+                self._tasks.popitem(last=False)
+
+
+_status_coalescer = _StatusCoalescer()
+_terminal_tasks = _TerminalTaskCache()
+
+
+def _coalesce_status(get_task_status: Callable) -> Callable:
+    """Serve finished tasks from memory, and coalesce queries for running ones."""
+    @functools.wraps(get_task_status)
+    def wrapper(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        task = _terminal_tasks.get((self._name, task_id))
+        if task is not None:
+            return task
+
+        if long_poll_seconds:
+            # A long poll asks for the next change, so a just-returned result won't do;
+            # concurrent long polls still share one held query
+            query = lambda: get_task_status(self, task_id, long_poll_seconds=long_poll_seconds)
+        else:
+            query = lambda: get_task_status(self, task_id)
+        task = _status_coalescer.call(
+            (self._name, task_id, long_poll_seconds), query, reuse_recent=not long_poll_seconds
+        )
+        if task.is_completed():
+            _terminal_tasks.put((self._name, task_id), task)
+        return task
+
+    return wrapper
+
+
 class VideoProvider(ABC):
     """
     Abstract base class for video generation providers.
@@ -70,8 +299,17 @@ class VideoProvider(ABC):
     - get_task_status: Query the status of a task
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every caller (MCP tools, wait loops, agents) polls through
+        # get_task_status, so caching and coalescing apply where providers define it
+        get_task_status = cls.__dict__.get("get_task_status")
+        if get_task_status is not None and not getattr(get_task_status, "__isabstractmethod__", False):
+            cls.get_task_status = _coalesce_status(get_task_status)
+
     def __init__(self):
         self._config: Optional[ProviderConfig] = None
+        self._is_configured: Optional[bool] = None
         self._name: str = ""
 
     @property
@@ -88,14 +326,27 @@ class VideoProvider(ABC):
 
     def initialize(self, config: Optional[ProviderConfig] = None):
         """Initialize the provider with configuration."""
+        self._is_configured = None
         if config is not None:
             self._config = config
         else:
             self._config = get_config().get_provider_config(self._name)
 
+    @property
+    def session(self) -> "requests.Session":
+        """Shared HTTP session for this provider's API host."""
+        return http_session(self.config.base_url)
+
+    def throttle_submit(self):
+        """Wait for the provider's submission rate limit, if one is configured."""
+        if self.config.rate_limit > 0:
+            get_bucket(self._name, self.config.rate_limit, self.config.rate_burst).acquire()
+
     def is_configured(self) -> bool:
-        """Check if provider has valid credentials."""
-        return get_config().is_provider_configured(self._name)
+        """Check if provider has valid credentials; cached until initialize() runs again."""
+        if self._is_configured is None:
+            self._is_configured = get_config().is_provider_configured(self._name)
+        return self._is_configured
 
     @abstractmethod
     def submit_text_to_video(
@@ -144,23 +395,142 @@ class VideoProvider(ABC):
         pass
 
     @abstractmethod
-    def get_task_status(self, task_id: str) -> VideoTask:
+    def get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
         """
         Query the status of a video generation task.
 
         Args:
             task_id: The task ID returned from submit methods
+            long_poll_seconds: Ask the server to hold the query up to this long
+                until the task changes; providers without such a parameter ignore it
 
         Returns:
             VideoTask with current status and video_url if completed
         """
         pass
 
+    def poll_many(self, tasks: Iterable[VideoTask]) -> List[VideoTask]:
+        """
+        Refresh a set of tasks, skipping those still blocked on dependencies.
+
+        A task is only queried once every task in its depends_on has reached
+        a terminal status, either in this batch or in an earlier query;
+        blocked and already finished tasks are returned unchanged.
+
+        Args:
+            tasks: Tasks to refresh, with depends_on set where needed
+
+        Returns:
+            The tasks in the same order, polled ones replaced by fresh status
+        """
+        tasks = list(tasks)
+        done = {task.task_id for task in tasks if task.is_completed()}
+
+        def finished(dep_id: str) -> bool:
+            return dep_id in done or _terminal_tasks.get((self._name, dep_id)) is not None
+
+        results = []
+        for task in tasks:
+            if task.is_completed() or not all(finished(dep) for dep in task.depends_on):
+                results.append(task)
+                continue
+            fresh = self.get_task_status(task.task_id)
+            fresh.depends_on = task.depends_on
+            if fresh.is_completed():
+                done.add(fresh.task_id)
+            results.append(fresh)
+        return results
+
+    async def async_get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        """
+        Query the status of a task without blocking the event loop.
+
+        Runs get_task_status on a worker thread by default; providers with a
+        native async HTTP client can override this.
+
+        Args:
+            task_id: The task ID returned from submit methods
+            long_poll_seconds: Passed to get_task_status
+
+        Returns:
+            VideoTask with current status and video_url if completed
+        """
+        if long_poll_seconds:
+            return await asyncio.to_thread(self.get_task_status, task_id, long_poll_seconds=long_poll_seconds)
+        return await asyncio.to_thread(self.get_task_status, task_id)
+
+    def _long_poll_seconds(self, remaining: float) -> int:
+        """Server-side wait to request for the next status query, bounded by the time left."""
+        if self._config is None or self._config.long_poll_seconds <= 0:
+            return 0
+        return max(0, min(self._config.long_poll_seconds, int(remaining)))
+
+    def _query_status(self, task_id: str, deadline: float) -> Tuple[VideoTask, bool]:
+        """
+        Query a task's status for a wait loop, long-polling when configured.
+
+        Returns:
+            (task, held): held is True when the server kept the query open for
+            at least half the requested wait, so the caller can skip its sleep.
+            A server that ignores the wait answers at once and the caller
+            falls back to its normal backoff.
+        """
+        wait = self._long_poll_seconds(deadline - time.monotonic())
+        if not wait:
+            return self.get_task_status(task_id), False
+        started = time.monotonic()
+        task = self.get_task_status(task_id, long_poll_seconds=wait)
+        return task, time.monotonic() - started >= wait / 2
+
+    async def _async_query_status(self, task_id: str, deadline: float) -> Tuple[VideoTask, bool]:
+        """Async counterpart of _query_status."""
+        wait = self._long_poll_seconds(deadline - time.monotonic())
+        if not wait:
+            return await self.async_get_task_status(task_id), False
+        started = time.monotonic()
+        task = await self.async_get_task_status(task_id, long_poll_seconds=wait)
+        return task, time.monotonic() - started >= wait / 2
+
+    def next_poll_delay(
+        self,
+        task: VideoTask,
+        attempt: int,
+        elapsed: float,
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> float:
+        """
+        Seconds to wait before the next status check of an unfinished task.
+
+        Backs off exponentially from poll_interval with jitter. A provider hint
+        in task.metadata["next_poll_hint"], or an estimate extrapolated from
+        task.progress, can stretch the delay up to max_poll_interval.
+
+        Args:
+            task: The latest status of the task
+            attempt: Number of status checks made before this one
+            elapsed: Seconds since waiting started
+            poll_interval: Initial time between status checks
+            max_poll_interval: Upper bound for the backed-off interval
+        """
+        # The exponent is capped so very long waits can't overflow the power
+        delay = min(max_poll_interval, poll_interval * POLL_BACKOFF ** min(attempt, 64))
+        delay *= random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+        hint = task.metadata.get("next_poll_hint")
+        if hint is None and 0 < task.progress < 100:
+            # Check again halfway to the completion time implied by progress so far
+            hint = elapsed * (100 - task.progress) / task.progress / 2
+        if hint:
+            delay = max(delay, min(hint, max_poll_interval))
+        return delay
+
     def wait_for_completion(
         self,
         task_id: str,
         timeout: Optional[int] = None,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
     ) -> VideoTask:
         """
         Wait for a task to complete.
@@ -168,7 +538,56 @@ class VideoProvider(ABC):
         Args:
             task_id: The task ID to wait for
             timeout: Maximum time to wait in seconds (default from config)
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds
+            max_poll_interval: Longest time between status checks in seconds
+
+        Returns:
+            VideoTask with final status
+
+        Raises:
+            TimeoutError: If task doesn't complete within timeout
+        """
+        if timeout is None:
+            timeout = get_config().global_config.timeout
+
+        # Monotonic, so wall-clock adjustments can't stretch or cut short the wait
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
+        while time.monotonic() < deadline:
+            task, held = self._query_status(task_id, deadline)
+
+            if task.is_completed():
+                return task
+            if held:
+                # The server already waited for a change
+                continue
+
+            now = time.monotonic()
+            delay = self.next_poll_delay(task, attempt, now - start_time, poll_interval, max_poll_interval)
+            time.sleep(max(0, min(delay, deadline - now)))
+            attempt += 1
+
+        raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
+
+    async def async_wait_for_completion(
+        self,
+        task_id: str,
+        timeout: Optional[int] = None,
+        poll_interval: int = 5,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
+    ) -> VideoTask:
+        """
+        Wait for a task to complete without blocking the event loop.
+
+        Same contract as wait_for_completion, but sleeps with asyncio.sleep so
+        many waits can share one event loop.
+
+        Args:
+            task_id: The task ID to wait for
+            timeout: Maximum time to wait in seconds (default from config)
+            poll_interval: Initial time between status checks in seconds
+            max_poll_interval: Longest time between status checks in seconds
 
         Returns:
             VideoTask with final status
@@ -179,17 +598,49 @@ class VideoProvider(ABC):
         if timeout is None:
             timeout = get_config().global_config.timeout
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            task = self.get_task_status(task_id)
+        # Monotonic, so wall-clock adjustments can't stretch or cut short the wait
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
+        while time.monotonic() < deadline:
+            task, held = await self._async_query_status(task_id, deadline)
 
             if task.is_completed():
                 return task
+            if held:
+                # The server already waited for a change
+                continue
 
-            time.sleep(poll_interval)
+            now = time.monotonic()
+            delay = self.next_poll_delay(task, attempt, now - start_time, poll_interval, max_poll_interval)
+            await asyncio.sleep(max(0, min(delay, deadline - now)))
+            attempt += 1
 
         raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
 
+    async def async_wait_for_many(self, task_ids: List[str], timeout: Optional[int] = None) -> List[VideoTask]:
+        """
+        Wait for several tasks concurrently on one event loop.
+
+        The batch takes about as long as its slowest task rather than the sum.
+        A task that times out comes back FAILED instead of raising, so one
+        slow task doesn't discard the others' results.
+
+        Args:
+            task_ids: The task IDs to wait for
+            timeout: Maximum time to wait per task in seconds (provider default if None)
+
+        Returns:
+            Final VideoTasks, in the order of task_ids
+        """
+        async def wait_one(task_id: str) -> VideoTask:
+            try:
+                return await self._async_wait(task_id, timeout)
+            except TimeoutError as e:
+                return VideoTask(task_id=task_id, provider=self._name, status=TaskStatus.FAILED, error_message=str(e))
+
+        return list(await asyncio.gather(*(wait_one(task_id) for task_id in task_ids)))
+
     def text_to_video(
         self,
         prompt: str,
@@ -254,6 +705,79 @@ class VideoProvider(ABC):
 
         return task
 
+    async def async_text_to_video(
+        self,
+        prompt: str,
+        duration: Optional[int] = None,
+        resolution: Optional[str] = None,
+        wait: bool = True,
+        timeout: Optional[int] = None,
+        **kwargs
+    ) -> VideoTask:
+        """
+        Async version of text_to_video.
+
+        The submit request runs on a worker thread; waiting uses
+        async_wait_for_completion.
+
+        Args:
+            prompt: Text description for video generation
+            duration: Video duration in seconds
+            resolution: Video resolution
+            wait: If True, wait for task completion
+            timeout: Maximum time to wait in seconds (default from the provider)
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            VideoTask with final status (if wait=True) or initial status
+        """
+        task = await asyncio.to_thread(self.submit_text_to_video, prompt, duration, resolution, **kwargs)
+
+        if wait:
+            return await self._async_wait(task.task_id, timeout)
+
+        return task
+
+    async def async_image_to_video(
+        self,
+        image_url: str,
+        prompt: str,
+        duration: Optional[int] = None,
+        resolution: Optional[str] = None,
+        wait: bool = True,
+        timeout: Optional[int] = None,
+        **kwargs
+    ) -> VideoTask:
+        """
+        Async version of image_to_video.
+
+        Args:
+            image_url: URL of the reference image
+            prompt: Text description for motion/action
+            duration: Video duration in seconds
+            resolution: Video resolution
+            wait: If True, wait for task completion
+            timeout: Maximum time to wait in seconds (default from the provider)
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            VideoTask with final status (if wait=True) or initial status
+        """
+        task = await asyncio.to_thread(
+            self.submit_image_to_video, image_url, prompt, duration, resolution, **kwargs
+        )
+
+        if wait:
+            return await self._async_wait(task.task_id, timeout)
+
+        return task
+
+    async def _async_wait(self, task_id: str, timeout: Optional[int]) -> VideoTask:
+        """Wait with the provider's own defaults unless a timeout is given."""
+        if timeout is None:
+            return await self.async_wait_for_completion(task_id)
+        return await self.async_wait_for_completion(task_id, timeout)
+
     def test_connection(self) -> dict:
         """
         Test the connection to the provider.
@@ -7,12 +7,52 @@ Supports loading configuration from:
 3. Environment variables (highest priority)
 """
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
+# libyaml's C parser when PyYAML was built with it; same results, ~10x faster
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Parsed YAML by path, with the (mtime_ns, size) it was read at
+_parse_cache: Dict[str, Tuple[int, int, dict]] = {}
+
+
+def _read_yaml(path: Path) -> Optional[dict]:
+    """
+    Parse a YAML file, or return None if it doesn't exist.
+
+    Files unchanged since the last parse (same mtime and size) are served
+    from a cache, so repeated Config() and reload_config() calls cost a stat.
+    Callers get their own copy, since config merging mutates it.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = str(path)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+
+    # One read, and the whole buffer handed to the parser at once
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    parsed = yaml.load(data, Loader=_YamlLoader) or {}
+    _parse_cache[key] = (st.st_mtime_ns, st.st_size, parsed)
+    return copy.deepcopy(parsed)
+
 
 @dataclass
 class ProviderConfig:
@@ -27,6 +67,9 @@ class ProviderConfig:
     region: str = ""
     service: str = ""
     model: str = ""
+    rate_limit: float = 0.0  # Task submissions per second; 0 disables client-side limiting
+    rate_burst: int = 1  # Submissions allowed back to back before rate_limit applies
+    long_poll_seconds: int = 0  # Server-side wait requested per status query; 0 polls normally
     defaults: dict = field(default_factory=dict)
 
 
@@ -42,9 +85,18 @@ class GlobalConfig:
 class Config:
     """Configuration manager for all providers."""
 
+    # Credentials each provider needs before it counts as configured
+    _REQUIRED_CREDENTIALS = {
+        "kling": ("access_key", "secret_key"),
+        "tongyi": ("api_key",),
+        "jimeng": ("access_key", "secret_key"),
+        "hailuo": ("api_key",),
+    }
+
     def __init__(self, config_path: Optional[str] = None):
         self._config: dict = {}
         self._providers: dict[str, ProviderConfig] = {}
+        self._configured: dict[str, bool] = {}
         self._global: GlobalConfig = GlobalConfig()
 
         # Determine config file path
@@ -58,16 +110,14 @@ class Config:
     def _load_config(self):
         """Load configuration from YAML files and environment variables."""
         # Load base config
-        if self._config_path.exists():
-            with open(self._config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
+        base_config = _read_yaml(self._config_path)
+        if base_config is not None:
+            self._config = base_config
 
         # Load local overrides (config.local.yaml)
-        local_config_path = self._config_path.parent / "config.local.yaml"
-        if local_config_path.exists():
-            with open(local_config_path, "r", encoding="utf-8") as f:
-                local_config = yaml.safe_load(f) or {}
-                self._deep_merge(self._config, local_config)
+        local_config = _read_yaml(self._config_path.parent / "config.local.yaml")
+        if local_config is not None:
+            self._deep_merge(self._config, local_config)
 
         # Parse global config
         global_cfg = self._config.get("global", {})
@@ -80,24 +130,30 @@ class Config:
 
         # Parse provider configs
         providers_cfg = self._config.get("providers", {})
+        # One snapshot instead of an os.environ lookup (and key encoding) per field
+        env = dict(os.environ)
         for name, cfg in providers_cfg.items():
-            self._providers[name] = self._parse_provider_config(name, cfg)
+            self._providers[name] = self._parse_provider_config(name, cfg, env)
+            self._configured[name] = self._check_configured(name, self._providers[name])
 
-    def _parse_provider_config(self, name: str, cfg: dict) -> ProviderConfig:
-        """Parse a provider configuration with environment variable overrides."""
-        env_prefix = name.upper()
+    def _parse_provider_config(self, name: str, cfg: dict, env: Dict[str, str]) -> ProviderConfig:
+        """Parse a provider configuration with environment variable overrides from env."""
+        prefix = name.upper() + "_"
 
         return ProviderConfig(
             enabled=cfg.get("enabled", False),
             name=cfg.get("name", name),
-            base_url=os.getenv(f"{env_prefix}_BASE_URL", cfg.get("base_url", "")),
-            api_key=os.getenv(f"{env_prefix}_API_KEY", cfg.get("api_key", "")),
-            access_key=os.getenv(f"{env_prefix}_ACCESS_KEY", cfg.get("access_key", "")),
-            secret_key=os.getenv(f"{env_prefix}_SECRET_KEY", cfg.get("secret_key", "")),
-            ark_api_key=os.getenv(f"{env_prefix}_ARK_API_KEY", os.getenv("ARK_API_KEY", cfg.get("ark_api_key", ""))),
+            base_url=env.get(prefix + "BASE_URL", cfg.get("base_url", "")),
+            api_key=env.get(prefix + "API_KEY", cfg.get("api_key", "")),
+            access_key=env.get(prefix + "ACCESS_KEY", cfg.get("access_key", "")),
+            secret_key=env.get(prefix + "SECRET_KEY", cfg.get("secret_key", "")),
+            ark_api_key=env.get(prefix + "ARK_API_KEY", env.get("ARK_API_KEY", cfg.get("ark_api_key", ""))),
             region=cfg.get("region", ""),
             service=cfg.get("service", ""),
-            model=os.getenv(f"{env_prefix}_MODEL", cfg.get("model", "")),
+            model=env.get(prefix + "MODEL", cfg.get("model", "")),
+            rate_limit=float(env.get(prefix + "RATE_LIMIT", cfg.get("rate_limit", 0))),
+            rate_burst=int(cfg.get("rate_burst", 1)),
+            long_poll_seconds=int(env.get(prefix + "LONG_POLL_SECONDS", cfg.get("long_poll_seconds", 0))),
             defaults=cfg.get("defaults", {}),
         )
 
@@ -130,40 +186,48 @@ class Config:
 
     def is_provider_configured(self, name: str) -> bool:
         """Check if a provider has valid credentials configured."""
-        if name not in self._providers:
-            return False
+        return self._configured.get(name, False)
 
-        cfg = self._providers[name]
-        if not cfg.enabled:
+    def _check_configured(self, name: str, cfg: ProviderConfig) -> bool:
+        """Whether a provider is enabled and has every credential it requires."""
+        required = self._REQUIRED_CREDENTIALS.get(name)
+        if not cfg.enabled or required is None:
             return False
-
-        # Check for required credentials based on provider type
-        if name == "kling":
-            return bool(cfg.access_key and cfg.secret_key)
-        elif name == "tongyi":
-            return bool(cfg.api_key)
-        elif name == "jimeng":
-            return bool(cfg.access_key and cfg.secret_key)
-        elif name == "hailuo":
-            return bool(cfg.api_key)
-
-        return False
+        return all(getattr(cfg, field_name) for field_name in required)
 
 
 # Global config instance
 _config: Optional[Config] = None
 
 
+@functools.lru_cache(maxsize=None)
+def _build_config(config_path: Optional[str]) -> Config:
+    """One Config per resolved path, until reload_config() clears them."""
+    return Config(config_path)
+
+
+def _resolve(config_path: Optional[str]) -> Optional[str]:
+    return os.path.realpath(config_path) if config_path is not None else None
+
+
 def get_config(config_path: Optional[str] = None) -> Config:
-    """Get the global configuration instance."""
+    """
+    Get the global configuration instance.
+
+    Passing a path makes that file's configuration the global one; asking
+    for the same path again reuses the loaded instance.
+    """
     global _config
-    if _config is None or config_path is not None:
-        _config = Config(config_path)
+    if config_path is not None:
+        _config = _build_config(_resolve(config_path))
+    elif _config is None:
+        _config = _build_config(None)
     return _config
 
 
 def reload_config(config_path: Optional[str] = None) -> Config:
     """Reload configuration from disk."""
     global _config
-    _config = Config(config_path)
+    _build_config.cache_clear()
+    _config = _build_config(_resolve(config_path))
     return _config
@@ -32,6 +32,8 @@ Utility:
 - test_connection(): Test provider connection
 """
 
+import importlib
+
 from .base import (
     ImageProvider,
     ImageTask,
@@ -41,8 +43,15 @@ from .base import (
     ArtStyle,
     ImageSize,
 )
-from .tongyi import TongyiImageProvider, TONGYI_IMAGE_MODELS
-from .jimeng import JiMengImageProvider, JIMENG_IMAGE_MODELS
+
+# Provider modules pull in HTTP clients and config, so they are imported on
+# first attribute access (PEP 562) rather than with the package.
+_LAZY_ATTRS = {
+    "TongyiImageProvider": ".tongyi",
+    "TONGYI_IMAGE_MODELS": ".tongyi",
+    "JiMengImageProvider": ".jimeng",
+    "JIMENG_IMAGE_MODELS": ".jimeng",
+}
 
 __all__ = [
     # Base classes
@@ -59,3 +68,12 @@ __all__ = [
     "JiMengImageProvider",
     "JIMENG_IMAGE_MODELS",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
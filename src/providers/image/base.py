@@ -106,7 +106,7 @@ class CharacterRef:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageTask:
     """Represents an image generation task."""
     task_id: str
@@ -0,0 +1,68 @@
+"""
+Client-side rate limiting for provider APIs.
+
+Providers reject bursts of task submissions with 429 responses, and the
+retries that follow cost more wall time than pacing the requests would.
+A TokenBucket spaces submissions to a provider's sustained rate while still
+allowing a short burst.
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Tokens go negative so concurrent callers queue up in arrival order
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+_buckets: Dict[str, Tuple[float, int, TokenBucket]] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(name: str, rate: float, capacity: int = 1) -> TokenBucket:
+    """
+    Get the shared bucket for a provider.
+
+    All instances of a provider draw from one bucket, since the provider's
+    limit applies per account rather than per client object.
+
+    Args:
+        name: Provider name
+        rate: Sustained requests per second
+        capacity: Burst size
+
+    Returns:
+        The provider's TokenBucket, replaced if rate or capacity changed
+    """
+    with _buckets_lock:
+        entry = _buckets.get(name)
+        if entry is None or entry[:2] != (rate, capacity):
+            entry = (rate, capacity, TokenBucket(rate, capacity))
+            _buckets[name] = entry
+        return entry[2]
@@ -171,11 +171,11 @@ def test_text_to_video(
 
         # Wait for completion
         print_info(f"Waiting for completion (timeout: {timeout}s)...")
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             task = provider.get_task_status(task.task_id)
-            elapsed = int(time.time() - start_time)
+            elapsed = int(time.monotonic() - start_time)
             print(f"\r  Status: {task.status.value} | Progress: {task.progress}% | Elapsed: {elapsed}s    ", end="")
 
             if task.is_completed():
@@ -227,11 +227,11 @@ def test_image_to_video(
 
         # Wait for completion
         print_info(f"Waiting for completion (timeout: {timeout}s)...")
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             task = provider.get_task_status(task.task_id)
-            elapsed = int(time.time() - start_time)
+            elapsed = int(time.monotonic() - start_time)
             print(f"\r  Status: {task.status.value} | Progress: {task.progress}% | Elapsed: {elapsed}s    ", end="")
 
             if task.is_completed():
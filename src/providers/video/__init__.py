@@ -4,10 +4,16 @@ Video Generation Providers
 Providers for various video generation platforms.
 """
 
-from .kling import KlingProvider
-from .hailuo import HailuoProvider
-from .jimeng import JimengProvider
-from .tongyi import TongyiProvider
+import importlib
+
+# Each provider module is imported on first attribute access (PEP 562), so
+# importing one provider doesn't load the rest.
+_LAZY_ATTRS = {
+    "KlingProvider": ".kling",
+    "HailuoProvider": ".hailuo",
+    "JimengProvider": ".jimeng",
+    "TongyiProvider": ".tongyi",
+}
 
 __all__ = [
     "KlingProvider",
@@ -15,3 +21,12 @@ __all__ = [
     "JimengProvider",
     "TongyiProvider",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
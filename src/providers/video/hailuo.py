@@ -5,13 +5,18 @@ API Documentation: https://platform.minimaxi.com/docs/api-reference/video-genera
 Base URL: https://api.minimaxi.com
 """
 
+import asyncio
 import time
-import requests
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from ..base import VideoProvider, VideoTask, TaskStatus
-from ..config import get_config
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+from ..base import DEFAULT_MAX_POLL_INTERVAL, TERMINAL_STATUSES, VideoProvider, VideoTask, TaskStatus
+from ..config import get_config, ProviderConfig
 
 
 class HailuoProvider(VideoProvider):
@@ -114,30 +119,52 @@ class HailuoProvider(VideoProvider):
         }
     }
 
+    # list_models() output, built once from MODELS
+    _MODELS_LIST = [{"model": model_id, **model_info} for model_id, model_info in MODELS.items()]
+
+    # MiniMax task status -> TaskStatus
+    _STATUS_MAP = {
+        "Preparing": TaskStatus.PENDING,
+        "Queueing": TaskStatus.PENDING,
+        "Processing": TaskStatus.PROCESSING,
+        "Success": TaskStatus.COMPLETED,
+        "Fail": TaskStatus.FAILED,
+    }
+
     def __init__(self):
         super().__init__()
         self._name = "hailuo"
         self.initialize()
 
-    def _get_headers(self) -> dict:
-        """Get request headers with authentication."""
-        return {
+    def initialize(self, config: Optional[ProviderConfig] = None):
+        """Initialize the provider, building the base URL and headers every request uses."""
+        super().initialize(config)
+        self._base_url = self.config.base_url
+        self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.config.api_key}"
         }
 
+    def _get_headers(self) -> dict:
+        """Get request headers with authentication."""
+        return self._headers
+
     def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None) -> dict:
         """Make an API request to MiniMax."""
-        url = f"{self.config.base_url}{endpoint}"
-        headers = self._get_headers()
+        url = self._base_url + endpoint
+        headers = self._headers
 
         if method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers)
+            if orjson is not None and data is not None:
+                # Content-Type is already set in the headers
+                response = self.session.post(url, data=orjson.dumps(data), headers=headers)
+            else:
+                response = self.session.post(url, json=data, headers=headers)
         else:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
 
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content) if orjson is not None else response.json()
 
         # Check for API errors
         base_resp = result.get("base_resp", {})
@@ -148,13 +175,7 @@ class HailuoProvider(VideoProvider):
 
     def list_models(self) -> List[Dict[str, Any]]:
         """List available Hailuo models."""
-        return [
-            {
-                "model": model_id,
-                **model_info
-            }
-            for model_id, model_info in self.MODELS.items()
-        ]
+        return list(self._MODELS_LIST)
 
     def submit_text_to_video(
         self,
@@ -210,6 +231,7 @@ class HailuoProvider(VideoProvider):
         if "callback_url" in kwargs:
             data["callback_url"] = kwargs["callback_url"]
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/video_generation", data)
 
         task_id = result.get("task_id", "")
@@ -281,6 +303,7 @@ class HailuoProvider(VideoProvider):
         if "aigc_watermark" in kwargs:
             data["aigc_watermark"] = kwargs["aigc_watermark"]
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/video_generation", data)
 
         task_id = result.get("task_id", "")
@@ -328,6 +351,7 @@ class HailuoProvider(VideoProvider):
         if "aigc_watermark" in kwargs:
             data["aigc_watermark"] = kwargs["aigc_watermark"]
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/video_generation", data)
 
         task_id = result.get("task_id", "")
@@ -340,14 +364,7 @@ class HailuoProvider(VideoProvider):
 
     def _map_status(self, status_str: str) -> TaskStatus:
         """Map MiniMax status string to TaskStatus enum."""
-        status_map = {
-            "Preparing": TaskStatus.PENDING,
-            "Queueing": TaskStatus.PENDING,
-            "Processing": TaskStatus.PROCESSING,
-            "Success": TaskStatus.COMPLETED,
-            "Fail": TaskStatus.FAILED,
-        }
-        return status_map.get(status_str, TaskStatus.PENDING)
+        return self._STATUS_MAP.get(status_str, TaskStatus.PENDING)
 
     def get_file_download_url(self, file_id: str) -> str:
         """
@@ -363,9 +380,12 @@ class HailuoProvider(VideoProvider):
         file_info = result.get("file", {})
         return file_info.get("download_url", "")
 
-    def get_task_status(self, task_id: str) -> VideoTask:
-        """Query the status of a video generation task."""
-        result = self._make_request("GET", "/v1/query/video_generation", params={"task_id": task_id})
+    def get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        """Query the status of a video generation task, long-polling if asked to."""
+        params = {"task_id": task_id}
+        if long_poll_seconds:
+            params["wait"] = long_poll_seconds
+        result = self._make_request("GET", "/v1/query/video_generation", params=params)
 
         status_str = result.get("status", "Queueing")
         status = self._map_status(status_str)
@@ -391,7 +411,7 @@ class HailuoProvider(VideoProvider):
             status=status,
             video_url=video_url,
             error_message=error_message,
-            completed_at=datetime.now() if status in (TaskStatus.COMPLETED, TaskStatus.FAILED) else None,
+            completed_at=datetime.now() if status in TERMINAL_STATUSES else None,
             metadata={
                 "task_data": result,
                 "file_id": file_id,
@@ -404,7 +424,8 @@ class HailuoProvider(VideoProvider):
         self,
         task_id: str,
         timeout: int = 300,
-        poll_interval: int = 10
+        poll_interval: int = 10,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
     ) -> VideoTask:
         """
         Wait for a task to complete.
@@ -412,23 +433,70 @@ class HailuoProvider(VideoProvider):
         Args:
             task_id: The task ID to wait for
             timeout: Maximum time to wait in seconds (default 300)
-            poll_interval: Time between status checks in seconds (default 10)
+            poll_interval: Initial time between status checks in seconds (default 10)
+            max_poll_interval: Longest time between status checks in seconds
+        """
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
+
+        while True:
+            task, held = self._query_status(task_id, deadline)
+
+            if task.is_completed():
+                return task
+
+            now = time.monotonic()
+            if now >= deadline:
+                task.status = TaskStatus.FAILED
+                task.error_message = f"Timeout after {timeout} seconds"
+                return task
+            if held:
+                # The server already waited for a change
+                continue
+
+            delay = self.next_poll_delay(task, attempt, now - start_time, poll_interval, max_poll_interval)
+            time.sleep(min(delay, deadline - now))
+            attempt += 1
+
+    async def async_wait_for_completion(
+        self,
+        task_id: str,
+        timeout: int = 300,
+        poll_interval: int = 10,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
+    ) -> VideoTask:
+        """
+        Wait for a task to complete without blocking the event loop.
+
+        Args:
+            task_id: The task ID to wait for
+            timeout: Maximum time to wait in seconds (default 300)
+            poll_interval: Initial time between status checks in seconds (default 10)
+            max_poll_interval: Longest time between status checks in seconds
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
 
         while True:
-            task = self.get_task_status(task_id)
+            task, held = await self._async_query_status(task_id, deadline)
 
-            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+            if task.is_completed():
                 return task
 
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
+            now = time.monotonic()
+            if now >= deadline:
                 task.status = TaskStatus.FAILED
                 task.error_message = f"Timeout after {timeout} seconds"
                 return task
+            if held:
+                # The server already waited for a change
+                continue
 
-            time.sleep(poll_interval)
+            delay = self.next_poll_delay(task, attempt, now - start_time, poll_interval, max_poll_interval)
+            await asyncio.sleep(min(delay, deadline - now))
+            attempt += 1
 
     def test_connection(self) -> dict:
         """Test connection to MiniMax API."""
@@ -14,7 +14,6 @@ import base64
 import hashlib
 import hmac
 import json
-import requests
 from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
@@ -191,7 +190,7 @@ class JimengProvider(VideoProvider):
         query_string = "&".join(f"{k}={v}" for k, v in params.items())
         url = f"{self.config.base_url}?{query_string}"
 
-        response = requests.post(url, data=body_str, headers=headers, timeout=30)
+        response = self.session.post(url, data=body_str, headers=headers, timeout=30)
         response.raise_for_status()
         result = response.json()
 
@@ -259,6 +258,7 @@ class JimengProvider(VideoProvider):
             "seed": kwargs.get("seed", -1),
         }
 
+        self.throttle_submit()
         result = self._make_request("CVSync2AsyncSubmitTask", body)
 
         # Extract task_id from response
@@ -339,6 +339,7 @@ class JimengProvider(VideoProvider):
         if binary_data:
             body["binary_data_base64"] = binary_data
 
+        self.throttle_submit()
         result = self._make_request("CVSync2AsyncSubmitTask", body)
 
         data = result.get("data", {})
@@ -356,8 +357,8 @@ class JimengProvider(VideoProvider):
             }
         )
 
-    def get_task_status(self, task_id: str) -> VideoTask:
-        """Query the status of a video generation task."""
+    def get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        """Query the status of a video generation task (the API has no server-side wait)."""
         body = {
             "req_key": self.config.model or self.DEFAULT_MODEL,
             "task_id": task_id,
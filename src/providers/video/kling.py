@@ -5,13 +5,13 @@ API Documentation: https://app.klingai.com/cn/dev/document-api
 Model: kling-video-o1 (Omni-Video)
 """
 
+import asyncio
 import jwt
 import time
-import requests
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from ..base import VideoProvider, VideoTask, TaskStatus
+from ..base import DEFAULT_MAX_POLL_INTERVAL, TERMINAL_STATUSES, VideoProvider, VideoTask, TaskStatus
 from ..config import get_config
 
 
@@ -76,15 +76,15 @@ class KlingProvider(VideoProvider):
             "Authorization": f"Bearer {self._generate_jwt_token()}"
         }
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None) -> dict:
+    def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None) -> dict:
         """Make an API request to Kling."""
         url = f"{self.config.base_url}{endpoint}"
         headers = self._get_headers()
 
         if method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers)
+            response = self.session.post(url, json=data, headers=headers)
         else:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, params=params)
 
         response.raise_for_status()
         result = response.json()
@@ -140,6 +140,7 @@ class KlingProvider(VideoProvider):
         if "callback_url" in kwargs:
             data["callback_url"] = kwargs["callback_url"]
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/videos/omni-video", data)
 
         task_data = result.get("data", {})
@@ -201,6 +202,7 @@ class KlingProvider(VideoProvider):
 
         # Note: aspect_ratio is not supported for image-to-video
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/videos/omni-video", data)
 
         task_data = result.get("data", {})
@@ -262,6 +264,7 @@ class KlingProvider(VideoProvider):
         if "aspect_ratio" in kwargs:
             data["aspect_ratio"] = kwargs["aspect_ratio"]
 
+        self.throttle_submit()
         result = self._make_request("POST", "/v1/videos/omni-video", data)
 
         task_data = result.get("data", {})
@@ -282,9 +285,10 @@ class KlingProvider(VideoProvider):
         }
         return status_map.get(status_str.lower(), TaskStatus.PENDING)
 
-    def get_task_status(self, task_id: str) -> VideoTask:
-        """Query the status of a video generation task."""
-        result = self._make_request("GET", f"/v1/videos/omni-video/{task_id}")
+    def get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        """Query the status of a video generation task, long-polling if asked to."""
+        params = {"wait": long_poll_seconds} if long_poll_seconds else None
+        result = self._make_request("GET", f"/v1/videos/omni-video/{task_id}", params=params)
 
         task_data = result.get("data", {})
         status = self._map_status(task_data.get("task_status", "submitted"))
@@ -304,7 +308,7 @@ class KlingProvider(VideoProvider):
             status=status,
             video_url=video_url,
             error_message=task_data.get("task_status_msg") if status == TaskStatus.FAILED else None,
-            completed_at=datetime.now() if status in (TaskStatus.COMPLETED, TaskStatus.FAILED) else None,
+            completed_at=datetime.now() if status in TERMINAL_STATUSES else None,
             metadata={
                 "task_data": task_data,
                 "video_duration": video_duration
@@ -315,7 +319,8 @@ class KlingProvider(VideoProvider):
         self,
         task_id: str,
         timeout: int = 300,
-        poll_interval: int = 10
+        poll_interval: int = 10,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
     ) -> VideoTask:
         """
         Wait for a task to complete.
@@ -323,23 +328,70 @@ class KlingProvider(VideoProvider):
         Args:
             task_id: The task ID to wait for
             timeout: Maximum time to wait in seconds (default 300)
-            poll_interval: Time between status checks in seconds (default 10)
+            poll_interval: Initial time between status checks in seconds (default 10)
+            max_poll_interval: Longest time between status checks in seconds
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
 
         while True:
-            task = self.get_task_status(task_id)
+            task, held = self._query_status(task_id, deadline)
 
-            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+            if task.is_completed():
                 return task
 
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= timeout:
                 task.status = TaskStatus.FAILED
                 task.error_message = f"Timeout after {timeout} seconds"
                 return task
+            if held:
+                # The server already waited for a change
+                continue
 
-            time.sleep(poll_interval)
+            delay = self.next_poll_delay(task, attempt, elapsed, poll_interval, max_poll_interval)
+            time.sleep(min(delay, timeout - elapsed))
+            attempt += 1
+
+    async def async_wait_for_completion(
+        self,
+        task_id: str,
+        timeout: int = 300,
+        poll_interval: int = 10,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL
+    ) -> VideoTask:
+        """
+        Wait for a task to complete without blocking the event loop.
+
+        Args:
+            task_id: The task ID to wait for
+            timeout: Maximum time to wait in seconds (default 300)
+            poll_interval: Initial time between status checks in seconds (default 10)
+            max_poll_interval: Longest time between status checks in seconds
+        """
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        attempt = 0
+
+        while True:
+            task, held = await self._async_query_status(task_id, deadline)
+
+            if task.is_completed():
+                return task
+
+            elapsed = time.monotonic() - start_time
+            if elapsed >= timeout:
+                task.status = TaskStatus.FAILED
+                task.error_message = f"Timeout after {timeout} seconds"
+                return task
+            if held:
+                # The server already waited for a change
+                continue
+
+            delay = self.next_poll_delay(task, attempt, elapsed, poll_interval, max_poll_interval)
+            await asyncio.sleep(min(delay, timeout - elapsed))
+            attempt += 1
 
     def test_connection(self) -> dict:
         """Test connection to Kling API."""
@@ -129,9 +129,9 @@ class TongyiProvider(VideoProvider):
         headers = self._get_headers(async_mode)
 
         if method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            response = self.session.post(url, json=data, headers=headers, timeout=30)
         else:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
 
         response.raise_for_status()
         result = response.json()
@@ -232,6 +232,7 @@ class TongyiProvider(VideoProvider):
             "parameters": parameters,
         }
 
+        self.throttle_submit()
         result = self._make_request("POST", self.VIDEO_SYNTHESIS_ENDPOINT, data)
 
         output = result.get("output", {})
@@ -317,6 +318,7 @@ class TongyiProvider(VideoProvider):
             "parameters": parameters,
         }
 
+        self.throttle_submit()
         result = self._make_request("POST", self.VIDEO_SYNTHESIS_ENDPOINT, data)
 
         output = result.get("output", {})
@@ -327,12 +329,12 @@ class TongyiProvider(VideoProvider):
             metadata={"prompt": prompt, "image_url": image_url, "model": model, "params": data}
         )
 
-    def get_task_status(self, task_id: str) -> VideoTask:
-        """Query the status of a video generation task."""
+    def get_task_status(self, task_id: str, long_poll_seconds: int = 0) -> VideoTask:
+        """Query the status of a video generation task (the API has no server-side wait)."""
         url = f"{self.config.base_url}{self.TASK_QUERY_ENDPOINT}/{task_id}"
         headers = self._get_headers(async_mode=False)
 
-        response = requests.get(url, headers=headers, timeout=30)
+        response = self.session.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         result = response.json()
 
@@ -416,7 +418,7 @@ class TongyiProvider(VideoProvider):
             # Try to query a non-existent task to verify auth
             # A 404 means auth worked, other errors mean auth failed
             url = f"{self.config.base_url}/tasks/test-connection-check"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
 
             # If we get a 404 or task not found, the API key is valid
             if response.status_code == 404:
@@ -8,11 +8,52 @@ import sqlite3
 import json
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
 from .models import Project, Character, Episode, Shot, MajorEvent, EditHistory, APICallLog, PromptTemplate
 
+# 批量插入镜头的语句；参数顺序: episode_id, _SHOT_DEFAULTS 各字段, generated_prompts
+_SHOT_INSERT_SQL = """
+    INSERT INTO shots (episode_id, scene_number, shot_number, shot_type,
+                       duration, visual_description, dialogue, sound_music,
+                       camera_movement, notes, generated_prompts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 同上，仅当剧集存在时插入；参数末尾追加 episode_id
+_SHOT_INSERT_CHECKED_SQL = """
+    INSERT INTO shots (episode_id, scene_number, shot_number, shot_type,
+                       duration, visual_description, dialogue, sound_music,
+                       camera_movement, notes, generated_prompts)
+    SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    WHERE EXISTS (SELECT 1 FROM episodes WHERE id = ?)
+"""
+
+# 各表允许按字段局部更新的列（列名会拼入 SQL，只接受白名单内的字段）
+_UPDATABLE_COLUMNS = {
+    "projects": ("name", "description", "genre", "style", "target_audience",
+                 "num_episodes", "episode_duration", "max_video_duration"),
+    "characters": ("name", "age", "appearance", "personality", "background",
+                   "relationships", "visual_description"),
+    "episodes": ("episode_number", "title", "outline", "duration", "status"),
+    "shots": ("scene_number", "shot_number", "shot_type", "duration", "visual_description",
+              "dialogue", "sound_music", "camera_movement", "notes"),
+}
+
+# 镜头字段默认值（与 Shot 数据类一致）
+_SHOT_DEFAULTS = {
+    "scene_number": 1,
+    "shot_number": 1,
+    "shot_type": "medium",
+    "duration": 5,
+    "visual_description": "",
+    "dialogue": "",
+    "sound_music": "",
+    "camera_movement": "static",
+    "notes": "",
+}
+
 
 class Database:
     """SQLite数据库管理类"""
@@ -25,7 +66,8 @@ class Database:
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         else:
             # 内存数据库需要保持连接，否则每次连接都是新数据库
-            self._persistent_conn = sqlite3.connect(":memory:")
+            # MCP 服务在线程池中访问数据库；sqlite3 为 serialized 模式，可跨线程共享连接
+            self._persistent_conn = sqlite3.connect(":memory:", check_same_thread=False)
             self._persistent_conn.row_factory = sqlite3.Row
         self._init_database()
 
@@ -42,6 +84,12 @@ class Database:
         if self._persistent_conn is None:
             conn.close()
 
+    def close(self):
+        """关闭内存数据库的持久连接（文件数据库每次调用自行开关连接）"""
+        if self._persistent_conn is not None:
+            self._persistent_conn.close()
+            self._persistent_conn = None
+
     def _init_database(self):
         """初始化数据库表结构"""
         conn = self._get_connection()
@@ -183,6 +231,36 @@ class Database:
         conn.commit()
         self._close_connection(conn)
 
+    def _update_fields(self, table: str, row_id: int, fields: dict) -> bool:
+        """
+        只更新给定字段（无需先读出整行），返回记录是否存在
+
+        带 updated_at 的表会同时刷新更新时间；没有字段可更新时仅检查记录是否存在。
+        """
+        unknown = set(fields) - set(_UPDATABLE_COLUMNS[table])
+        if unknown:
+            raise ValueError(f"Cannot update {table} columns: {sorted(unknown)}")
+
+        assignments = [f"{column}=?" for column in fields]
+        params = list(fields.values())
+        if table != "shots":
+            assignments.append("updated_at=?")
+            params.append(datetime.now().isoformat())
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        if assignments:
+            cursor.execute(f"UPDATE {table} SET {', '.join(assignments)} WHERE id=?", (*params, row_id))
+            found = cursor.rowcount > 0
+            conn.commit()
+        else:
+            cursor.execute(f"SELECT 1 FROM {table} WHERE id=?", (row_id,))
+            found = cursor.fetchone() is not None
+
+        self._close_connection(conn)
+        return found
+
     # ==================== Project CRUD ====================
 
     def create_project(self, project: Project) -> int:
@@ -271,8 +349,12 @@ class Database:
         self._close_connection(conn)
         project.updated_at = datetime.fromisoformat(now)
 
-    def delete_project(self, project_id: int):
-        """删除项目（级联删除人物、剧集、镜头）"""
+    def update_project_fields(self, project_id: int, fields: dict) -> bool:
+        """局部更新项目字段，项目不存在时返回 False"""
+        return self._update_fields("projects", project_id, fields)
+
+    def delete_project(self, project_id: int) -> bool:
+        """删除项目（级联删除人物、剧集、镜头），返回项目是否存在"""
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -281,9 +363,11 @@ class Database:
         cursor.execute("DELETE FROM episodes WHERE project_id=?", (project_id,))
         cursor.execute("DELETE FROM characters WHERE project_id=?", (project_id,))
         cursor.execute("DELETE FROM projects WHERE id=?", (project_id,))
+        found = cursor.rowcount > 0
 
         conn.commit()
         self._close_connection(conn)
+        return found
 
     def list_projects(self) -> List[Project]:
         """列出所有项目（不包含详细数据）"""
@@ -320,6 +404,30 @@ class Database:
         self._close_connection(conn)
         return projects
 
+    def list_projects_summary(self) -> List[dict]:
+        """列出项目摘要（只查询列表需要的列，不构造 Project 对象）"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT id, name,
+                   COALESCE(NULLIF(genre, ''), 'drama') AS genre,
+                   COALESCE(NULLIF(num_episodes, 0), 1) AS num_episodes,
+                   created_at, updated_at
+            FROM projects ORDER BY updated_at DESC
+        """)
+        rows = cursor.fetchall()
+        self._close_connection(conn)
+
+        now = datetime.now().isoformat()
+        summaries = []
+        for row in rows:
+            summary = dict(row)
+            summary["created_at"] = summary["created_at"] or now
+            summary["updated_at"] = summary["updated_at"] or now
+            summaries.append(summary)
+        return summaries
+
     # ==================== Character CRUD ====================
 
     def create_character(self, character: Character) -> int:
@@ -346,6 +454,31 @@ class Database:
         character.id = character_id
         return character_id
 
+    def create_character_checked(self, character: Character) -> Optional[int]:
+        """创建人物（项目存在性检查与插入合并为一条语句），项目不存在时返回 None"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        now = datetime.now().isoformat()
+        major_events_json = json.dumps([e.to_dict() for e in character.major_events], ensure_ascii=False)
+
+        cursor.execute("""
+            INSERT INTO characters (project_id, name, age, appearance, personality,
+                                    background, relationships, visual_description,
+                                    major_events, created_at, updated_at)
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM projects WHERE id = ?)
+        """, (character.project_id, character.name, character.age, character.appearance,
+              character.personality, character.background, character.relationships,
+              character.visual_description, major_events_json, now, now, character.project_id))
+
+        character_id = cursor.lastrowid if cursor.rowcount else None
+        conn.commit()
+        self._close_connection(conn)
+
+        character.id = character_id
+        return character_id
+
     def get_character(self, character_id: int) -> Optional[Character]:
         """获取人物"""
         conn = self._get_connection()
@@ -402,13 +535,34 @@ class Database:
         self._close_connection(conn)
         character.updated_at = datetime.fromisoformat(now)
 
-    def delete_character(self, character_id: int):
-        """删除人物"""
+    def update_character_fields(self, character_id: int, fields: dict) -> bool:
+        """局部更新人物字段，人物不存在时返回 False"""
+        return self._update_fields("characters", character_id, fields)
+
+    def append_character_event(self, character_id: int, event: MajorEvent) -> bool:
+        """在 SQL 中追加一条人物重大经历（不读出整行），人物不存在时返回 False"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE characters
+            SET major_events = json_insert(COALESCE(NULLIF(major_events, ''), '[]'), '$[#]', json(?)),
+                updated_at = ?
+            WHERE id = ?
+        """, (json.dumps(event.to_dict(), ensure_ascii=False), datetime.now().isoformat(), character_id))
+        found = cursor.rowcount > 0
+        conn.commit()
+        self._close_connection(conn)
+        return found
+
+    def delete_character(self, character_id: int) -> bool:
+        """删除人物，返回人物是否存在"""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM characters WHERE id=?", (character_id,))
+        found = cursor.rowcount > 0
         conn.commit()
         self._close_connection(conn)
+        return found
 
     def get_characters_by_project(self, project_id: int) -> List[Character]:
         """获取项目的所有人物"""
@@ -466,8 +620,29 @@ class Database:
         episode.id = episode_id
         return episode_id
 
-    def get_episode(self, episode_id: int) -> Optional[Episode]:
-        """获取剧集（包含镜头）"""
+    def create_episode_checked(self, episode: Episode) -> Optional[int]:
+        """创建剧集（项目存在性检查与插入合并为一条语句），项目不存在时返回 None"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        now = datetime.now().isoformat()
+        cursor.execute("""
+            INSERT INTO episodes (project_id, episode_number, title, outline,
+                                  duration, status, created_at, updated_at)
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM projects WHERE id = ?)
+        """, (episode.project_id, episode.episode_number, episode.title, episode.outline,
+              episode.duration, episode.status, now, now, episode.project_id))
+
+        episode_id = cursor.lastrowid if cursor.rowcount else None
+        conn.commit()
+        self._close_connection(conn)
+
+        episode.id = episode_id
+        return episode_id
+
+    def get_episode(self, episode_id: int, include_shots: bool = True) -> Optional[Episode]:
+        """获取剧集（默认包含镜头）"""
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -491,7 +666,8 @@ class Database:
         )
 
         # 加载镜头
-        episode.shots = self.get_shots_by_episode(episode_id)
+        if include_shots:
+            episode.shots = self.get_shots_by_episode(episode_id)
 
         self._close_connection(conn)
         return episode
@@ -513,14 +689,45 @@ class Database:
         self._close_connection(conn)
         episode.updated_at = datetime.fromisoformat(now)
 
-    def delete_episode(self, episode_id: int):
-        """删除剧集（级联删除镜头）"""
+    def update_episode_fields(self, episode_id: int, fields: dict) -> bool:
+        """局部更新剧集字段，剧集不存在时返回 False"""
+        return self._update_fields("episodes", episode_id, fields)
+
+    def delete_episode(self, episode_id: int) -> bool:
+        """删除剧集（级联删除镜头），返回剧集是否存在"""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM shots WHERE episode_id=?", (episode_id,))
         cursor.execute("DELETE FROM episodes WHERE id=?", (episode_id,))
+        found = cursor.rowcount > 0
         conn.commit()
         self._close_connection(conn)
+        return found
+
+    def list_episodes_summary(self, project_id: int) -> List[dict]:
+        """列出项目的剧集摘要（镜头数与总时长由 SQL 聚合，不加载镜头）"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # 空值默认值与 get_episodes_by_project / get_shots_by_episode 一致
+        cursor.execute("""
+            SELECT e.id, e.episode_number,
+                   COALESCE(e.title, '') AS title,
+                   COALESCE(e.outline, '') AS outline,
+                   COALESCE(NULLIF(e.duration, 0), 60) AS duration,
+                   COALESCE(NULLIF(e.status, ''), 'outline') AS status,
+                   COUNT(s.id) AS shot_count,
+                   COALESCE(SUM(CASE WHEN s.id IS NULL THEN 0
+                                     ELSE COALESCE(NULLIF(s.duration, 0), 5) END), 0) AS total_duration
+            FROM episodes e
+            LEFT JOIN shots s ON s.episode_id = e.id
+            WHERE e.project_id = ?
+            GROUP BY e.id
+            ORDER BY e.episode_number
+        """, (project_id,))
+        rows = cursor.fetchall()
+        self._close_connection(conn)
+        return [dict(row) for row in rows]
 
     def get_episodes_by_project(self, project_id: int) -> List[Episode]:
         """获取项目的所有剧集"""
@@ -574,6 +781,29 @@ class Database:
         shot.id = shot_id
         return shot_id
 
+    def create_shot_checked(self, shot: Shot) -> Optional[int]:
+        """创建镜头（剧集存在性检查与插入合并为一条语句），剧集不存在时返回 None"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        prompts_json = json.dumps(shot.generated_prompts, ensure_ascii=False)
+        cursor.execute("""
+            INSERT INTO shots (episode_id, scene_number, shot_number, shot_type,
+                               duration, visual_description, dialogue, sound_music,
+                               camera_movement, notes, generated_prompts)
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM episodes WHERE id = ?)
+        """, (shot.episode_id, shot.scene_number, shot.shot_number, shot.shot_type,
+              shot.duration, shot.visual_description, shot.dialogue, shot.sound_music,
+              shot.camera_movement, shot.notes, prompts_json, shot.episode_id))
+
+        shot_id = cursor.lastrowid if cursor.rowcount else None
+        conn.commit()
+        self._close_connection(conn)
+
+        shot.id = shot_id
+        return shot_id
+
     def get_shot(self, shot_id: int) -> Optional[Shot]:
         """获取镜头"""
         conn = self._get_connection()
@@ -626,13 +856,50 @@ class Database:
         conn.commit()
         self._close_connection(conn)
 
-    def delete_shot(self, shot_id: int):
-        """删除镜头"""
+    def patch_generated_prompts(self, items: List[Tuple[int, str, str]]) -> Set[int]:
+        """
+        批量写入镜头的生成提示词（在 SQL 中合并 JSON，不读出镜头）
+
+        Args:
+            items: (shot_id, prompt_key, prompt) 列表
+
+        Returns:
+            实际存在并已更新的镜头 ID
+        """
+        if not items:
+            return set()
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        # 合并对象在 Python 中序列化，键中的引号、反斜杠不会拼进 JSON 路径
+        cursor.executemany("""
+            UPDATE shots
+            SET generated_prompts = json_patch(COALESCE(NULLIF(generated_prompts, ''), '{}'), ?)
+            WHERE id = ?
+        """, [(json.dumps({key: prompt}, ensure_ascii=False), shot_id) for shot_id, key, prompt in items])
+
+        shot_ids = sorted({shot_id for shot_id, _, _ in items})
+        placeholders = ", ".join("?" * len(shot_ids))
+        cursor.execute(f"SELECT id FROM shots WHERE id IN ({placeholders})", shot_ids)
+        found = {row["id"] for row in cursor.fetchall()}
+
+        conn.commit()
+        self._close_connection(conn)
+        return found
+
+    def update_shot_fields(self, shot_id: int, fields: dict) -> bool:
+        """局部更新镜头字段，镜头不存在时返回 False"""
+        return self._update_fields("shots", shot_id, fields)
+
+    def delete_shot(self, shot_id: int) -> bool:
+        """删除镜头，返回镜头是否存在"""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute("DELETE FROM shots WHERE id=?", (shot_id,))
+        found = cursor.rowcount > 0
         conn.commit()
         self._close_connection(conn)
+        return found
 
     def get_shots_by_episode(self, episode_id: int) -> List[Shot]:
         """获取剧集的所有镜头"""
@@ -667,6 +934,85 @@ class Database:
         self._close_connection(conn)
         return shots
 
+    def iter_shots_by_episode(self, episode_id: int) -> Iterator[dict]:
+        """
+        逐行读取剧集的镜头，直接生成与 Shot.to_dict() 相同的字典
+
+        不构造 Shot 对象，也不一次性取出全部行。
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(
+                "SELECT * FROM shots WHERE episode_id = ? ORDER BY scene_number, shot_number", (episode_id,)
+            )
+            for row in cursor:
+                yield {
+                    "id": row["id"],
+                    "episode_id": row["episode_id"],
+                    "scene_number": row["scene_number"],
+                    "shot_number": row["shot_number"],
+                    "shot_type": row["shot_type"] or "medium",
+                    "duration": row["duration"] or 5,
+                    "visual_description": row["visual_description"] or "",
+                    "dialogue": row["dialogue"] or "",
+                    "sound_music": row["sound_music"] or "",
+                    "camera_movement": row["camera_movement"] or "static",
+                    "notes": row["notes"] or "",
+                    "generated_prompts": json.loads(row["generated_prompts"]) if row["generated_prompts"] else {},
+                }
+        finally:
+            self._close_connection(conn)
+
+    def get_episode_brief(self, episode_id: int) -> Optional[dict]:
+        """获取剧集标题与目标时长（不加载镜头）"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT COALESCE(title, '') AS title,
+                   COALESCE(NULLIF(duration, 0), 60) AS duration
+            FROM episodes WHERE id = ?
+        """, (episode_id,))
+        row = cursor.fetchone()
+        self._close_connection(conn)
+        return dict(row) if row else None
+
+    def scene_aggregates(self, episode_id: int) -> List[dict]:
+        """按场景聚合剧集的镜头数与总时长"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # 空时长按 5 秒计，与 get_shots_by_episode 一致
+        cursor.execute("""
+            SELECT scene_number,
+                   COUNT(*) AS shot_count,
+                   SUM(COALESCE(NULLIF(duration, 0), 5)) AS duration
+            FROM shots
+            WHERE episode_id = ?
+            GROUP BY scene_number
+            ORDER BY scene_number
+        """, (episode_id,))
+        rows = cursor.fetchall()
+        self._close_connection(conn)
+        return [dict(row) for row in rows]
+
+    def scene_shot_brief(self, episode_id: int) -> List[dict]:
+        """列出剧集镜头的场景号、镜头号、景别与时长"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT scene_number, shot_number,
+                   COALESCE(NULLIF(shot_type, ''), 'medium') AS shot_type,
+                   COALESCE(NULLIF(duration, 0), 5) AS duration
+            FROM shots
+            WHERE episode_id = ?
+            ORDER BY scene_number, shot_number
+        """, (episode_id,))
+        rows = cursor.fetchall()
+        self._close_connection(conn)
+        return [dict(row) for row in rows]
+
     def delete_shots_by_episode(self, episode_id: int):
         """删除剧集的所有镜头"""
         conn = self._get_connection()
@@ -675,28 +1021,75 @@ class Database:
         conn.commit()
         self._close_connection(conn)
 
+    def delete_shots_by_episode_checked(self, episode_id: int) -> bool:
+        """删除剧集的所有镜头，剧集不存在时不做任何操作并返回 False"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM episodes WHERE id=?", (episode_id,))
+        found = cursor.fetchone() is not None
+        if found:
+            cursor.execute("DELETE FROM shots WHERE episode_id=?", (episode_id,))
+            conn.commit()
+        self._close_connection(conn)
+        return found
+
     def batch_create_shots(self, shots: List[Shot]) -> List[int]:
         """批量创建镜头"""
+        shot_ids = self._insert_shots([
+            (shot.episode_id, shot.scene_number, shot.shot_number, shot.shot_type,
+             shot.duration, shot.visual_description, shot.dialogue, shot.sound_music,
+             shot.camera_movement, shot.notes,
+             json.dumps(shot.generated_prompts, ensure_ascii=False))
+            for shot in shots
+        ])
+        for shot, shot_id in zip(shots, shot_ids):
+            shot.id = shot_id
+        return shot_ids
+
+    def batch_create_shots_raw(self, episode_id: int, rows: List[dict]) -> Optional[List[int]]:
+        """
+        批量创建镜头（直接使用字典行，不构造 Shot 对象；缺失字段取默认值）
+
+        剧集存在性检查并入插入语句，剧集不存在时返回 None
+        """
+        if not rows:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM episodes WHERE id=?", (episode_id,))
+            found = cursor.fetchone() is not None
+            self._close_connection(conn)
+            return [] if found else None
+
+        shot_ids = self._insert_shots([
+            (episode_id,
+             *(row.get(key, default) for key, default in _SHOT_DEFAULTS.items()),
+             json.dumps(row.get("generated_prompts", {}), ensure_ascii=False),
+             episode_id)
+            for row in rows
+        ], checked=True)
+        return shot_ids or None
+
+    def _insert_shots(self, params: List[tuple], checked: bool = False) -> List[int]:
+        """
+        单个事务内 executemany 插入镜头，返回新镜头 ID
+
+        checked=True 时每行参数末尾多一个 episode_id，仅在剧集存在时插入
+        """
+        if not params:
+            return []
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        shot_ids = []
-        for shot in shots:
-            prompts_json = json.dumps(shot.generated_prompts, ensure_ascii=False)
-            cursor.execute("""
-                INSERT INTO shots (episode_id, scene_number, shot_number, shot_type,
-                                   duration, visual_description, dialogue, sound_music,
-                                   camera_movement, notes, generated_prompts)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (shot.episode_id, shot.scene_number, shot.shot_number, shot.shot_type,
-                  shot.duration, shot.visual_description, shot.dialogue, shot.sound_music,
-                  shot.camera_movement, shot.notes, prompts_json))
-            shot.id = cursor.lastrowid
-            shot_ids.append(shot.id)
+        cursor.executemany(_SHOT_INSERT_CHECKED_SQL if checked else _SHOT_INSERT_SQL, params)
+        inserted = cursor.rowcount
+        # 同一写事务内 AUTOINCREMENT 分配的 ID 连续，可由最后一个 ID 反推
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
 
         conn.commit()
         self._close_connection(conn)
-        return shot_ids
+        return list(range(last_id - inserted + 1, last_id + 1))
 
     # ==================== EditHistory CRUD ====================
 